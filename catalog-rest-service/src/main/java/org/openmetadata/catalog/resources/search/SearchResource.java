@@ -25,6 +25,7 @@ import io.swagger.v3.oas.annotations.media.Content;
 import io.swagger.v3.oas.annotations.media.Schema;
 import io.swagger.v3.oas.annotations.responses.ApiResponse;
 import java.io.IOException;
+import java.util.List;
 import java.util.concurrent.TimeUnit;
 import javax.ws.rs.DefaultValue;
 import javax.ws.rs.GET;
@@ -136,7 +137,10 @@ public class SearchResource {
           @QueryParam("sort_order")
           String sortOrderParam,
       @Parameter(description = "Track Total Hits") @DefaultValue("false") @QueryParam("track_total_hits")
-          boolean trackTotalHits)
+          boolean trackTotalHits,
+      @Parameter(description = "Fields of the documents to return in the hits. By default, all of them")
+          @QueryParam("include_source_fields")
+          List<String> includeSourceFields)
       throws IOException {
 
     SearchRequest searchRequest = new SearchRequest(index);
@@ -181,6 +185,9 @@ public class SearchResource {
     if (!nullOrEmpty(sortFieldParam)) {
       searchSourceBuilder.sort(sortFieldParam, sortOrder);
     }
+    if (!nullOrEmpty(includeSourceFields)) {
+      searchSourceBuilder.fetchSource(includeSourceFields.toArray(String[]::new), null);
+    }
     LOG.debug(searchSourceBuilder.toString());
     /* for performance reasons ElasticSearch doesn't provide accurate hits
     if we enable trackTotalHits parameter it will try to match every result, count and return hits
@@ -11,7 +11,7 @@
 
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Generic, List
+from typing import Any, Callable, Generic, List, Optional
 
 from pydantic import BaseModel
 
@@ -55,6 +55,30 @@ class Sink(Closeable, Generic[Entity], metaclass=ABCMeta):
         # must call callback when done.
         pass
 
+    def flush(self) -> None:
+        """
+        Write any record buffered by the sink
+        """
+
+    def acknowledge(
+        self,
+        record: Entity,
+        callback: Optional[Callable[[Optional[BaseModel]], None]] = None,
+    ) -> Optional[BaseModel]:
+        """
+        Return the entity created in OpenMetadata from a record
+        already passed to `write_record`, if the sink keeps track of it.
+        Sinks buffering records need to write it first, unless a callback
+        is given: it is then called with the entity once the record is
+        written, or with None if the sink cannot acknowledge it.
+
+        Sources can use it to update their state without
+        reading the entity back from the API.
+        """
+        if callback is not None:
+            callback(None)
+        return None
+
     @abstractmethod
     def get_status(self) -> SinkStatus:
         pass
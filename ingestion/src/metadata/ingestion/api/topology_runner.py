@@ -12,7 +12,11 @@
 Mixin to be used by service sources to dynamically
 generate the next_record based on their topology.
 """
-from typing import Any, Generic, Iterable, List, TypeVar
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Generic, Iterable, List, Optional, Tuple, TypeVar
 
 from pydantic import BaseModel
 
@@ -21,6 +25,7 @@ from metadata.ingestion.models.topology import (
     NodeStage,
     ServiceTopology,
     TopologyContext,
+    TopologyContextProxy,
     TopologyNode,
     get_ctx_default,
     get_topology_node,
@@ -45,6 +50,91 @@ class TopologyRunnerMixin(Generic[C]):
     context: TopologyContext
     metadata: OpenMetadata
 
+    # Number of workers used to process the elements of nodes flagged with `threads`
+    max_workers: int = 1
+
+    @property
+    def topology_lock(self) -> threading.RLock:
+        """
+        Lock guarding the source state shared by the workers, e.g.,
+        the status or the lists accumulated in the context
+        """
+        if "_topology_lock" not in self.__dict__:
+            self.__dict__["_topology_lock"] = threading.RLock()
+        return self.__dict__["_topology_lock"]
+
+    def _run_node_stages(
+        self, node: TopologyNode, element: Any
+    ) -> Iterable[Tuple[NodeStage, Iterable[Any]]]:
+        """
+        Lazily run each stage processor for the given element.
+        Each stage only gets executed once the previous one has
+        been fully consumed by the sink.
+        """
+        for stage in node.stages:
+            logger.debug(f"Processing stage {stage}")
+            stage_fn = getattr(self, stage.processor)
+            yield stage, stage_fn(element) or []
+
+    def _run_node_stages_in_worker(
+        self, node: TopologyNode, element: Any, context: TopologyContext
+    ) -> List[Tuple[NodeStage, List[Any]]]:
+        """
+        Run all the stage processors of an element from a worker thread,
+        using its own copy of the topology context. The copy is shallow:
+        processors must hold `topology_lock` to update shared state.
+        """
+        self.context.set_local(context)
+        try:
+            return [
+                (stage, list(entity_requests))
+                for stage, entity_requests in self._run_node_stages(node, element)
+            ]
+        finally:
+            self.context.set_local(None)
+
+    def _produce_node_stages(
+        self, node: TopologyNode
+    ) -> Iterable[Tuple[Any, Iterable[Tuple[NodeStage, Iterable[Any]]]]]:
+        """
+        Iterate over the node producer and prepare the stages
+        to run for each element.
+
+        If the node is flagged with `threads` and we have more than one worker,
+        stage processors run in a bounded pool. The context is copied when each
+        element is produced and results are returned in the producer order.
+        """
+        node_producer = getattr(self, node.producer)
+
+        if not node.threads or self.max_workers <= 1:
+            for element in node_producer() or []:
+                yield element, self._run_node_stages(node, element)
+            return
+
+        if not isinstance(self.context, TopologyContextProxy):
+            self.context = TopologyContextProxy(self.context)
+        # Create the lock before any worker needs it
+        _ = self.topology_lock
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for element in node_producer() or []:
+                future = executor.submit(
+                    self._run_node_stages_in_worker,
+                    node,
+                    element,
+                    self.context.copy(),
+                )
+                pending.append((element, future))
+                # Do not let the producer run too far ahead of the sink
+                if len(pending) >= 2 * self.max_workers:
+                    element, future = pending.popleft()
+                    yield element, future.result()
+
+            while pending:
+                element, future = pending.popleft()
+                yield element, future.result()
+
     def process_nodes(self, nodes: List[TopologyNode]) -> Iterable[Entity]:
         """
         Given a list of nodes, either roots or children,
@@ -57,20 +147,16 @@ class TopologyRunnerMixin(Generic[C]):
         """
         for node in nodes:
             logger.debug(f"Processing node {node}")
-            node_producer = getattr(self, node.producer)
             child_nodes = (
                 [get_topology_node(child, self.topology) for child in node.children]
                 if node.children
                 else []
             )
 
-            for element in node_producer() or []:
+            for _, node_stages in self._produce_node_stages(node):
 
-                for stage in node.stages:
-                    logger.debug(f"Processing stage {stage}")
-
-                    stage_fn = getattr(self, stage.processor)
-                    for entity_request in stage_fn(element) or []:
+                for stage, entity_requests in node_stages:
+                    for entity_request in entity_requests:
 
                         try:
                             # yield and make sure the data is updated
@@ -110,7 +196,7 @@ class TopologyRunnerMixin(Generic[C]):
         :param key: element to update from the source context
         :param value: value to use for the update
         """
-        self.context.__dict__[key] = value
+        setattr(self.context, key, value)
 
     def append_context(self, key: str, value: Any) -> None:
         """
@@ -118,14 +204,14 @@ class TopologyRunnerMixin(Generic[C]):
         :param key: element to update from the source context
         :param value: value to use for the update
         """
-        self.context.__dict__[key].append(value)
+        getattr(self.context, key).append(value)
 
     def clear_context(self, stage: NodeStage) -> None:
         """
         Clear the available context
         :param key: element to update from the source context
         """
-        self.context.__dict__[stage.context] = get_ctx_default(stage)
+        setattr(self.context, stage.context, get_ctx_default(stage))
 
     def fqn_from_context(self, stage: NodeStage, entity_request: C) -> str:
         """
@@ -135,17 +221,33 @@ class TopologyRunnerMixin(Generic[C]):
         :return: Entity FQN derived from context
         """
         context_names = [
-            self.context.__dict__[dependency].name.__root__
+            getattr(self.context, dependency).name.__root__
             for dependency in stage.consumer or []  # root nodes do not have consumers
         ]
         return fqn._build(*context_names, entity_request.name.__root__)
 
+    def process_ack(
+        self, stage: NodeStage, entity_request: C, entity: Optional[Entity]
+    ) -> None:
+        """
+        Called with the entity written by the sink from the request
+        of a stage flagged with `defer_ack`, or None if it failed.
+        Sinks buffering requests call it when the buffer is written.
+        """
+
     def sink_request(self, stage: NodeStage, entity_request: C) -> Iterable[Entity]:
         """
         Validate that the entity was properly updated or retry if
         ack_sink is flagged.
 
         If we get the Entity back, update the context with it.
+        The workflow sends back a handle to the sink acknowledgement,
+        which returns the entity created by the sink. We only read the
+        entity from OM when the sink cannot acknowledge it.
+
+        Stages flagged with `defer_ack` do not wait for the sink, so that
+        it can buffer their requests. The context keeps the request and
+        the entity is passed to `process_ack` once written.
 
         :param stage: Node stage being processed
         :param entity_request: Request to pass
@@ -159,7 +261,11 @@ class TopologyRunnerMixin(Generic[C]):
             raise ValueError("Value unexpectedly None")
 
         if entity is not None:
-            if stage.ack_sink:
+            if stage.ack_sink and stage.defer_ack:
+                ack = yield entity_request
+                if ack:
+                    ack(callback=partial(self.process_ack, stage, entity_request))
+            elif stage.ack_sink:
                 entity = None
 
                 entity_fqn = self.fqn_from_context(
@@ -177,13 +283,17 @@ class TopologyRunnerMixin(Generic[C]):
                 if entity is None:
                     tries = 3
                     while not entity and tries > 0:
-                        yield entity_request
-                        # Improve validation logic
-                        entity = self.metadata.get_by_name(
-                            entity=stage.type_,
-                            fqn=entity_fqn,
-                            fields=["*"],  # Get all the available data from the Entity
-                        )
+                        # The workflow can send back a handle to the sink acknowledgement
+                        ack = yield entity_request
+                        entity = ack() if ack else None
+                        if entity is None:
+                            # Improve validation logic
+                            # Get all the available data from the Entity
+                            entity = self.metadata.get_by_name(
+                                entity=stage.type_,
+                                fqn=entity_fqn,
+                                fields=["*"],
+                            )
                         tries -= 1
             else:
                 yield entity
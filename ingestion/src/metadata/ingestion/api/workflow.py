@@ -9,9 +9,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import functools
 import importlib
+import inspect
 import time
-from typing import Type, TypeVar
+from typing import Optional, Type, TypeVar
 
 import click
 
@@ -33,6 +35,9 @@ from metadata.ingestion.api.processor import Processor
 from metadata.ingestion.api.sink import Sink
 from metadata.ingestion.api.source import Source
 from metadata.ingestion.api.stage import Stage
+from metadata.ingestion.lineage.parser_cache import sql_parser_cache
+from metadata.ingestion.ometa.entity_cache import EntityCache
+from metadata.ingestion.ometa.fqn_index import FQNIndex
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.utils.class_helper import (
     get_service_class_from_service_type,
@@ -89,6 +94,23 @@ class Workflow:
 
         self._retrieve_dbt_config_source_if_needed(metadata_config, service_type)
 
+        # Shared by the clients of this workflow only, until it stops
+        entity_cache = self.config.workflowConfig.entityCache
+        self.entity_cache: Optional[EntityCache] = (
+            EntityCache(max_size=entity_cache.maxSize, ttl=entity_cache.ttl)
+            if entity_cache and entity_cache.enabled
+            else None
+        )
+        OpenMetadata.entity_cache = self.entity_cache
+
+        fqn_index = self.config.workflowConfig.fqnIndex
+        self.fqn_index: Optional[FQNIndex] = (
+            FQNIndex(file_path=fqn_index.filePath, ttl=fqn_index.ttl)
+            if fqn_index and fqn_index.enabled
+            else None
+        )
+        OpenMetadata.fqn_index = self.fqn_index
+
         self.source: Source = source_class.create(
             self.config.source.dict(), metadata_config
         )
@@ -172,7 +194,16 @@ class Workflow:
         return cls(config)
 
     def execute(self):
-        for record in self.source.next_record():
+        records = iter(self.source.next_record())
+        # Generator sources can receive a handle to the sink acknowledgement
+        ack = None
+        while True:
+            try:
+                record = records.send(ack) if ack else next(records)
+            except StopIteration:
+                break
+            ack = None
+
             self.report["Source"] = self.source.get_status().as_obj()
             if hasattr(self, "processor"):
                 processed_record = self.processor.process(record)
@@ -184,10 +215,21 @@ class Workflow:
             if hasattr(self, "sink"):
                 self.sink.write_record(processed_record)
                 self.report["sink"] = self.sink.get_status().as_obj()
+                if inspect.isgenerator(records):
+                    ack = functools.partial(self.sink.acknowledge, processed_record)
+        if hasattr(self, "sink"):
+            self.sink.flush()
+            self.report["sink"] = self.sink.get_status().as_obj()
         if hasattr(self, "bulk_sink"):
             self.stage.close()
             self.bulk_sink.write_records()
             self.report["Bulk_Sink"] = self.bulk_sink.get_status().as_obj()
+        if self.entity_cache is not None:
+            self.report["Entity_Cache"] = self.entity_cache.status.as_obj()
+        if self.fqn_index is not None:
+            self.report["FQN_Index"] = self.fqn_index.status.as_obj()
+        if sql_parser_cache.status.hits or sql_parser_cache.status.misses:
+            self.report["Parser_Cache"] = sql_parser_cache.status.as_obj()
 
     def stop(self):
         if hasattr(self, "processor"):
@@ -197,6 +239,14 @@ class Workflow:
         if hasattr(self, "sink"):
             self.sink.close()
         self.source.close()
+        if self.entity_cache is not None:
+            self.entity_cache.clear()
+            if OpenMetadata.entity_cache is self.entity_cache:
+                OpenMetadata.entity_cache = None
+        if self.fqn_index is not None:
+            self.fqn_index.clear()
+            if OpenMetadata.fqn_index is self.fqn_index:
+                OpenMetadata.fqn_index = None
 
     def raise_from_status(self, raise_warnings=False):
         if self.source.get_status().failures:
@@ -236,6 +286,18 @@ class Workflow:
             click.secho("Bulk Sink Status:", bold=True)
             click.echo(self.bulk_sink.get_status().as_string())
             click.echo()
+        if self.entity_cache is not None:
+            click.secho("Entity Cache Status:", bold=True)
+            click.echo(self.entity_cache.status.as_string())
+            click.echo()
+        if self.fqn_index is not None:
+            click.secho("FQN Index Status:", bold=True)
+            click.echo(self.fqn_index.status.as_string())
+            click.echo()
+        if sql_parser_cache.status.hits or sql_parser_cache.status.misses:
+            click.secho("SQL Parser Cache Status:", bold=True)
+            click.echo(sql_parser_cache.status.as_string())
+            click.echo()
 
         if self.source.get_status().source_start_time:
             click.secho(
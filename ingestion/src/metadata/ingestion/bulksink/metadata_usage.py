@@ -9,12 +9,16 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import heapq
+import itertools
 import json
 import os
 import shutil
+import tempfile
 import traceback
+from contextlib import ExitStack
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, List, Optional
 
 from pydantic import ValidationError
 
@@ -48,6 +52,8 @@ LRU_CACHE_SIZE = 4096
 
 class MetadataUsageSinkConfig(ConfigModel):
     filename: str
+    # Number of staged files of a partition opened at once while merging them
+    max_open_files: int = 100
 
 
 class MetadataUsageBulkSink(BulkSink):
@@ -138,27 +144,79 @@ class MetadataUsageBulkSink(BulkSink):
                     "Table: {}".format(value_dict["table_entity"].name.__root__)
                 )
 
-    def iterate_files(self):
+    @staticmethod
+    def merge_table_usage(
+        table_usages: Iterable[TableUsageCount],
+    ) -> Iterable[TableUsageCount]:
         """
-        Iterate through files in the given directory
+        Merge the consecutive records of the same table
         """
-        check_dir = os.path.isdir(self.config.filename)
-        if check_dir:
-            for filename in os.listdir(self.config.filename):
-                full_file_name = os.path.join(self.config.filename, filename)
-                if not os.path.isfile(full_file_name):
-                    continue
-                with open(full_file_name) as file:
-                    yield file
+        for _, records in itertools.groupby(
+            table_usages, key=lambda table_usage: table_usage.table
+        ):
+            merged = next(records)
+            for table_usage in records:
+                merged.count += table_usage.count
+                merged.sqlQueries.extend(table_usage.sqlQueries or [])
+                merged.joins.extend(table_usage.joins or [])
+            yield merged
+
+    def compact_partition(self, paths: List[str], tmp_dir: str) -> List[str]:
+        """
+        Merge the sorted files in batches of `max_open_files` into new
+        sorted files of `tmp_dir`, until they can all be opened at once
+        """
+        max_open_files = max(self.config.max_open_files, 2)
+        merged_files = itertools.count()
+        while len(paths) > max_open_files:
+            merged_paths = []
+            for start in range(0, len(paths), max_open_files):
+                merged_path = os.path.join(tmp_dir, f"{next(merged_files):05d}.json")
+                with ExitStack() as stack, open(merged_path, "w") as merged:
+                    files = [
+                        stack.enter_context(open(path))
+                        for path in paths[start : start + max_open_files]
+                    ]
+                    merged.writelines(
+                        heapq.merge(*files, key=lambda line: json.loads(line)["table"])
+                    )
+                merged_paths.append(merged_path)
+            paths = merged_paths
+        return paths
+
+    def iterate_partitions(self) -> Iterable[Iterable[TableUsageCount]]:
+        """
+        Iterate through the service and date partitions of the given
+        directory. The sorted files of each partition are streamed
+        and merged into a single record per table.
+        """
+        if not os.path.isdir(self.config.filename):
+            return
+        for partition in sorted(os.listdir(self.config.filename)):
+            partition_dir = os.path.join(self.config.filename, partition)
+            if not os.path.isdir(partition_dir):
+                continue
+            with tempfile.TemporaryDirectory() as tmp_dir, ExitStack() as stack:
+                paths = self.compact_partition(
+                    [
+                        os.path.join(partition_dir, filename)
+                        for filename in sorted(os.listdir(partition_dir))
+                    ],
+                    tmp_dir,
+                )
+                files = [stack.enter_context(open(path)) for path in paths]
+                yield self.merge_table_usage(
+                    heapq.merge(
+                        *(map(TableUsageCount.parse_raw, file) for file in files),
+                        key=lambda table_usage: table_usage.table,
+                    )
+                )
 
     # Check here how to properly pick up ES and/or table query data
     def write_records(self) -> None:
-        for file_handler in self.iterate_files():
+        for table_usages in self.iterate_partitions():
             self.table_usage_map = {}
-            for usage_record in file_handler.readlines():
-                record = json.loads(usage_record)
-                table_usage = TableUsageCount(**json.loads(record))
-
+            for table_usage in table_usages:
                 self.service_name = table_usage.serviceName
                 table_entities = None
                 try:
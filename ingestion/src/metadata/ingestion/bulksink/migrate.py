@@ -184,6 +184,7 @@ class MigrateBulkSink(BulkSink):
                 table_entities = self.metadata.es_search_from_fqn(
                     entity_type=Table,
                     fqn_search_string=fqn_search_string,
+                    fields=["databaseSchema"],
                 )
                 if len(table_entities) < 1:
                     continue
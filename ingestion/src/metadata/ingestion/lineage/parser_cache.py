@@ -0,0 +1,111 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Cache of the SQL parser results keyed by the query fingerprint
+"""
+import hashlib
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from metadata.ingestion.api.status import Status
+from metadata.utils.lru_cache import LRUCache
+
+PARSER_CACHE_SIZE = 4096
+
+# Scanned together, so that quotes in comments, comment markers in
+# strings and digits in quoted identifiers are not taken for what they are not
+QUERY_TOKENS_RE = re.compile(
+    r"(?P<string>'(?:[^']|'')*')"
+    r"|(?P<comment>/\*.*?\*/|--[^\n]*)"
+    r'|(?P<identifier>"(?:[^"]|"")*"|`(?:[^`]|``)*`|\[[^\]]*\])'
+    r"|(?P<number>\b\d+(?:\.\d+)?\b)",
+    re.DOTALL,
+)
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_token(match: re.Match) -> str:
+    if match.lastgroup == "comment":
+        return " "
+    if match.lastgroup == "identifier":
+        return match.group()
+    return "?"
+
+
+def fingerprint_query(query: str) -> str:
+    """
+    Hash the shape of a query: comments are removed, string and number
+    literals are replaced by a placeholder and whitespaces are collapsed.
+
+    Identifiers, quoted or not, keep their case and digits, as the parsed
+    table and column names do.
+    """
+    normalized = QUERY_TOKENS_RE.sub(_normalize_token, query)
+    normalized = WHITESPACE_RE.sub(" ", normalized).strip()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ParserCacheStatus(Status):
+    hits: int = 0
+    misses: int = 0
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return round(self.hits * 100 / lookups, 2) if lookups else 0.0
+
+    def as_obj(self) -> dict:
+        return {**self.__dict__, "hit_rate": self.hit_rate()}
+
+
+class ParserCache:
+    """
+    LRU cache of the results computed from a query, shared by every
+    query with the same fingerprint. Results are stored by `kind`, so
+    that the usage and lineage parsing can share the same cache.
+
+    Cached results must not be modified by the callers.
+    """
+
+    def __init__(self, capacity: int = PARSER_CACHE_SIZE) -> None:
+        self.status = ParserCacheStatus()
+        self._cache = LRUCache(capacity)
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self, query: str, kind: str, compute_fn: Callable[[str], Any]
+    ) -> Any:
+        """
+        Return the cached result for the query shape, or compute it.
+        Exceptions raised by `compute_fn` are not cached.
+        :param query: SQL query
+        :param kind: name of the result, e.g., usage or lineage
+        :param compute_fn: parse the query into the result
+        """
+        key = (kind, fingerprint_query(query))
+        with self._lock:
+            if key in self._cache:
+                self.status.hits += 1
+                return self._cache.get(key)
+            self.status.misses += 1
+
+        result = compute_fn(query)
+        with self._lock:
+            self._cache.put(key, result)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+sql_parser_cache = ParserCache()
@@ -23,6 +23,7 @@ from metadata.generated.schema.type.entityLineage import (
     LineageDetails,
 )
 from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.ingestion.lineage.parser_cache import sql_parser_cache
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.utils import fqn
 from metadata.utils.logger import utils_logger
@@ -280,6 +281,29 @@ def populate_column_lineage_map(raw_column_lineage):
     return lineage_map
 
 
+def get_lineage_tables(query: str) -> dict:
+    """
+    Parse the source, target and intermediate tables
+    of a query, together with its column lineage map
+    """
+    # Prevent sqllineage from modifying the logger config
+    # Disable the DictConfigurator.configure method while importing LineageRunner
+    configure = DictConfigurator.configure
+    DictConfigurator.configure = lambda _: None
+    from sqllineage.runner import LineageRunner
+
+    # Reverting changes after import is done
+    DictConfigurator.configure = configure
+
+    result = LineageRunner(query)
+    return {
+        "source_tables": [str(table) for table in result.source_tables],
+        "target_tables": [str(table) for table in result.target_tables],
+        "intermediate_tables": [str(table) for table in result.intermediate_tables],
+        "column_lineage": populate_column_lineage_map(result.get_column_lineage()),
+    }
+
+
 def get_lineage_by_query(
     metadata: OpenMetadata,
     service_name: str,
@@ -290,25 +314,17 @@ def get_lineage_by_query(
     """
     This method parses the query to get source, target and intermediate table names to create lineage,
     and returns True if target table is found to create lineage otherwise returns False.
+    Queries with the same shape share the parsed lineage.
     """
-    # Prevent sqllineage from modifying the logger config
-    # Disable the DictConfigurator.configure method while importing LineageRunner
-    configure = DictConfigurator.configure
-    DictConfigurator.configure = lambda _: None
-    from sqllineage.runner import LineageRunner
-
-    # Reverting changes after import is done
-    DictConfigurator.configure = configure
     column_lineage = {}
 
     try:
-        result = LineageRunner(query)
+        result = sql_parser_cache.get_or_compute(query, "lineage", get_lineage_tables)
 
-        raw_column_lineage = result.get_column_lineage()
-        column_lineage.update(populate_column_lineage_map(raw_column_lineage))
+        column_lineage.update(result["column_lineage"])
 
-        for intermediate_table in result.intermediate_tables:
-            for source_table in result.source_tables:
+        for intermediate_table in result["intermediate_tables"]:
+            for source_table in result["source_tables"]:
                 yield from _create_lineage_by_table_name(
                     metadata,
                     from_table=str(source_table),
@@ -319,7 +335,7 @@ def get_lineage_by_query(
                     query=query,
                     column_lineage_map=column_lineage,
                 )
-            for target_table in result.target_tables:
+            for target_table in result["target_tables"]:
                 yield from _create_lineage_by_table_name(
                     metadata,
                     from_table=str(intermediate_table),
@@ -330,9 +346,9 @@ def get_lineage_by_query(
                     query=query,
                     column_lineage_map=column_lineage,
                 )
-        if not result.intermediate_tables:
-            for target_table in result.target_tables:
-                for source_table in result.source_tables:
+        if not result["intermediate_tables"]:
+            for target_table in result["target_tables"]:
+                for source_table in result["source_tables"]:
                     yield from _create_lineage_by_table_name(
                         metadata,
                         from_table=str(source_table),
@@ -357,21 +373,13 @@ def get_lineage_via_table_entity(
     service_name: str,
     query: str,
 ) -> Optional[Iterator[AddLineageRequest]]:
-    # Prevent sqllineage from modifying the logger config
-    # Disable the DictConfigurator.configure method while importing LineageRunner
-    configure = DictConfigurator.configure
-    DictConfigurator.configure = lambda _: None
-    from sqllineage.runner import LineageRunner
-
-    # Reverting changes after import is done
-    DictConfigurator.configure = configure
     column_lineage = {}
 
     try:
-        parser = LineageRunner(query)
+        result = sql_parser_cache.get_or_compute(query, "lineage", get_lineage_tables)
         to_table_name = table_entity.name.__root__
 
-        for from_table_name in parser.source_tables:
+        for from_table_name in result["source_tables"]:
             yield from _create_lineage_by_table_name(
                 metadata,
                 from_table=str(from_table_name),
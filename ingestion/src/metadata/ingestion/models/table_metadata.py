@@ -36,6 +36,12 @@ class DeleteTable(BaseModel):
     table: Table
 
 
+class DeleteTables(BaseModel):
+    """Entity References of the tables of a schema to be deleted together"""
+
+    tables: List[EntityReference]
+
+
 class ESEntityReference(BaseModel):
     """JsonSchema genereated pydantic contains many unnecessary fields its not one-to-one representation of JsonSchema
     Example all the "__root__" fields. This will not index into ES elegnatly hence we are creating special class
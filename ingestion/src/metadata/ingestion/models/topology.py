@@ -11,7 +11,7 @@
 """
 Defines the topology for ingesting sources
 """
-
+import threading
 from typing import Any, Generic, List, Optional, Type, TypeVar
 
 from pydantic import BaseModel, Extra, create_model
@@ -34,6 +34,7 @@ class NodeStage(BaseModel, Generic[T]):
     processor: str  # has the producer results as an argument. Here is where filters happen
     context: Optional[str] = None  # context key storing stage state, if needed
     ack_sink: bool = True  # Validate that the request is present in OM and update the context with the results
+    defer_ack: bool = False  # Do not wait for the sink to write the request. The source gets the entity in `process_ack`
     nullable: bool = False  # The yielded value can be null
     cache_all: bool = (
         False  # If we need to cache all values being yielded in the context
@@ -69,6 +70,11 @@ class TopologyNode(BaseModel):
         List[str]
     ] = None  # Method to be run after the node has been fully processed
 
+    # If True, the stages of each produced element can be run concurrently when the source
+    # is configured with more than one worker. Stages can then only rely on the context
+    # available when the element was produced, not on the results of their sibling stages.
+    threads: bool = False
+
 
 class ServiceTopology(BaseModel):
     """
@@ -92,6 +98,41 @@ class TopologyContext(BaseModel):
         return f"TopologyContext({ctx})"
 
 
+class TopologyContextProxy:
+    """
+    Wraps the source TopologyContext when processing
+    nodes concurrently.
+
+    Worker threads register their own copy of the context,
+    while any other thread keeps reading and updating the
+    shared one.
+    """
+
+    def __init__(self, context: TopologyContext):
+        object.__setattr__(self, "_context", context)
+        object.__setattr__(self, "_local", threading.local())
+
+    def _current(self) -> TopologyContext:
+        local_context = getattr(self._local, "context", None)
+        return local_context if local_context is not None else self._context
+
+    def set_local(self, context: Optional[TopologyContext]) -> None:
+        """
+        Register the context to use in the running thread.
+        Passing None falls back to the shared context.
+        """
+        self._local.context = context
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._current(), item)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        setattr(self._current(), key, value)
+
+    def __repr__(self):
+        return repr(self._current())
+
+
 def get_topology_nodes(topology: ServiceTopology) -> List[TopologyNode]:
     """
     Fetch all nodes from a ServiceTopology
@@ -12,10 +12,16 @@
 Python API REST wrapper and helpers
 """
 import datetime
+import gzip
+import random
+import threading
 import time
-from typing import Callable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 
 from metadata.config.common import ConfigModel
@@ -30,6 +36,30 @@ class RetryException(Exception):
     API Client retry exception
     """
 
+    def __init__(self, retry_after: Optional[float] = None):
+        super().__init__()
+        self.retry_after = retry_after
+
+
+def get_retry_after(resp: requests.Response) -> Optional[float]:
+    """
+    Read the seconds to wait from the Retry-After header,
+    which can either be a number of seconds or an HTTP date.
+    """
+    retry_after = resp.headers.get("Retry-After")
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0)
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(retry_after)
+        now = datetime.datetime.now(retry_date.tzinfo)
+        return max((retry_date - now).total_seconds(), 0)
+    except (TypeError, ValueError):
+        return None
+
 
 class APIError(Exception):
     """
@@ -89,6 +119,13 @@ class ClientConfig(ConfigModel):
     """
     :param raw_data: should we return api response raw or wrap it with
                          Entity objects.
+    :param retry_wait: base seconds of the exponential backoff between retries
+    :param retry_max_wait: upper bound of a single backoff
+    :param pool_maxsize: connections kept alive per host. It should cover
+                         the number of threads sharing the client.
+    :param max_workers: in-flight requests of get_many, put_many and delete_many
+    :param compress_min_size: gzip request bodies of at least this many bytes.
+                              Disabled when None.
     """
 
     base_url: str
@@ -103,6 +140,11 @@ class ClientConfig(ConfigModel):
     raw_data: Optional[bool] = False
     allow_redirects: Optional[bool] = False
     auth_token_mode: Optional[str] = "Bearer"
+    retry_max_wait: Optional[int] = 300
+    pool_connections: Optional[int] = 10
+    pool_maxsize: Optional[int] = 100
+    max_workers: Optional[int] = 20
+    compress_min_size: Optional[int] = None
 
 
 # pylint: disable=too-many-instance-attributes
@@ -116,13 +158,79 @@ class REST:
         self.config = config
         self._base_url: URL = URL(self.config.base_url)
         self._api_version = get_api_version(self.config.api_version)
-        self._session = requests.Session()
+        self._session = self._build_session()
         self._use_raw_data = self.config.raw_data
         self._retry = self.config.retry
         self._retry_wait = self.config.retry_wait
         self._retry_codes = self.config.retry_codes
         self._auth_token = self.config.auth_token
         self._auth_token_mode = self.config.auth_token_mode
+        self._auth_lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        """
+        Prepare a session whose connection pool can be shared by
+        as many threads as we might use to send requests.
+        requests already keeps the connections alive and asks
+        for gzip encoded responses.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _token_expired(self) -> bool:
+        return bool(
+            self.config.expires_in
+            and datetime.datetime.utcnow().timestamp() >= self.config.expires_in
+            or not self.config.access_token
+        )
+
+    def _refresh_token(self) -> None:
+        """
+        Get a new access token if we don't have one or it expired.
+        Threads sharing the client wait for a single refresh.
+        """
+        with self._auth_lock:
+            if not self._token_expired():
+                return
+            self.config.access_token, expiry = self._auth_token()
+            if not self.config.access_token == "no_token":
+                if isinstance(expiry, datetime.datetime):
+                    self.config.expires_in = expiry.timestamp() - 120
+                else:
+                    self.config.expires_in = (
+                        datetime.datetime.utcnow().timestamp() + expiry - 120
+                    )
+
+    def _get_retry_wait(self, attempt: int, retry_after: Optional[float]) -> float:
+        """
+        Honor the Retry-After sent by the server. Otherwise, back off
+        exponentially with jitter, so that the threads retrying at
+        the same time do not hit the server again in sync.
+        """
+        if retry_after is not None:
+            return min(retry_after, self.config.retry_max_wait)
+        backoff = min(self._retry_wait * 2**attempt, self.config.retry_max_wait)
+        return backoff / 2 + random.uniform(0, backoff / 2)
+
+    def _compress(self, data: Any, headers: dict) -> Any:
+        """
+        gzip the request body if it is big enough
+        """
+        min_size = self.config.compress_min_size
+        if min_size is None or not isinstance(data, (str, bytes)):
+            return data
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if len(data) < min_size:
+            return data
+        headers["Content-Encoding"] = "gzip"
+        return gzip.compress(data)
 
     # pylint: disable=too-many-arguments
     def _request(
@@ -139,19 +247,8 @@ class REST:
         base_url = base_url or self._base_url
         version = api_version if api_version else self._api_version
         url: URL = URL(base_url + "/" + version + path)
-        if (
-            self.config.expires_in
-            and datetime.datetime.utcnow().timestamp() >= self.config.expires_in
-            or not self.config.access_token
-        ):
-            self.config.access_token, expiry = self._auth_token()
-            if not self.config.access_token == "no_token":
-                if isinstance(expiry, datetime.datetime):
-                    self.config.expires_in = expiry.timestamp() - 120
-                else:
-                    self.config.expires_in = (
-                        datetime.datetime.utcnow().timestamp() + expiry - 120
-                    )
+        if self._token_expired():
+            self._refresh_token()
         headers[
             self.config.auth_header
         ] = f"{self._auth_token_mode} {self.config.access_token}"
@@ -167,7 +264,7 @@ class REST:
         if method.upper() == "GET":
             opts["params"] = data
         else:
-            opts["data"] = data
+            opts["data"] = self._compress(data, headers)
 
         total_retries = self._retry if self._retry > 0 else 0
         retry = total_retries
@@ -176,10 +273,12 @@ class REST:
                 logger.debug("URL %s, method %s", url, method)
                 logger.debug("Data %s", opts)
                 return self._one_request(method, url, opts, retry)
-            except RetryException:
-                retry_wait = self._retry_wait * (total_retries - retry + 1)
+            except RetryException as exc:
+                retry_wait = self._get_retry_wait(
+                    attempt=total_retries - retry, retry_after=exc.retry_after
+                )
                 logger.warning(
-                    "sleep %s seconds and retrying %s " "%s more time(s)...",
+                    "sleep %.2f seconds and retrying %s " "%s more time(s)...",
                     retry_wait,
                     url,
                     retry,
@@ -201,7 +300,7 @@ class REST:
         except HTTPError as http_error:
             # retry if we hit Rate Limit
             if resp.status_code in retry_codes and retry > 0:
-                raise RetryException() from http_error
+                raise RetryException(get_retry_after(resp)) from http_error
             if "code" in resp.text:
                 error = resp.json()
                 if "code" in error:
@@ -284,6 +383,112 @@ class REST:
         """
         return self._request("DELETE", path, data)
 
+    def _request_many(
+        self,
+        method: str,
+        requests_data: List[Tuple[str, Any]],
+        return_exceptions: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Run the (path, data) requests concurrently, sharing the
+        session pool. Results keep the order of the requests.
+
+        :param return_exceptions: return the exception raised by a request
+                                  at its position instead of raising it
+        :param max_workers: in-flight requests, defaults to the client config
+        """
+        max_workers = max_workers or self.config.max_workers
+
+        def _one(path_and_data: Tuple[str, Any]) -> Any:
+            path, data = path_and_data
+            try:
+                return self._request(method, path, data)
+            except Exception as exc:  # pylint: disable=broad-except
+                if return_exceptions:
+                    return exc
+                raise
+
+        if len(requests_data) <= 1 or max_workers <= 1:
+            return [_one(path_and_data) for path_and_data in requests_data]
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(requests_data))
+        ) as executor:
+            return list(executor.map(_one, requests_data))
+
+    def get_many(
+        self,
+        paths: List[str],
+        data=None,
+        return_exceptions: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Concurrent GET methods
+
+        Parameters:
+            paths (List[str]):
+            data (): params sent with every path
+            return_exceptions (bool):
+            max_workers (int):
+
+        Returns:
+            List of responses in the order of the paths
+        """
+        return self._request_many(
+            "GET", [(path, data) for path in paths], return_exceptions, max_workers
+        )
+
+    def put_many(
+        self,
+        path: str,
+        data: List[Any],
+        return_exceptions: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Concurrent PUT methods
+
+        Parameters:
+            path (str):
+            data (List): one payload per request
+            return_exceptions (bool):
+            max_workers (int):
+
+        Returns:
+            List of responses in the order of the data
+        """
+        return self._request_many(
+            "PUT",
+            [(path, payload) for payload in data],
+            return_exceptions,
+            max_workers,
+        )
+
+    def delete_many(
+        self,
+        paths: List[str],
+        data=None,
+        return_exceptions: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Concurrent DELETE methods
+
+        Parameters:
+            paths (List[str]):
+            data (): params sent with every path
+            return_exceptions (bool):
+            max_workers (int):
+
+        Returns:
+            List of responses in the order of the paths
+        """
+        return self._request_many(
+            "DELETE", [(path, data) for path in paths], return_exceptions, max_workers
+        )
+
     def __enter__(self):
         return self
 
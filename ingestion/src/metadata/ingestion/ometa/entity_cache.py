@@ -0,0 +1,154 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Read-through cache of the entities fetched by the
+OpenMetadata client with get_by_name and get_by_id
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel
+
+from metadata.ingestion.api.status import Status
+from metadata.ingestion.ometa.utils import model_str
+
+# (Entity Type, "id" or "name", ID or FQN, fields)
+CacheKey = Tuple[Type[BaseModel], str, str, Tuple[str, ...]]
+# (Entity Type, ID or FQN) shared by all the keys of an entity
+EntityRef = Tuple[Type[BaseModel], str]
+
+
+@dataclass
+class EntityCacheStatus(Status):
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return round(self.hits * 100 / lookups, 2) if lookups else 0.0
+
+    def as_obj(self) -> dict:
+        return {**self.__dict__, "hit_rate": self.hit_rate()}
+
+
+class EntityCache:
+    """
+    Bounded LRU cache of entities whose values expire after `ttl` seconds.
+
+    Every entity is indexed by its ID and FQN, so that writing or deleting
+    it drops all the cached reads, no matter how they were requested.
+
+    Entities are deep copied when stored and returned, so that callers
+    updating their instance do not change the cached one.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: int = 300) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.status = EntityCacheStatus()
+        self._cache: "OrderedDict[CacheKey, Tuple[float, BaseModel]]" = OrderedDict()
+        self._refs: Dict[EntityRef, Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(
+        entity: Type[BaseModel],
+        by: str,  # pylint: disable=invalid-name
+        value: Hashable,
+        fields: Optional[List[str]] = None,
+    ) -> CacheKey:
+        """
+        Build the key of a get_by_name or get_by_id call
+        """
+        return entity, by, model_str(value), tuple(fields or ())
+
+    @staticmethod
+    def _entity_refs(key: CacheKey, instance: BaseModel) -> Set[EntityRef]:
+        entity = key[0]
+        refs = {(entity, key[2])}
+        for attr in ("id", "fullyQualifiedName"):
+            value = getattr(instance, attr, None)
+            if value is not None:
+                refs.add((entity, model_str(value)))
+        return refs
+
+    def get(self, key: CacheKey) -> Optional[BaseModel]:
+        """
+        Return the cached entity, or None if it is missing or expired
+        """
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                self.status.misses += 1
+                return None
+            expires_at, instance = cached
+            if expires_at < time.monotonic():
+                self._remove(key, instance)
+                self.status.expirations += 1
+                self.status.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.status.hits += 1
+        return instance.copy(deep=True)
+
+    def put(self, key: CacheKey, instance: BaseModel) -> None:
+        """
+        Store the entity, evicting the least recently used one if full
+        """
+        instance = instance.copy(deep=True)
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.ttl, instance)
+            self._cache.move_to_end(key)
+            for ref in self._entity_refs(key, instance):
+                self._refs.setdefault(ref, set()).add(key)
+            while len(self._cache) > self.max_size:
+                old_key, (_, old_instance) = self._cache.popitem(last=False)
+                self._remove(old_key, old_instance, popped=True)
+                self.status.evictions += 1
+
+    def invalidate(self, entity: Type[BaseModel], *values: Hashable) -> None:
+        """
+        Drop every cached read of the entity identified by
+        any of the given IDs or FQNs
+        """
+        with self._lock:
+            for value in values:
+                if value is None:
+                    continue
+                for key in self._refs.pop((entity, model_str(value)), set()):
+                    cached = self._cache.get(key)
+                    if cached is not None:
+                        self._remove(key, cached[1])
+                        self.status.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._refs.clear()
+
+    def _remove(self, key: CacheKey, instance: BaseModel, popped: bool = False):
+        if not popped:
+            del self._cache[key]
+        for ref in self._entity_refs(key, instance):
+            keys = self._refs.get(ref)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._refs[ref]
+
+    def __len__(self) -> int:
+        return len(self._cache)
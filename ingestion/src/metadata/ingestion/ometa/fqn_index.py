@@ -0,0 +1,190 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Local index of the tables of the database services, used
+to resolve partial table names without searching ES
+"""
+import json
+import os
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from metadata.generated.schema.entity.data.table import Table
+from metadata.ingestion.api.status import Status
+from metadata.utils.logger import ometa_logger
+
+logger = ometa_logger()
+
+# Quotes around the identifiers of the SQL dialects
+IDENTIFIER_QUOTES = ('"', "`", "[")
+
+
+@dataclass
+class FQNIndexStatus(Status):
+    services: int = 0
+    tables: int = 0
+    hits: int = 0
+    misses: int = 0
+
+    def as_obj(self) -> dict:
+        return self.__dict__
+
+
+def normalize(name: Optional[str]) -> Optional[str]:
+    """
+    Unquote and lowercase a name, so that `"Orders"`,
+    `[orders]` and `ORDERS` are all looked up as `orders`
+    """
+    if not name:
+        return None
+    if len(name) > 1 and name.startswith(IDENTIFIER_QUOTES):
+        closing = "]" if name[0] == "[" else name[0]
+        if name.endswith(closing):
+            name = name[1:-1]
+    return name.lower()
+
+
+class ServiceTables:
+    """
+    Tables of a service, keyed by their normalized name.
+    Each name keeps the database and schema of its tables
+    to filter them when those are informed.
+    """
+
+    def __init__(self, table_fqns: List[str]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from metadata.utils.fqn import split
+
+        self.table_fqns = table_fqns
+        self._tables: Dict[str, List[Tuple[str, str, str]]] = {}
+        for table_fqn in table_fqns:
+            try:
+                _, database, schema, table = split(table_fqn)
+            except Exception:  # pylint: disable=broad-except
+                logger.debug(f"Skipping the table {table_fqn} from the index")
+                continue
+            self._tables.setdefault(normalize(table), []).append(
+                (normalize(database), normalize(schema), table_fqn)
+            )
+
+    def search(
+        self,
+        database_name: Optional[str],
+        schema_name: Optional[str],
+        table_name: str,
+    ) -> List[str]:
+        database, schema = normalize(database_name), normalize(schema_name)
+        return [
+            table_fqn
+            for table_database, table_schema, table_fqn in self._tables.get(
+                normalize(table_name), []
+            )
+            if (database is None or database == table_database)
+            and (schema is None or schema == table_schema)
+        ]
+
+
+class FQNIndex:
+    """
+    Index of the tables of each database service, built the first
+    time one of its tables is resolved from a paged listing of their
+    FQNs. Optionally, the listed FQNs are kept in a local JSON file
+    and reused while they are not older than `ttl` seconds.
+
+    Tables created after the index was built are not found in it,
+    and callers should fall back to ES on misses.
+    """
+
+    def __init__(self, file_path: Optional[str] = None, ttl: int = 86400) -> None:
+        self.file_path = file_path
+        self.ttl = ttl
+        self.status = FQNIndexStatus()
+        self._services: Dict[str, ServiceTables] = {}
+        self._lock = threading.Lock()
+
+    def _read_file(self) -> Dict[str, dict]:
+        if not self.file_path or not os.path.exists(self.file_path):
+            return {}
+        try:
+            with open(self.file_path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError) as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Ignoring the FQN index file {self.file_path}: {exc}")
+            return {}
+
+    def _write_file(self, service_name: str, table_fqns: List[str]) -> None:
+        state = self._read_file()
+        state[service_name] = {"createdAt": time.time(), "tables": table_fqns}
+        try:
+            with open(self.file_path, "w", encoding="utf-8") as file:
+                json.dump(state, file)
+        except OSError as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Cannot write the FQN index file {self.file_path}: {exc}")
+
+    def _load(self, metadata, service_name: str) -> ServiceTables:
+        stored = self._read_file().get(service_name)
+        if stored and stored.get("createdAt", 0) + self.ttl > time.time():
+            logger.debug(f"Loading the tables of {service_name} from {self.file_path}")
+            return ServiceTables(stored["tables"])
+
+        logger.info(f"Indexing the tables of {service_name}")
+        table_fqns = [
+            table_fqn
+            for _, table_fqn in metadata.list_all_entity_fqns(
+                entity=Table, params={"database": service_name}
+            )
+        ]
+        if self.file_path:
+            self._write_file(service_name, table_fqns)
+        return ServiceTables(table_fqns)
+
+    def get_service_tables(self, metadata, service_name: str) -> ServiceTables:
+        """
+        Tables of the service, listing them the first time
+        """
+        with self._lock:
+            tables = self._services.get(service_name)
+            if tables is None:
+                tables = self._load(metadata, service_name)
+                self._services[service_name] = tables
+                self.status.services += 1
+                self.status.tables += len(tables.table_fqns)
+            return tables
+
+    def search(
+        self,
+        metadata,
+        service_name: str,
+        database_name: Optional[str],
+        schema_name: Optional[str],
+        table_name: str,
+    ) -> List[str]:
+        """
+        FQNs of the tables of the service matching the name, and
+        the database and schema names when they are informed
+        """
+        table_fqns = self.get_service_tables(metadata, service_name).search(
+            database_name, schema_name, table_name
+        )
+        if table_fqns:
+            self.status.hits += 1
+        else:
+            self.status.misses += 1
+        return table_fqns
+
+    def clear(self) -> None:
+        with self._lock:
+            self._services.clear()
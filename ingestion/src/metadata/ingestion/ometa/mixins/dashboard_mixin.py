@@ -45,3 +45,4 @@ class OMetaDashboardMixin:
             data=dashboard_usage_request.json(),
         )
         logger.debug("published dashboard usage %s", resp)
+        self.invalidate_cache(Dashboard, dashboard.id)
@@ -13,9 +13,10 @@ Mixin class containing Lineage specific methods
 
 To be used by OpenMetadata class
 """
-from typing import Generic, List, Optional, Type, TypeVar
+import traceback
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from metadata.ingestion.ometa.client import REST
 from metadata.ingestion.ometa.utils import ometa_logger
@@ -37,25 +38,93 @@ class ESMixin(Generic[T]):
 
     fqdn_search = "/search/query?q=fullyQualifiedName:{fqn}&from={from_}&size={size}&index={index}"
 
+    @staticmethod
+    def _get_source_fields(entity_type: Type[T], fields: List[str]) -> List[str]:
+        """
+        Document fields to fetch: the requested ones, and
+        the ones required to build the entity
+        """
+        required = [
+            name for name, field in entity_type.__fields__.items() if field.required
+        ]
+        return list(dict.fromkeys(required + ["fullyQualifiedName"] + fields))
+
+    @staticmethod
+    def _entity_from_source(
+        entity_type: Type[T], source: Dict[str, Any]
+    ) -> Optional[T]:
+        """
+        Build the entity from the indexed document. Documents hold extra
+        keys, e.g., suggestions, and some of their values do not match
+        the entity, e.g., followers as names. Those are left out.
+        """
+        data = {
+            key: val for key, val in source.items() if key in entity_type.__fields__
+        }
+        try:
+            return entity_type.parse_obj(data)
+        except ValidationError as err:
+            invalid = {error["loc"][0] for error in err.errors()}
+            for key in invalid:
+                field = entity_type.__fields__.get(key)
+                if field is None or field.required:
+                    return None
+            try:
+                return entity_type.parse_obj(
+                    {key: val for key, val in data.items() if key not in invalid}
+                )
+            except ValidationError:
+                return None
+
+    def _get_entity_from_hit(
+        self, entity_type: Type[T], hit: Dict[str, Any], fields: Optional[List[str]]
+    ) -> Optional[T]:
+        """
+        Entity of the ES hit, only requested from the API
+        when the document misses some of the fields
+        """
+        source = hit["_source"]
+        entity = self._entity_from_source(entity_type, source)
+        if entity is not None and all(
+            getattr(entity, field, None) is not None for field in fields or []
+        ):
+            return entity
+
+        logger.debug(
+            f"Fetching {source['fullyQualifiedName']} as its document misses fields"
+        )
+        return self.get_by_name(
+            entity=entity_type, fqn=source["fullyQualifiedName"], fields=fields
+        )
+
     def _search_es_entity(
-        self, entity_type: Type[T], query_string: str
+        self,
+        entity_type: Type[T],
+        query_string: str,
+        fields: Optional[List[str]] = None,
     ) -> Optional[List[T]]:
         """
         Run the ES query and return a list of entities that match
         :param entity_type: Entity to look for
         :param query_string: Query to run
+        :param fields: Entity fields needed by the caller
         :return: List of Entities or None
         """
 
         response = self.client.get(query_string)
 
         if response:
-            return [
-                self.get_by_name(
-                    entity=entity_type, fqn=hit["_source"]["fullyQualifiedName"]
-                )
-                for hit in response["hits"]["hits"]
-            ] or None
+            entities = []
+            for hit in response["hits"]["hits"]:
+                try:
+                    entity = self._get_entity_from_hit(entity_type, hit, fields)
+                except Exception as err:  # pylint: disable=broad-except
+                    logger.debug(traceback.format_exc())
+                    logger.warning(f"Cannot read the ES hit {hit.get('_id')} - {err}")
+                    continue
+                if entity is not None:
+                    entities.append(entity)
+            return entities or None
 
         return None
 
@@ -65,14 +134,20 @@ class ESMixin(Generic[T]):
         fqn_search_string: str,
         from_count: int = 0,
         size: int = 10,
+        fields: Optional[List[str]] = None,
     ) -> Optional[List[T]]:
         """
         Given a service_name and some filters, search for entities using ES
 
+        Entities are built from the indexed documents. When fields are
+        informed, the documents are projected to them, and the entities
+        whose documents miss any of them are fetched from the API.
+
         :param entity_type: Entity to look for
         :param fqn_search_string: string used to search by FQN. E.g., service.*.schema.table
         :param from_count: Records to expect
         :param size: Number of records
+        :param fields: Entity fields needed by the caller, e.g., ["columns"]
         :return: List of entities
         """
         query_string = self.fqdn_search.format(
@@ -81,10 +156,15 @@ class ESMixin(Generic[T]):
             size=size,
             index=ES_INDEX_MAP[entity_type.__name__],  # Fail if not exists
         )
+        if fields is not None:
+            query_string += "".join(
+                f"&include_source_fields={field}"
+                for field in self._get_source_fields(entity_type, fields)
+            )
 
         try:
             entity_list = self._search_es_entity(
-                entity_type=entity_type, query_string=query_string
+                entity_type=entity_type, query_string=query_string, fields=fields
             )
             if entity_list:
                 return entity_list
@@ -41,6 +41,10 @@ class GlossaryMixin:
         resp = self.client.put(
             path=self.get_suffix(Glossary), data=glossaries_body.json()
         )
+        if resp:
+            self.invalidate_cache(
+                Glossary, resp.get("id"), resp.get("fullyQualifiedName")
+            )
         logger.info(f"Created a Glossary: {resp}")
 
     def create_glossary_term(self, glossary_term_body):
@@ -51,4 +55,8 @@ class GlossaryMixin:
         resp = self.client.put(
             path=self.get_suffix(GlossaryTerm), data=glossary_term_body.json()
         )
+        if resp:
+            self.invalidate_cache(
+                GlossaryTerm, resp.get("id"), resp.get("fullyQualifiedName")
+            )
         logger.info(f"Created a Glossary Term: {resp}")
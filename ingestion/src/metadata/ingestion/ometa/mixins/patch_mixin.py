@@ -121,6 +121,7 @@ class OMetaPatchMixin(Generic[T]):
                     ]
                 ),
             )
+            self.invalidate_cache(entity, entity_id)
             return entity(**res)
 
         except Exception as exc:
@@ -186,6 +187,7 @@ class OMetaPatchMixin(Generic[T]):
                     ]
                 ),
             )
+            self.invalidate_cache(Table, entity_id)
             return Table(**res)
 
         except Exception as exc:
@@ -45,6 +45,7 @@ class OMetaPipelineMixin:
             f"{self.get_suffix(Pipeline)}/{fqn}/status",
             data=status.json(),
         )
+        self.invalidate_cache(Pipeline, fqn, resp.get("id"))
 
         return Pipeline(**resp)
 
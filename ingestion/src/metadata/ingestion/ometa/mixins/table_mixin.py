@@ -64,6 +64,7 @@ class OMetaTableMixin:
             f"{self.get_suffix(Table)}/{table.id.__root__}/location",
             data=json.dumps(location.id.__root__, cls=UUIDEncoder),
         )
+        self.invalidate_cache(Table, table.id)
 
     def ingest_table_sample_data(
         self, table: Table, sample_data: TableData
@@ -85,6 +86,7 @@ class OMetaTableMixin:
                 f"Error trying to PUT sample data for {table.fullyQualifiedName.__root__} - {err}"
             )
             logger.debug(traceback.format_exc())
+        self.invalidate_cache(Table, table.id)
 
         if resp:
             try:
@@ -112,6 +114,7 @@ class OMetaTableMixin:
             f"{self.get_suffix(Table)}/{table.id.__root__}/tableProfile",
             data=profile_request.json(),
         )
+        self.invalidate_cache(Table, table.id)
         return Table(**resp)
 
     def ingest_table_data_model(self, table: Table, data_model: DataModel) -> Table:
@@ -125,6 +128,7 @@ class OMetaTableMixin:
             f"{self.get_suffix(Table)}/{table.id.__root__}/dataModel",
             data=data_model.json(),
         )
+        self.invalidate_cache(Table, table.id)
         return Table(**resp)
 
     def ingest_table_queries_data(
@@ -144,6 +148,7 @@ class OMetaTableMixin:
                     data=query.json(),
                 )
                 seen_queries.put(query.query, None)
+        self.invalidate_cache(Table, table.id)
 
     def publish_table_usage(
         self, table: Table, table_usage_request: UsageRequest
@@ -157,6 +162,7 @@ class OMetaTableMixin:
         resp = self.client.put(
             f"/usage/table/{table.id.__root__}", data=table_usage_request.json()
         )
+        self.invalidate_cache(Table, table.id)
         logger.debug("published table usage %s", resp)
 
     def publish_frequently_joined_with(
@@ -174,6 +180,7 @@ class OMetaTableMixin:
             f"{self.get_suffix(Table)}/{table.id.__root__}/joins",
             data=table_join_request.json(),
         )
+        self.invalidate_cache(Table, table.id)
         logger.debug("published frequently joined with %s", resp)
 
     def _create_or_update_table_profiler_config(
@@ -195,6 +202,7 @@ class OMetaTableMixin:
             f"{self.get_suffix(Table)}/{table.id.__root__}/tableProfilerConfig",
             data=table_profiler_config.json(),
         )
+        self.invalidate_cache(Table, table.id)
         return Table(**resp)
 
     def _add_tests(
@@ -214,6 +222,7 @@ class OMetaTableMixin:
         resp = self.client.put(
             f"{self.get_suffix(Table)}/{table.id.__root__}/{path}", data=test.json()
         )
+        self.invalidate_cache(Table, table.id)
         return Table(**resp)
 
     def add_table_test(self, table: Table, table_test: CreateTableTestRequest) -> Table:
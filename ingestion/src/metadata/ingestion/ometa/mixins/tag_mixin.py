@@ -21,6 +21,7 @@ from metadata.generated.schema.api.tags.createTag import CreateTagRequest
 from metadata.generated.schema.api.tags.createTagCategory import (
     CreateTagCategoryRequest,
 )
+from metadata.generated.schema.entity.tags.tagCategory import Tag, TagCategory
 from metadata.ingestion.ometa.client import APIError
 from metadata.ingestion.ometa.utils import ometa_logger
 
@@ -60,6 +61,7 @@ class OMetaTagMixin:
         """
         path = "/tags"
         resp = self.client.post(path=path, data=tag_category_body.json())
+        self.invalidate_cache(TagCategory, tag_category_body.name.__root__)
         logger.info(f"Created tag category: {resp}")
 
     def get_tag_category(
@@ -85,6 +87,7 @@ class OMetaTagMixin:
         """
         path = f"/tags/{category_name}"
         resp = self.client.put(path=path, data=tag_category_body.json())
+        self.invalidate_cache(TagCategory, category_name)
         logger.info(f"Updated tag category: {resp}")
 
     def create_primary_tag(
@@ -97,6 +100,7 @@ class OMetaTagMixin:
         """
         path = f"/tags/{category_name}"
         resp = self.client.post(path=path, data=primary_tag_body.json())
+        self._invalidate_tag_cache(category_name, resp)
         logger.info(f"Create primary tag in category {category_name}: {resp}")
 
     def get_primary_tag(
@@ -133,6 +137,7 @@ class OMetaTagMixin:
         """
         path = f"/tags/{category_name}/{primary_tag_fqn}"
         resp = self.client.put(path=path, data=primary_tag_body.json())
+        self._invalidate_tag_cache(category_name, resp)
         logger.info(f"Updated primary tag: {resp}")
 
     def create_secondary_tag(
@@ -149,6 +154,7 @@ class OMetaTagMixin:
         """
         path = f"/tags/{category_name}/{primary_tag_fqn}"
         resp = self.client.post(path=path, data=secondary_tag_body.json())
+        self._invalidate_tag_cache(category_name, resp)
         logger.info(
             f"Create secondary tag in category {category_name}"
             f"under primary tag {primary_tag_fqn}: {resp}"
@@ -193,4 +199,14 @@ class OMetaTagMixin:
         """
         path = f"/tags/{category_name}/{primary_tag_fqn}/{secondary_tag_fqn}"
         resp = self.client.put(path=path, data=secondary_tag_body.json())
+        self._invalidate_tag_cache(category_name, resp)
         logger.info(f"Updated secondary tag: {resp}")
+
+    def _invalidate_tag_cache(self, category_name: str, resp: Optional[dict]) -> None:
+        """
+        Drop the cached reads of the written tag and of its
+        category, whose children changed
+        """
+        self.invalidate_cache(TagCategory, category_name)
+        if resp:
+            self.invalidate_cache(Tag, resp.get("id"), resp.get("fullyQualifiedName"))
@@ -45,5 +45,6 @@ class OMetaTestsMixin:
             f"{self.get_suffix(TestCase)}/{test_case_name}/testCaseResult",
             test_results.json(),
         )
+        self.invalidate_cache(TestCase, test_case_name)
 
         return resp
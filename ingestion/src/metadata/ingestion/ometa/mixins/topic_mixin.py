@@ -43,4 +43,5 @@ class OMetaTopicMixin:
             f"{self.get_suffix(Topic)}/{topic.id.__root__}/sampleData",
             data=sample_data.json(),
         )
+        self.invalidate_cache(Topic, topic.id)
         return TopicSampleData(**resp["sampleData"])
@@ -15,18 +15,7 @@ models from the JSON schemas and provides a typed approach to
 working with OpenMetadata entities.
 """
 
-from typing import Dict, Generic, Iterable, List, Optional, Type, TypeVar, Union
-
-from metadata.ingestion.ometa.mixins.dashboard_mixin import OMetaDashboardMixin
-from metadata.ingestion.ometa.mixins.patch_mixin import OMetaPatchMixin
-from metadata.utils.secrets.secrets_manager_factory import (
-    get_secrets_manager_from_om_connection,
-)
-
-try:
-    from typing import get_args
-except ImportError:
-    from typing_compat import get_args
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, Type, TypeVar, Union
 
 from pydantic import BaseModel
 from requests.utils import quote
@@ -69,9 +58,13 @@ from metadata.generated.schema.type.entityReference import EntityReference
 from metadata.ingestion.models.encoders import show_secrets_encoder
 from metadata.ingestion.ometa.auth_provider import AuthenticationProvider
 from metadata.ingestion.ometa.client import REST, APIError, ClientConfig
+from metadata.ingestion.ometa.entity_cache import CacheKey, EntityCache
+from metadata.ingestion.ometa.fqn_index import FQNIndex
+from metadata.ingestion.ometa.mixins.dashboard_mixin import OMetaDashboardMixin
 from metadata.ingestion.ometa.mixins.es_mixin import ESMixin
 from metadata.ingestion.ometa.mixins.glossary_mixin import GlossaryMixin
 from metadata.ingestion.ometa.mixins.mlmodel_mixin import OMetaMlModelMixin
+from metadata.ingestion.ometa.mixins.patch_mixin import OMetaPatchMixin
 from metadata.ingestion.ometa.mixins.pipeline_mixin import OMetaPipelineMixin
 from metadata.ingestion.ometa.mixins.server_mixin import OMetaServerMixin
 from metadata.ingestion.ometa.mixins.service_mixin import OMetaServiceMixin
@@ -85,6 +78,9 @@ from metadata.ingestion.ometa.provider_registry import (
     auth_provider_registry,
 )
 from metadata.ingestion.ometa.utils import get_entity_type, model_str, ometa_logger
+from metadata.utils.secrets.secrets_manager_factory import (
+    get_secrets_manager_from_om_connection,
+)
 
 logger = ometa_logger()
 
@@ -92,6 +88,47 @@ logger = ometa_logger()
 T = TypeVar("T", bound=BaseModel)
 C = TypeVar("C", bound=BaseModel)
 
+DEFAULT_BULK_WORKERS = 10
+# Page size when listing IDs and FQNs only
+LIST_FQNS_LIMIT = 5000
+
+# Endpoint of each Entity. Their Create classes share the same suffix
+ENTITY_SUFFIXES: Dict[Type[BaseModel], str] = {
+    MlModel: "/mlmodels",
+    Chart: "/charts",
+    Dashboard: "/dashboards",
+    Database: "/databases",
+    DatabaseSchema: "/databaseSchemas",
+    Pipeline: "/pipelines",
+    Location: "/locations",
+    Policy: "/policies",
+    Table: "/tables",
+    Topic: "/topics",
+    Metrics: "/metrics",
+    AddLineageRequest: "/lineage",
+    Report: "/reports",
+    Tag: "/tags",
+    TagCategory: "/tags",
+    Glossary: "/glossaries",
+    GlossaryTerm: "/glossaryTerms",
+    Role: "/roles",
+    Team: "/teams",
+    User: "/users",
+    # Services Schemas
+    DatabaseService: "/services/databaseServices",
+    DashboardService: "/services/dashboardServices",
+    MessagingService: "/services/messagingServices",
+    PipelineService: "/services/pipelineServices",
+    StorageService: "/services/storageServices",
+    MlModelService: "/services/mlmodelServices",
+    TestDefinition: "/testDefinition",
+    TestSuite: "/testSuite",
+    TestCase: "/testCase",
+}
+
+# Types in ENTITY_SUFFIXES without a Create request class
+ENTITIES_WITHOUT_CREATE = {Metrics, AddLineageRequest, Report}
+
 
 class MissingEntityTypeException(Exception):
     """
@@ -165,6 +202,20 @@ class OpenMetadata(
     tags_path = "tags"
     tests_path = "tests"
 
+    # Class lookups shared by all clients. The generated classes
+    # do not change at runtime, so they are never invalidated.
+    _suffix_registry: Dict[Type[BaseModel], str] = {}
+    _create_registry: Dict[Type[BaseModel], Type[BaseModel]] = {}
+    _entity_registry: Dict[Type[BaseModel], Type[BaseModel]] = {}
+
+    # Optional cache of get_by_name and get_by_id. It is shared by all
+    # clients, so that the writes of a sink invalidate the source reads.
+    entity_cache: Optional[EntityCache] = None
+
+    # Optional index of the tables of each database service,
+    # to resolve partial table names before searching ES.
+    fqn_index: Optional[FQNIndex] = None
+
     def __init__(self, config: OpenMetadataConnection, raw_data: bool = False):
         self.config = config
 
@@ -198,186 +249,53 @@ class OpenMetadata(
         if self.config.enableVersionValidation:
             self.validate_versions()
 
-    def get_suffix(self, entity: Type[T]) -> str:  # pylint: disable=R0911,R0912
+    def get_suffix(self, entity: Type[T]) -> str:
         """
         Given an entity Type from the generated sources,
         return the endpoint to run requests.
 
-        Might be interesting to follow a more strict
-        and type-checked approach
-
-        Disabled pylint R0911: too-many-return-statements
-        Disabled pylint R0912: too-many-branches
-        """
-
-        # Entity Schemas
-        if issubclass(
-            entity, get_args(Union[MlModel, self.get_create_entity_type(MlModel)])
-        ):
-            return "/mlmodels"
-
-        if issubclass(
-            entity, get_args(Union[Chart, self.get_create_entity_type(Chart)])
-        ):
-            return "/charts"
-
-        if issubclass(
-            entity, get_args(Union[Dashboard, self.get_create_entity_type(Dashboard)])
-        ):
-            return "/dashboards"
-
-        if issubclass(
-            entity, get_args(Union[Database, self.get_create_entity_type(Database)])
-        ):
-            return "/databases"
-
-        if issubclass(
-            entity,
-            get_args(
-                Union[DatabaseSchema, self.get_create_entity_type(DatabaseSchema)]
-            ),
-        ):
-            return "/databaseSchemas"
-
-        if issubclass(
-            entity, get_args(Union[Pipeline, self.get_create_entity_type(Pipeline)])
-        ):
-            return "/pipelines"
-
-        if issubclass(
-            entity, get_args(Union[Location, self.get_create_entity_type(Location)])
-        ):
-            return "/locations"
-
-        if issubclass(
-            entity, get_args(Union[Policy, self.get_create_entity_type(Policy)])
-        ):
-            return "/policies"
-
-        if issubclass(
-            entity, get_args(Union[Table, self.get_create_entity_type(Table)])
-        ):
-            return "/tables"
-
-        if issubclass(
-            entity, get_args(Union[Topic, self.get_create_entity_type(Topic)])
-        ):
-            return "/topics"
-
-        if issubclass(entity, Metrics):
-            return "/metrics"
-
-        if issubclass(entity, AddLineageRequest):
-            return "/lineage"
-
-        if issubclass(entity, Report):
-            return "/reports"
-
-        if issubclass(
-            entity,
-            get_args(
-                Union[
-                    Tag,
-                    self.get_create_entity_type(Tag),
-                    TagCategory,
-                    self.get_create_entity_type(TagCategory),
-                ]
-            ),
-        ):
-            return "/tags"
-
-        if issubclass(
-            entity, get_args(Union[Glossary, self.get_create_entity_type(Glossary)])
-        ):
-            return "/glossaries"
-
-        if issubclass(
-            entity,
-            get_args(Union[GlossaryTerm, self.get_create_entity_type(GlossaryTerm)]),
-        ):
-            return "/glossaryTerms"
-
-        if issubclass(entity, get_args(Union[Role, self.get_create_entity_type(Role)])):
-            return "/roles"
-
-        if issubclass(entity, get_args(Union[Team, self.get_create_entity_type(Team)])):
-            return "/teams"
-
-        if issubclass(entity, get_args(Union[User, self.get_create_entity_type(User)])):
-            return "/users"
-
-        # Services Schemas
-        if issubclass(
-            entity,
-            get_args(
-                Union[DatabaseService, self.get_create_entity_type(DatabaseService)]
-            ),
-        ):
-            return "/services/databaseServices"
-
-        if issubclass(
-            entity,
-            get_args(
-                Union[DashboardService, self.get_create_entity_type(DashboardService)]
-            ),
-        ):
-            return "/services/dashboardServices"
-
-        if issubclass(
-            entity,
-            get_args(
-                Union[MessagingService, self.get_create_entity_type(MessagingService)]
-            ),
-        ):
-            return "/services/messagingServices"
-
-        if issubclass(
-            entity,
-            get_args(
-                Union[PipelineService, self.get_create_entity_type(PipelineService)]
-            ),
-        ):
-            return "/services/pipelineServices"
-
-        if issubclass(
-            entity,
-            get_args(
-                Union[StorageService, self.get_create_entity_type(StorageService)]
-            ),
-        ):
-            return "/services/storageServices"
-
-        if issubclass(
-            entity,
-            get_args(
-                Union[MlModelService, self.get_create_entity_type(MlModelService)]
-            ),
-        ):
-            return "/services/mlmodelServices"
-
-        if issubclass(
-            entity,
-            get_args(
-                Union[TestDefinition, self.get_create_entity_type(TestDefinition)]
-            ),
-        ):
-            return "/testDefinition"
+        Entities and their Create classes are looked up in
+        the suffix registry, built on first use. Subclasses
+        of registered types are resolved once and memoized.
+        """
+        registry = self._suffix_registry
+        if not registry:
+            self._build_registries()
+
+        suffix = registry.get(entity)
+        if suffix is None:
+            suffix = next(
+                (
+                    registry[registered]
+                    for registered in list(registry)
+                    if issubclass(entity, registered)
+                ),
+                None,
+            )
+            if suffix is None:
+                raise MissingEntityTypeException(
+                    f"Missing {entity} type when generating suffixes"
+                )
+            registry[entity] = suffix
 
-        if issubclass(
-            entity,
-            get_args(Union[TestSuite, self.get_create_entity_type(TestSuite)]),
-        ):
-            return "/testSuite"
+        return suffix
 
-        if issubclass(
-            entity,
-            get_args(Union[TestCase, self.get_create_entity_type(TestCase)]),
-        ):
-            return "/testCase"
+    def _build_registries(self) -> None:
+        """
+        Map every Entity in ENTITY_SUFFIXES, and its Create class
+        when it has one, to the endpoint suffix. The Create classes
+        are mapped back to their Entity as well.
+        """
+        registry = {}
+        for entity, suffix in ENTITY_SUFFIXES.items():
+            registry[entity] = suffix
+            if entity not in ENTITIES_WITHOUT_CREATE:
+                create_class = self.get_create_entity_type(entity)
+                self._entity_registry.setdefault(create_class, entity)
+                registry[create_class] = suffix
 
-        raise MissingEntityTypeException(
-            f"Missing {entity} type when generating suffixes"
-        )
+        # Publish the complete registry at once for concurrent readers
+        self._suffix_registry.update(registry)
 
     def get_module_path(self, entity: Type[T]) -> str:
         """
@@ -407,6 +325,17 @@ class OpenMetadata(
         return self.data_path
 
     def get_create_entity_type(self, entity: Type[T]) -> Type[C]:
+        """
+        Returns the Create Type from an Entity Type T,
+        importing it only the first time it is requested.
+        """
+        create_class = self._create_registry.get(entity)
+        if create_class is None:
+            create_class = self._import_create_entity_type(entity)
+            self._create_registry[entity] = create_class
+        return create_class
+
+    def _import_create_entity_type(self, entity: Type[T]) -> Type[C]:
         """
         imports and returns the Create Type from an Entity Type T.
 
@@ -439,6 +368,17 @@ class OpenMetadata(
         return file_name
 
     def get_entity_from_create(self, create: Type[C]) -> Type[T]:
+        """
+        Inversely, return the Entity type based on the create Entity class,
+        importing it only the first time it is requested.
+        """
+        entity_class = self._entity_registry.get(create)
+        if entity_class is None:
+            entity_class = self._import_entity_from_create(create)
+            self._entity_registry[create] = entity_class
+        return entity_class
+
+    def _import_entity_from_create(self, create: Type[C]) -> Type[T]:
         """
         Inversely, import the Entity type based on the create Entity class
         """
@@ -494,8 +434,57 @@ class OpenMetadata(
             raise EmptyPayloadException(
                 f"Got an empty response when trying to PUT to {self.get_suffix(entity)}, {data.json()}"
             )
+        self.invalidate_cache(
+            entity_class, resp.get("id"), resp.get("fullyQualifiedName")
+        )
         return entity_class(**resp)
 
+    def create_or_update_many(
+        self, data: List[C], max_workers: int = DEFAULT_BULK_WORKERS
+    ) -> List[Optional[T]]:
+        """
+        PUT a list of CreateEntity requests.
+
+        The API does not have a bulk endpoint, so we pipeline the
+        requests of each type with the client `put_many`.
+
+        Results keep the order of the received data. If a request fails
+        we log the error and return None at its position.
+        """
+        created: List[Optional[T]] = [None] * len(data)
+
+        positions: Dict[Type[C], List[int]] = {}
+        for idx, create_request in enumerate(data):
+            positions.setdefault(type(create_request), []).append(idx)
+
+        for create_class, indexes in positions.items():
+            if "create" not in create_class.__name__.lower():
+                logger.error(f"PUT operations need a CreateEntity, not {create_class}")
+                continue
+
+            entity_class = self.get_entity_from_create(create_class)
+            responses = self.client.put_many(
+                self.get_suffix(create_class),
+                [data[idx].json(encoder=show_secrets_encoder) for idx in indexes],
+                return_exceptions=True,
+                max_workers=max_workers,
+            )
+            for idx, resp in zip(indexes, responses):
+                if isinstance(resp, Exception) or not resp:
+                    logger.error(
+                        "Error trying to PUT %s [%s] - %s",
+                        create_class.__name__,
+                        model_str(data[idx].name),
+                        resp or "Empty response",
+                    )
+                    continue
+                self.invalidate_cache(
+                    entity_class, resp.get("id"), resp.get("fullyQualifiedName")
+                )
+                created[idx] = entity_class(**resp)
+
+        return created
+
     def get_by_name(
         self,
         entity: Type[T],
@@ -510,6 +499,7 @@ class OpenMetadata(
             entity=entity,
             path=f"name/{quote(model_str(fqn), safe='')}",
             fields=fields,
+            cache_key=EntityCache.key(entity, "name", fqn, fields),
         )
 
     def get_by_id(
@@ -522,17 +512,33 @@ class OpenMetadata(
         Return entity by ID or None
         """
 
-        return self._get(entity=entity, path=model_str(entity_id), fields=fields)
+        return self._get(
+            entity=entity,
+            path=model_str(entity_id),
+            fields=fields,
+            cache_key=EntityCache.key(entity, "id", entity_id, fields),
+        )
 
     def _get(
-        self, entity: Type[T], path: str, fields: Optional[List[str]] = None
+        self,
+        entity: Type[T],
+        path: str,
+        fields: Optional[List[str]] = None,
+        cache_key: Optional[CacheKey] = None,
     ) -> Optional[T]:
         """
         Generic GET operation for an entity
         :param entity: Entity Class
         :param path: URL suffix by FQN or ID
         :param fields: List of fields to return
+        :param cache_key: read and store the entity in the entity cache, if enabled
         """
+        cache = self.entity_cache if cache_key else None
+        if cache is not None:
+            instance = cache.get(cache_key)
+            if instance is not None:
+                return instance
+
         fields_str = "?fields=" + ",".join(fields) if fields else ""
         try:
             resp = self.client.get(f"{self.get_suffix(entity)}/{path}{fields_str}")
@@ -540,7 +546,10 @@ class OpenMetadata(
                 raise EmptyPayloadException(
                     f"Got an empty response when trying to GET from {self.get_suffix(entity)}/{path}{fields_str}"
                 )
-            return entity(**resp)
+            instance = entity(**resp)
+            if cache is not None:
+                cache.put(cache_key, instance)
+            return instance
         except APIError as err:
             if err.status_code == 404:
                 logger.debug(
@@ -647,6 +656,33 @@ class OpenMetadata(
                 yield elem
             after = entity_list.after
 
+    def list_all_entity_fqns(
+        self,
+        entity: Type[T],
+        limit: int = LIST_FQNS_LIMIT,
+        params: Optional[Dict[str, str]] = None,
+    ) -> Iterable[Tuple[str, str]]:
+        """
+        Lightweight version of list_all_entities when we only need to
+        identify the entities: pages are not parsed into Entity models.
+        :param entity: Entity Type, such as Table
+        :param limit: Number of entities in each pagination
+        :param params: Extra parameters, e.g., {"service": "serviceName"} to filter
+        :return: Generator of (ID, FQN) tuples
+        """
+        suffix = self.get_suffix(entity)
+        after = None
+        while True:
+            url_after = f"&after={after}" if after else ""
+            resp = self.client.get(
+                path=f"{suffix}?limit={limit}{url_after}", data=params
+            )
+            for data in resp["data"]:
+                yield data["id"], data["fullyQualifiedName"]
+            after = resp["paging"].get("after")
+            if not after:
+                break
+
     def list_versions(
         self, entity_id: Union[str, basic.Uuid], entity: Type[T]
     ) -> EntityVersionHistory:
@@ -689,10 +725,71 @@ class OpenMetadata(
         Returns
             None
         """
+        self.client.delete(self._delete_path(entity, entity_id, recursive, hard_delete))
+        self.invalidate_cache(entity, entity_id)
+
+    def delete_many(
+        self,
+        entity: Type[T],
+        entity_ids: List[Union[str, basic.Uuid]],
+        recursive: bool = False,
+        hard_delete: bool = False,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> List[bool]:
+        """
+        Delete a list of entities by ID with the client `delete_many`.
+
+        Results keep the order of the received IDs. If a request fails
+        we log the error and return False at its position.
+        """
+        responses = self.client.delete_many(
+            [
+                self._delete_path(entity, entity_id, recursive, hard_delete)
+                for entity_id in entity_ids
+            ],
+            return_exceptions=True,
+            max_workers=max_workers,
+        )
+
+        deleted = []
+        for entity_id, resp in zip(entity_ids, responses):
+            if isinstance(resp, Exception):
+                logger.error(
+                    "Error trying to DELETE %s [%s] - %s",
+                    entity.__name__,
+                    model_str(entity_id),
+                    resp,
+                )
+                deleted.append(False)
+                continue
+            self.invalidate_cache(entity, entity_id)
+            deleted.append(True)
+
+        return deleted
+
+    def _delete_path(
+        self,
+        entity: Type[T],
+        entity_id: Union[str, basic.Uuid],
+        recursive: bool,
+        hard_delete: bool,
+    ) -> str:
+        """
+        Build the DELETE url of an entity ID
+        """
         url = f"{self.get_suffix(entity)}/{model_str(entity_id)}"
         url += f"?recursive={str(recursive).lower()}"
         url += f"&hardDelete={str(hard_delete).lower()}"
-        self.client.delete(url)
+        return url
+
+    def invalidate_cache(self, entity: Type[T], *values) -> None:
+        """
+        Drop the cached reads of an entity after writing it
+        :param entity: Entity Class
+        :param values: IDs or FQNs identifying the entity
+        """
+        if self.entity_cache is not None:
+            self.entity_cache.invalidate(entity, *values)
 
     def compute_percentile(self, entity: Union[Type[T], str], date: str) -> None:
         """
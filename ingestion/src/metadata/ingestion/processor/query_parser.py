@@ -13,9 +13,11 @@ Query parser implementation
 """
 
 import datetime
+import threading
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from logging.config import DictConfigurator
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from metadata.config.common import ConfigModel
 from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
@@ -30,7 +32,9 @@ from metadata.ingestion.lineage.parser import (
     get_parser_table_aliases,
     get_table_joins,
 )
+from metadata.ingestion.lineage.parser_cache import sql_parser_cache
 from metadata.utils.logger import ingestion_logger
+from metadata.utils.timeout import timeout
 
 configure = DictConfigurator.configure
 DictConfigurator.configure = lambda _: None
@@ -42,6 +46,25 @@ DictConfigurator.configure = configure
 logger = ingestion_logger()
 
 
+def get_tables_and_joins(query: str) -> Tuple[List[str], Dict[str, list]]:
+    """
+    Parse the tables and joins used in a query
+    """
+    parser = LineageRunner(query)
+
+    tables = get_involved_tables_from_parser(parser)
+
+    if not tables:
+        return [], {}
+
+    clean_tables = get_clean_parser_table_list(tables)
+    aliases = get_parser_table_aliases(tables)
+
+    return clean_tables, get_table_joins(
+        parser=parser, tables=clean_tables, aliases=aliases
+    )
+
+
 def parse_sql_statement(record: TableQuery) -> Optional[ParsedData]:
     """
     Use the lineage parser and work with the tokens
@@ -57,19 +80,17 @@ def parse_sql_statement(record: TableQuery) -> Optional[ParsedData]:
             str(record.analysisDate), "%Y-%m-%d %H:%M:%S"
         ).date()
 
-    parser = LineageRunner(record.query)
-
-    tables = get_involved_tables_from_parser(parser)
+    # Queries with the same shape share the parsed tables and joins
+    tables, joins = sql_parser_cache.get_or_compute(
+        record.query, "usage", get_tables_and_joins
+    )
 
     if not tables:
         return None
 
-    clean_tables = get_clean_parser_table_list(tables)
-    aliases = get_parser_table_aliases(tables)
-
     return ParsedData(
-        tables=clean_tables,
-        joins=get_table_joins(parser=parser, tables=clean_tables, aliases=aliases),
+        tables=tables,
+        joins=joins,
         databaseName=record.databaseName,
         databaseSchema=record.databaseSchema,
         sql=record.query,
@@ -78,6 +99,62 @@ def parse_sql_statement(record: TableQuery) -> Optional[ParsedData]:
     )
 
 
+def parse_sql_statements(
+    records: List[TableQuery], query_timeout: int = 0
+) -> List[Optional[ParsedData]]:
+    """
+    Parse a chunk of queries, logging the ones that fail
+    or take longer than `query_timeout` seconds.
+    Runs in the workers of the processor pool.
+    :param records: TableQuery list
+    :param query_timeout: seconds per query. 0 disables it. It relies on
+                          SIGALRM, so it is only applied in the main thread
+    :return: ParsedData or None for each query
+    """
+    parse_fn = parse_sql_statement
+    if query_timeout > 0:
+        if threading.current_thread() is threading.main_thread():
+            parse_fn = timeout(query_timeout)(parse_sql_statement)
+        else:
+            logger.debug("Parsing the queries without timeout outside the main thread")
+    parsed_data = []
+    for record in records:
+        parsed_sql = None
+        try:
+            parsed_sql = parse_fn(record)
+        except Exception as err:
+            logger.debug(traceback.format_exc())
+            logger.debug(record.query)
+            logger.error(err)
+        parsed_data.append(parsed_sql)
+    return parsed_data
+
+
+def parse_sql_statements_chunk(
+    records: List[TableQuery], query_timeout: int = 0
+) -> Tuple[List[Optional[ParsedData]], int, int]:
+    """
+    Parse a chunk of queries in a pool worker, returning the
+    hits and misses of the worker parser cache as well
+    """
+    status = sql_parser_cache.status
+    hits, misses = status.hits, status.misses
+    parsed_data = parse_sql_statements(records, query_timeout)
+    return parsed_data, status.hits - hits, status.misses - misses
+
+
+class QueryParserProcessorConfig(ConfigModel):
+    """
+    :param processes: parse the queries in a pool of processes when > 1
+    :param chunk_size: queries sent at once to a process
+    :param query_timeout: seconds to parse a query before skipping it. 0 disables it
+    """
+
+    processes: int = 1
+    chunk_size: int = 100
+    query_timeout: int = 0
+
+
 class QueryParserProcessor(Processor):
     """
     Extension of the `Processor` class
@@ -92,42 +169,67 @@ class QueryParserProcessor(Processor):
         status (ProcessorStatus):
     """
 
-    config: ConfigModel
+    config: QueryParserProcessorConfig
     status: ProcessorStatus
 
     def __init__(
         self,
-        config: ConfigModel,
+        config: QueryParserProcessorConfig,
         metadata_config: OpenMetadataConnection,
     ):
 
         self.config = config
         self.metadata_config = metadata_config
         self.status = ProcessorStatus()
+        self.executor: Optional[ProcessPoolExecutor] = None
 
     @classmethod
     def create(
         cls, config_dict: dict, metadata_config: OpenMetadataConnection, **kwargs
     ):
-        config = ConfigModel.parse_obj(config_dict)
+        config = QueryParserProcessorConfig.parse_obj(config_dict)
         return cls(config, metadata_config)
 
+    def _parse(self, records: List[TableQuery]) -> List[Optional[ParsedData]]:
+        """
+        Parse the queries in the current process, or split them in chunks
+        for the process pool. Results keep the order of the queries.
+        """
+        if self.config.processes <= 1 or len(records) <= self.config.chunk_size:
+            return parse_sql_statements(records, self.config.query_timeout)
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.config.processes)
+
+        chunks = [
+            records[start : start + self.config.chunk_size]
+            for start in range(0, len(records), self.config.chunk_size)
+        ]
+        parsed_data = []
+        for parsed_chunk, hits, misses in self.executor.map(
+            parse_sql_statements_chunk,
+            chunks,
+            [self.config.query_timeout] * len(chunks),
+        ):
+            parsed_data.extend(parsed_chunk)
+            # Each worker has its own cache. Report them all together.
+            sql_parser_cache.status.hits += hits
+            sql_parser_cache.status.misses += misses
+        return parsed_data
+
     def process(self, queries: TableQueries) -> Optional[QueryParserData]:
         if queries and queries.queries:
-            data = []
-            for record in queries.queries:
-                try:
-                    parsed_sql = parse_sql_statement(record)
-                    if parsed_sql:
-                        data.append(parsed_sql)
-                except Exception as err:
-                    logger.debug(traceback.format_exc())
-                    logger.debug(record.query)
-                    logger.error(err)
+            data = [
+                parsed_sql
+                for parsed_sql in self._parse(queries.queries)
+                if parsed_sql is not None
+            ]
             return QueryParserData(parsedData=data)
 
     def close(self):
-        pass
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
 
     def get_status(self) -> ProcessorStatus:
         return self.status
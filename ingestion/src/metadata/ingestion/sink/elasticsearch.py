@@ -14,7 +14,7 @@ import ssl
 import sys
 import traceback
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Type
 
 import boto3
 from elasticsearch import Elasticsearch, RequestsHttpConnection
@@ -52,6 +52,7 @@ from metadata.ingestion.models.table_metadata import (
     UserESDocument,
 )
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.ingestion.sink.elasticsearch_bulk import ElasticsearchBulkIndexer
 from metadata.ingestion.sink.elasticsearch_mapping.dashboard_search_index_mapping import (
     DASHBOARD_ELASTICSEARCH_INDEX_MAPPING,
 )
@@ -80,6 +81,7 @@ from metadata.ingestion.sink.elasticsearch_mapping.user_search_index_mapping imp
     USER_ELASTICSEARCH_INDEX_MAPPING,
 )
 from metadata.utils.logger import ingestion_logger
+from metadata.utils.lru_cache import LRUCache
 
 logger = ingestion_logger()
 
@@ -132,6 +134,16 @@ class ElasticSearchConfig(ConfigModel):
     recreate_indexes: Optional[bool] = False
     use_AWS_credentials: Optional[bool] = False
     region_name: Optional[str] = None
+    # Buffer the documents and write them with the _bulk API when bulk_size > 1.
+    # Batches are sent when reaching bulk_size documents or bulk_max_bytes,
+    # or after bulk_flush_interval seconds. Indexes are not refreshed meanwhile.
+    bulk_size: int = 1
+    bulk_max_bytes: int = 10 * 1024 * 1024
+    bulk_flush_interval: int = 30
+    bulk_workers: int = 2
+    # Names of the parent entities (databases, schemas) fetched when
+    # the references of the indexed entities do not carry them
+    parent_cache_size: int = 1000
 
 
 class ElasticsearchSink(Sink[Entity]):
@@ -156,6 +168,7 @@ class ElasticsearchSink(Sink[Entity]):
         self.status = SinkStatus()
         self.metadata = OpenMetadata(self.metadata_config)
         self.elasticsearch_doc_type = "_doc"
+        self.parent_cache = LRUCache(self.config.parent_cache_size)
         http_auth = None
         if self.config.es_username:
             http_auth = (self.config.es_username, self.config.es_password)
@@ -236,6 +249,36 @@ class ElasticsearchSink(Sink[Entity]):
                 TAG_ELASTICSEARCH_INDEX_MAPPING,
             )
 
+        self.bulk_indexer = None
+        if self.config.bulk_size > 1:
+            self.bulk_indexer = ElasticsearchBulkIndexer(
+                client=self.elasticsearch_client,
+                status=self.status,
+                batch_size=self.config.bulk_size,
+                batch_bytes=self.config.bulk_max_bytes,
+                flush_interval=self.config.bulk_flush_interval,
+                workers=self.config.bulk_workers,
+                timeout=self.config.timeout,
+            )
+            self.bulk_indexer.disable_refresh(self._get_index_names())
+
+    def _get_index_names(self) -> List[str]:
+        """
+        Names of the indexes written by the sink
+        """
+        indexes = [
+            (self.config.index_tables, self.config.table_index_name),
+            (self.config.index_topics, self.config.topic_index_name),
+            (self.config.index_dashboards, self.config.dashboard_index_name),
+            (self.config.index_pipelines, self.config.pipeline_index_name),
+            (self.config.index_users, self.config.user_index_name),
+            (self.config.index_teams, self.config.team_index_name),
+            (self.config.index_glossary_terms, self.config.glossary_term_index_name),
+            (self.config.index_mlmodels, self.config.mlmodel_index_name),
+            (self.config.index_tags, self.config.tag_index_name),
+        ]
+        return [index_name for enabled, index_name in indexes if enabled]
+
     def _check_or_create_index(self, index_name: str, es_mapping: str):
         """
         Retrieve all indices that currently have {elasticsearch_alias} alias
@@ -277,89 +320,85 @@ class ElasticsearchSink(Sink[Entity]):
         try:
             if isinstance(record, Table):
                 table_doc = self._create_table_es_doc(record)
-                self.elasticsearch_client.index(
-                    index=self.config.table_index_name,
-                    id=str(table_doc.id),
-                    body=table_doc.json(),
-                    request_timeout=self.config.timeout,
-                )
+                self._index_doc(self.config.table_index_name, table_doc)
             if isinstance(record, Topic):
                 topic_doc = self._create_topic_es_doc(record)
-                self.elasticsearch_client.index(
-                    index=self.config.topic_index_name,
-                    id=str(topic_doc.id),
-                    body=topic_doc.json(),
-                    request_timeout=self.config.timeout,
-                )
+                self._index_doc(self.config.topic_index_name, topic_doc)
             if isinstance(record, Dashboard):
                 dashboard_doc = self._create_dashboard_es_doc(record)
-                self.elasticsearch_client.index(
-                    index=self.config.dashboard_index_name,
-                    id=str(dashboard_doc.id),
-                    body=dashboard_doc.json(),
-                    request_timeout=self.config.timeout,
-                )
+                self._index_doc(self.config.dashboard_index_name, dashboard_doc)
             if isinstance(record, Pipeline):
                 pipeline_doc = self._create_pipeline_es_doc(record)
-                self.elasticsearch_client.index(
-                    index=self.config.pipeline_index_name,
-                    id=str(pipeline_doc.id),
-                    body=pipeline_doc.json(),
-                    request_timeout=self.config.timeout,
-                )
+                self._index_doc(self.config.pipeline_index_name, pipeline_doc)
 
             if isinstance(record, User):
                 user_doc = self._create_user_es_doc(record)
-                self.elasticsearch_client.index(
-                    index=self.config.user_index_name,
-                    id=str(user_doc.id),
-                    body=user_doc.json(),
-                    request_timeout=self.config.timeout,
-                )
+                self._index_doc(self.config.user_index_name, user_doc)
 
             if isinstance(record, Team):
                 team_doc = self._create_team_es_doc(record)
-                self.elasticsearch_client.index(
-                    index=self.config.team_index_name,
-                    id=str(team_doc.id),
-                    body=team_doc.json(),
-                    request_timeout=self.config.timeout,
-                )
+                self._index_doc(self.config.team_index_name, team_doc)
 
             if isinstance(record, GlossaryTerm):
                 glossary_term_doc = self._create_glossary_term_es_doc(record)
-                self.elasticsearch_client.index(
-                    index=self.config.glossary_term_index_name,
-                    id=str(glossary_term_doc.id),
-                    body=glossary_term_doc.json(),
-                    request_timeout=self.config.timeout,
-                )
+                self._index_doc(self.config.glossary_term_index_name, glossary_term_doc)
 
             if isinstance(record, MlModel):
                 ml_model_doc = self._create_ml_model_es_doc(record)
-                self.elasticsearch_client.index(
-                    index=self.config.mlmodel_index_name,
-                    id=str(ml_model_doc.id),
-                    body=ml_model_doc.json(),
-                    request_timeout=self.config.timeout,
-                )
+                self._index_doc(self.config.mlmodel_index_name, ml_model_doc)
 
             if isinstance(record, TagCategory):
                 tag_docs = self._create_tag_es_doc(record)
                 for tag_doc in tag_docs:
-                    self.elasticsearch_client.index(
-                        index=self.config.tag_index_name,
-                        id=str(tag_doc.id),
-                        body=tag_doc.json(),
-                        request_timeout=self.config.timeout,
-                    )
-                    self.status.records_written(tag_doc.name)
+                    self._index_doc(self.config.tag_index_name, tag_doc)
 
         except Exception as e:
             logger.error(f"Failed to index entity {record} due to {e}")
             logger.debug(traceback.format_exc())
             logger.debug(sys.exc_info()[2])
 
+    def _index_doc(self, index_name: str, doc) -> None:
+        """
+        Index the document right away, or buffer it in bulk mode.
+        The status is updated once Elasticsearch acknowledges it.
+        :param index_name: Elasticsearch index
+        :param doc: ES document model
+        """
+        name = f"{index_name}: {doc.fullyQualifiedName}"
+        if self.bulk_indexer is not None:
+            self.bulk_indexer.index(
+                index_name=index_name, doc_id=str(doc.id), body=doc.json(), name=name
+            )
+            return
+        self.elasticsearch_client.index(
+            index=index_name,
+            id=str(doc.id),
+            body=doc.json(),
+            request_timeout=self.config.timeout,
+        )
+        self.status.records_written(name)
+
+    def _get_parent_name(
+        self, entity: Type[Entity], entity_ref: EntityReference
+    ) -> str:
+        """
+        Name of a parent entity. It is read from its reference when
+        informed, and otherwise fetched once and kept in a bounded cache,
+        as many documents share the same few parents.
+        :param entity: parent entity type
+        :param entity_ref: reference to the parent in the indexed entity
+        """
+        if entity_ref.name:
+            return entity_ref.name
+        key = (entity.__name__, str(entity_ref.id.__root__))
+        if key in self.parent_cache:
+            return self.parent_cache.get(key)
+        parent = self.metadata.get_by_id(entity=entity, entity_id=key[1])
+        if parent is None:
+            raise ValueError(f"Cannot find the {key[0]} with id {key[1]}")
+        self.parent_cache.put(key, parent.name.__root__)
+        return parent.name.__root__
+
     def _create_table_es_doc(self, table: Table):
         table_fqn = table.fullyQualifiedName.__root__
         table_name = table.name
@@ -382,17 +421,11 @@ class ElasticsearchSink(Sink[Entity]):
             else:
                 tags.append(table_tag)
 
-        database_entity = self.metadata.get_by_id(
-            entity=Database, entity_id=str(table.database.id.__root__)
-        )
-        database_schema_entity = self.metadata.get_by_id(
-            entity=DatabaseSchema, entity_id=str(table.databaseSchema.id.__root__)
-        )
+        database_name = self._get_parent_name(Database, table.database)
+        schema_name = self._get_parent_name(DatabaseSchema, table.databaseSchema)
         service_suggest.append({"input": [table.service.name], "weight": 5})
-        database_suggest.append({"input": [database_entity.name.__root__], "weight": 5})
-        schema_suggest.append(
-            {"input": [database_schema_entity.name.__root__], "weight": 5}
-        )
+        database_suggest.append({"input": [database_name], "weight": 5})
+        schema_suggest.append({"input": [schema_name], "weight": 5})
         self._parse_columns(
             table.columns, None, column_names, column_descriptions, tags
         )
@@ -788,5 +821,15 @@ class ElasticsearchSink(Sink[Entity]):
     def get_status(self):
         return self.status
 
+    def flush(self) -> None:
+        """
+        Send the buffered documents and wait for Elasticsearch
+        to acknowledge them, so that the status is up to date
+        """
+        if self.bulk_indexer is not None:
+            self.bulk_indexer.join()
+
     def close(self):
+        if self.bulk_indexer is not None:
+            self.bulk_indexer.close()
         self.elasticsearch_client.close()
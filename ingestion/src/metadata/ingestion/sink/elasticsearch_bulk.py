@@ -0,0 +1,196 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Buffer Elasticsearch documents and write them with the _bulk API
+"""
+import json
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from metadata.ingestion.api.sink import SinkStatus
+from metadata.utils.logger import ingestion_logger
+
+logger = ingestion_logger()
+
+# Disables the periodic refresh of an index
+REFRESH_DISABLED = "-1"
+
+
+class ElasticsearchBulkIndexer:
+    """
+    Buffer the index actions and send them in batches of at most
+    `batch_size` documents or `batch_bytes` bytes, or whatever is
+    buffered after `flush_interval` seconds.
+
+    Batches are sent by `workers` threads. Every document acknowledged
+    by Elasticsearch is recorded as written in the status, and every
+    document rejected, alone or with its whole batch, as a failure.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
+
+    def __init__(
+        self,
+        client: Any,
+        status: SinkStatus,
+        batch_size: int = 500,
+        batch_bytes: int = 10 * 1024 * 1024,
+        flush_interval: int = 30,
+        workers: int = 2,
+        timeout: int = 30,
+    ) -> None:
+        self.client = client
+        self.status = status
+        self.batch_size = batch_size
+        self.batch_bytes = batch_bytes
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+
+        # (document name, action and source lines)
+        self.buffer: List[Tuple[str, str]] = []
+        self.buffer_bytes = 0
+        self.last_flush = time.time()
+
+        self.refresh_intervals: Dict[str, Optional[str]] = {}
+        self._status_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        # Keep a bounded amount of batches in memory
+        self._max_pending = 2 * workers
+        self._pending: Deque[Future] = deque()
+
+    def index(self, index_name: str, doc_id: str, body: str, name: str) -> None:
+        """
+        Buffer the indexing of a document, sending the batch if it is full
+        :param index_name: Elasticsearch index
+        :param doc_id: Document ID
+        :param body: Document JSON
+        :param name: Document name to report in the status
+        """
+        action = json.dumps({"index": {"_index": index_name, "_id": doc_id}})
+        lines = f"{action}\n{body}\n"
+        size = len(lines.encode("utf-8"))
+
+        if self.buffer and self.buffer_bytes + size > self.batch_bytes:
+            self.flush()
+        self.buffer.append((name, lines))
+        self.buffer_bytes += size
+
+        if (
+            len(self.buffer) >= self.batch_size
+            or time.time() - self.last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Send the buffered documents as a single batch
+        """
+        self.last_flush = time.time()
+        if not self.buffer:
+            return
+        batch, self.buffer, self.buffer_bytes = self.buffer, [], 0
+
+        while len(self._pending) >= self._max_pending:
+            self._pending.popleft().result()
+        self._pending.append(self._pool.submit(self._send, batch))
+
+    def join(self) -> None:
+        """
+        Send the buffered documents and wait for all the batches
+        """
+        self.flush()
+        while self._pending:
+            self._pending.popleft().result()
+
+    def _send(self, batch: List[Tuple[str, str]]) -> None:
+        try:
+            response = self.client.bulk(
+                body="".join(lines for _, lines in batch),
+                request_timeout=self.timeout,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.error(f"Failed to index a batch of {len(batch)} documents: {exc}")
+            with self._status_lock:
+                for name, _ in batch:
+                    self.status.failure(f"{name}: {exc}")
+            return
+
+        # Items are returned in the order of the actions
+        with self._status_lock:
+            for (name, _), item in zip(batch, response.get("items", [])):
+                result = next(iter(item.values()))
+                if "error" in result:
+                    logger.error(f"Failed to index {name}: {result['error']}")
+                    self.status.failure(f"{name}: {result['error']}")
+                else:
+                    self.status.records_written(name)
+
+    def disable_refresh(self, index_names: List[str]) -> None:
+        """
+        Stop refreshing the indexes while we write them,
+        keeping track of their refresh interval
+        :param index_names: Elasticsearch indexes
+        """
+        for index_name in index_names:
+            try:
+                settings = self.client.indices.get_settings(
+                    index=index_name, name="index.refresh_interval"
+                )
+                self.refresh_intervals[index_name] = (
+                    settings.get(index_name, {})
+                    .get("settings", {})
+                    .get("index", {})
+                    .get("refresh_interval")
+                )
+                self.client.indices.put_settings(
+                    index=index_name,
+                    body={"index": {"refresh_interval": REFRESH_DISABLED}},
+                    request_timeout=self.timeout,
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug(traceback.format_exc())
+                logger.warning(f"Could not disable the refresh of {index_name}: {exc}")
+
+    def restore_refresh(self) -> None:
+        """
+        Set back the refresh interval of the indexes and refresh them,
+        so that the documents written are searchable right away.
+        A missing interval resets the index to the default one.
+        """
+        for index_name, refresh_interval in self.refresh_intervals.items():
+            try:
+                self.client.indices.put_settings(
+                    index=index_name,
+                    body={"index": {"refresh_interval": refresh_interval}},
+                    request_timeout=self.timeout,
+                )
+                self.client.indices.refresh(
+                    index=index_name, request_timeout=self.timeout
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug(traceback.format_exc())
+                logger.warning(f"Could not restore the refresh of {index_name}: {exc}")
+        self.refresh_intervals = {}
+
+    def close(self) -> None:
+        """
+        Write everything pending and restore the indexes refresh
+        """
+        try:
+            self.join()
+        finally:
+            self.restore_refresh()
+            self._pool.shutdown()
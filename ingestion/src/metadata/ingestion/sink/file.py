@@ -9,6 +9,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
 import pathlib
 
 from metadata.config.common import ConfigModel
@@ -55,7 +56,11 @@ class FileSink(Sink[Entity]):
         if self.wrote_something:
             self.file.write(",\n")
 
-        self.file.write(record.json())
+        # Raw data sources send the entities as dictionaries
+        if isinstance(record, dict):
+            self.file.write(json.dumps(record))
+        else:
+            self.file.write(record.json())
         self.wrote_something = True
         self.report.records_written(record)
 
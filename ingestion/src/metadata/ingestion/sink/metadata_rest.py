@@ -10,9 +10,11 @@
 #  limitations under the License.
 
 import logging
+import time
 import traceback
+from collections import OrderedDict
 from logging.config import DictConfigurator
-from typing import TypeVar
+from typing import Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 from pydantic import BaseModel, ValidationError
 from requests.exceptions import HTTPError
@@ -53,7 +55,7 @@ from metadata.ingestion.models.ometa_table_db import OMetaDatabaseAndTable
 from metadata.ingestion.models.ometa_tag_category import OMetaTagAndCategory
 from metadata.ingestion.models.pipeline_status import OMetaPipelineStatus
 from metadata.ingestion.models.profile_data import OMetaTableProfileSampleData
-from metadata.ingestion.models.table_metadata import DeleteTable
+from metadata.ingestion.models.table_metadata import DeleteTable, DeleteTables
 from metadata.ingestion.models.table_tests import OMetaTableTest
 from metadata.ingestion.models.tests_data import (
     OMetaTestCaseResultsSample,
@@ -62,7 +64,7 @@ from metadata.ingestion.models.tests_data import (
 )
 from metadata.ingestion.models.user import OMetaUserProfile
 from metadata.ingestion.ometa.client import APIError
-from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.ingestion.ometa.ometa_api import DEFAULT_BULK_WORKERS, OpenMetadata
 from metadata.ingestion.source.dashboard.dashboard_service import DashboardUsage
 from metadata.ingestion.source.database.database_service import (
     DataModelLink,
@@ -87,9 +89,17 @@ logger = ingestion_logger()
 # Allow types from the generated pydantic models
 T = TypeVar("T", bound=BaseModel)
 
+# Written entities kept to be acknowledged, dropping the oldest ones
+ACKS_SIZE = 1000
+
 
 class MetadataRestSinkConfig(ConfigModel):
     api_endpoint: str = None
+    # Buffer create requests by entity type and write them in batches
+    # when bulk_size > 1. Buffers are flushed after bulk_flush_interval seconds.
+    bulk_size: int = 1
+    bulk_flush_interval: int = 30
+    bulk_workers: int = DEFAULT_BULK_WORKERS
 
 
 class MetadataRestSink(Sink[Entity]):
@@ -113,6 +123,10 @@ class MetadataRestSink(Sink[Entity]):
         self.metadata = OpenMetadata(self.metadata_config)
         self.role_entities = {}
         self.team_entities = {}
+        self.create_buffer: Dict[Type[BaseModel], List[BaseModel]] = {}
+        self.last_flush = time.time()
+        self.acks: Dict[int, Tuple[BaseModel, Entity]] = OrderedDict()
+        self.pending_acks: Dict[int, Callable[[Optional[Entity]], None]] = {}
 
     @classmethod
     def create(cls, config_dict: dict, metadata_config: OpenMetadataConnection):
@@ -121,6 +135,10 @@ class MetadataRestSink(Sink[Entity]):
 
     @calculate_execution_time
     def write_record(self, record: Entity) -> None:
+        if self.create_buffer and "create" not in type(record).__name__.lower():
+            # The record might depend on the buffered entities
+            self.flush()
+
         if isinstance(record, OMetaDatabaseAndTable):
             self.write_tables(record)
         elif isinstance(record, OMetaPolicy):
@@ -133,6 +151,8 @@ class MetadataRestSink(Sink[Entity]):
             self.write_tag_category(record)
         elif isinstance(record, DeleteTable):
             self.delete_table(record)
+        elif isinstance(record, DeleteTables):
+            self.delete_tables(record)
         elif isinstance(record, OMetaTableTest):
             self.write_table_tests(record)
         elif isinstance(record, OMetaPipelineStatus):
@@ -153,7 +173,97 @@ class MetadataRestSink(Sink[Entity]):
             self.write_test_case_results_sample(record)
         else:
             logging.debug(f"Processing Create request {type(record)}")
-            self.write_create_request(record)
+            if self.config.bulk_size > 1:
+                self.buffer_create_request(record)
+            else:
+                self.write_create_request(record)
+
+    def buffer_create_request(self, entity_request) -> None:
+        """
+        Add the request to the buffer of its entity type. The buffer
+        is written when it reaches the bulk size or when the flush
+        interval has passed.
+        :param entity_request: Create Entity request
+        """
+        entity_type = type(entity_request)
+        self.create_buffer.setdefault(entity_type, []).append(entity_request)
+
+        if len(self.create_buffer[entity_type]) >= self.config.bulk_size:
+            self.flush_create_requests(entity_type)
+        elif time.time() - self.last_flush >= self.config.bulk_flush_interval:
+            self.flush()
+
+    def flush_create_requests(self, entity_type: Type[BaseModel]) -> None:
+        """
+        Send to OM all the buffered requests of an entity type,
+        keeping track of the created entities to acknowledge them.
+        :param entity_type: Create Entity request class
+        """
+        entity_requests = self.create_buffer.pop(entity_type, [])
+        created_entities = self.metadata.create_or_update_many(
+            entity_requests, max_workers=self.config.bulk_workers
+        )
+        for entity_request, created in zip(entity_requests, created_entities):
+            log = f"{entity_type.__name__} [{entity_request.name.__root__}]"
+            if created:
+                self.status.records_written(
+                    f"{type(created).__name__}: {created.fullyQualifiedName.__root__}"
+                )
+                logger.info(f"Successfully ingested {log}")
+            else:
+                self.status.failure(log)
+                logger.error(f"Failed to ingest {log}")
+
+            # Sources waiting for the buffer get the entity right away
+            callback = self.pending_acks.pop(id(entity_request), None)
+            if callback is not None:
+                callback(created)
+            elif created:
+                self.add_ack(entity_request, created)
+
+    def flush(self) -> None:
+        """
+        Write all the buffered create requests
+        """
+        for entity_type in list(self.create_buffer):
+            self.flush_create_requests(entity_type)
+        self.last_flush = time.time()
+
+    def add_ack(self, entity_request: BaseModel, created: Entity) -> None:
+        """
+        Keep the entity created from a request until it is acknowledged
+        """
+        self.acks[id(entity_request)] = (entity_request, created)
+        if len(self.acks) > ACKS_SIZE:
+            self.acks.popitem(last=False)
+
+    def acknowledge(
+        self,
+        record: Entity,
+        callback: Optional[Callable[[Optional[Entity]], None]] = None,
+    ) -> Optional[Entity]:
+        """
+        Return the entity created from a create request. This saves the
+        source from reading back the entity it just sent.
+
+        If the request is still buffered, the buffer is written right away
+        unless a callback is given: it is then called with the entity
+        when the buffer is written, on size, interval or close.
+        """
+        entity_type = type(record)
+        if any(
+            buffered is record for buffered in self.create_buffer.get(entity_type, [])
+        ):
+            if callback is not None:
+                self.pending_acks[id(record)] = callback
+                return None
+            self.flush_create_requests(entity_type)
+
+        entity_request, created = self.acks.pop(id(record), (None, None))
+        created = created if entity_request is record else None
+        if callback is not None:
+            callback(created)
+        return created
 
     def write_create_request(self, entity_request) -> None:
         """
@@ -164,6 +274,7 @@ class MetadataRestSink(Sink[Entity]):
         try:
             created = self.metadata.create_or_update(entity_request)
             if created:
+                self.add_ack(entity_request, created)
                 self.status.records_written(
                     f"{type(created).__name__}: {created.fullyQualifiedName.__root__}"
                 )
@@ -537,6 +648,23 @@ class MetadataRestSink(Sink[Entity]):
             logger.debug(traceback.format_exc())
             logger.error(err)
 
+    def delete_tables(self, record: DeleteTables):
+        """
+        Delete the tables concurrently
+        """
+        deleted = self.metadata.delete_many(
+            entity=Table,
+            entity_ids=[table.id for table in record.tables],
+            max_workers=self.config.bulk_workers,
+        )
+        for table, is_deleted in zip(record.tables, deleted):
+            if is_deleted:
+                logger.info(
+                    f"{table.fullyQualifiedName} doesn't exist in source state, marking it as deleted"
+                )
+            else:
+                self.status.failure(f"Table: {table.fullyQualifiedName}")
+
     def write_table_tests(self, record: OMetaTableTest) -> None:
         """
         Iterate over all table_tests and column_tests
@@ -667,4 +795,4 @@ class MetadataRestSink(Sink[Entity]):
         return self.status
 
     def close(self):
-        pass
+        self.flush()
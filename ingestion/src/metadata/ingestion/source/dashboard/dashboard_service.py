@@ -13,7 +13,10 @@ Base class for ingesting dashboard services
 """
 import traceback
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 
 from pydantic import BaseModel
 
@@ -273,11 +276,37 @@ class DashboardServiceSource(TopologyRunnerMixin, Source, ABC):
             entity=DashboardService, config=config
         )
 
+    def fetch_dashboard_details(
+        self, dashboards: Iterable[Any]
+    ) -> Iterable[Tuple[Any, Callable[[], Any]]]:
+        """
+        Pair each dashboard with a callable returning its details.
+        With threadCount > 1, the details are fetched concurrently a
+        bounded number of dashboards ahead, keeping the listing order.
+        """
+        thread_count = self.source_config.threadCount or 1
+        if thread_count <= 1:
+            for dashboard in dashboards:
+                yield dashboard, partial(self.get_dashboard_details, dashboard)
+            return
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=thread_count) as executor:
+            for dashboard in dashboards:
+                future = executor.submit(self.get_dashboard_details, dashboard)
+                pending.append((dashboard, future.result))
+                if len(pending) > 2 * thread_count:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+
     def get_dashboard(self) -> Any:
-        for dashboard in self.get_dashboards_list():
+        for dashboard, get_details in self.fetch_dashboard_details(
+            self.get_dashboards_list() or []
+        ):
 
             try:
-                dashboard_details = self.get_dashboard_details(dashboard)
+                dashboard_details = get_details()
             except Exception as err:
                 logger.error(
                     f"Cannot extract dashboard details from {dashboard} - {err}"
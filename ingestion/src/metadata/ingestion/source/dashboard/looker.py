@@ -9,9 +9,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import time
 import traceback
 from datetime import datetime
-from typing import Iterable, List, Optional, Set, cast
+from http import HTTPStatus
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, cast
 
 from looker_sdk.error import SDKError
 from looker_sdk.sdk.api31.models import Query
@@ -54,6 +56,35 @@ from metadata.utils.logger import ingestion_logger
 
 logger = ingestion_logger()
 
+# Retries of the Looker API calls answered with 429 Too Many Requests,
+# waiting LOOKER_RETRY_WAIT * 2^attempt seconds between them
+LOOKER_RETRIES = 3
+LOOKER_RETRY_WAIT = 5
+
+
+class LookerRateLimitError(SDKError):
+    """
+    Looker API response with status 429 Too Many Requests
+    """
+
+    status = HTTPStatus.TOO_MANY_REQUESTS
+
+
+def raise_rate_limited(response, *_, **__) -> None:
+    """
+    Response hook of the SDK session, as the SDK errors
+    do not keep the status code of the failed responses
+    """
+    if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        raise LookerRateLimitError(f"Too Many Requests: {response.url}")
+
+
+def is_rate_limited(err: SDKError) -> bool:
+    """
+    Check the status code of the failed response
+    """
+    return getattr(err, "status", None) == HTTPStatus.TOO_MANY_REQUESTS
+
 
 class LookerSource(DashboardServiceSource):
     config: WorkflowSource
@@ -66,6 +97,12 @@ class LookerSource(DashboardServiceSource):
     ):
         super().__init__(config, metadata_config)
         self.today = datetime.now().strftime("%Y-%m-%d")
+        # SQL table of each (model, explore), shared by many dashboards
+        self._explore_tables: Dict[Tuple[str, str], Optional[str]] = {}
+        self._model_explores: Optional[Set[Tuple[str, str]]] = None
+        session = getattr(self.client.transport, "session", None)
+        if session is not None:
+            session.hooks["response"].append(raise_rate_limited)
 
     @classmethod
     def create(cls, config_dict: dict, metadata_config: OpenMetadataConnection):
@@ -89,6 +126,22 @@ class LookerSource(DashboardServiceSource):
         """
         return dashboard_details.id
 
+    @staticmethod
+    def _call(method: Callable, *args, **kwargs):
+        """
+        Call the Looker API, backing off when rate limited
+        """
+        for attempt in range(LOOKER_RETRIES + 1):
+            try:
+                return method(*args, **kwargs)
+            except SDKError as err:
+                if attempt == LOOKER_RETRIES or not is_rate_limited(err):
+                    raise
+                wait = LOOKER_RETRY_WAIT * 2**attempt
+                logger.warning(f"Looker API rate limit reached. Retrying in {wait}s")
+                time.sleep(wait)
+        return None
+
     def get_dashboard_details(self, dashboard: DashboardBase) -> LookerDashboard:
         """
         Get Dashboard Details
@@ -102,7 +155,9 @@ class LookerSource(DashboardServiceSource):
             "description",
             "folder",
         ]
-        return self.client.dashboard(dashboard_id=dashboard.id, fields=",".join(fields))
+        return self._call(
+            self.client.dashboard, dashboard_id=dashboard.id, fields=",".join(fields)
+        )
 
     def yield_dashboard(
         self, dashboard_details: LookerDashboard
@@ -136,6 +191,54 @@ class LookerSource(DashboardServiceSource):
 
         return table_name.lower().split("as")[0].strip()
 
+    def get_model_explores(self) -> Optional[Set[Tuple[str, str]]]:
+        """
+        (model, explore) pairs of all the LookML models, listed
+        in a single call. None if they cannot be listed.
+        """
+        if self._model_explores is None:
+            try:
+                models = self._call(
+                    self.client.all_lookml_models, fields="name,explores"
+                )
+                self._model_explores = {
+                    (model.name, explore.name)
+                    for model in models
+                    for explore in model.explores or []
+                }
+            except SDKError as err:
+                logger.debug(traceback.format_exc())
+                logger.warning(f"Cannot list the LookML models - {err}")
+                self._model_explores = set()
+        return self._model_explores or None
+
+    def get_explore_table(self, model: str, view: str) -> Optional[str]:
+        """
+        SQL table name of an explore, fetched once per run.
+        Explores missing from the LookML models are not requested.
+        """
+        key = (model, view)
+        if key not in self._explore_tables:
+            table_name = None
+            model_explores = self.get_model_explores()
+            if model_explores is not None and key not in model_explores:
+                logger.warning(f"Cannot find explore from model={model}, view={view}")
+            else:
+                try:
+                    explore: LookmlModelExplore = self._call(
+                        self.client.lookml_model_explore,
+                        model,
+                        view,
+                        fields="sql_table_name",
+                    )
+                    table_name = explore.sql_table_name
+                except SDKError as err:
+                    logger.error(
+                        f"Cannot get explore from model={model}, view={view} - {err}"
+                    )
+            self._explore_tables[key] = table_name
+        return self._explore_tables[key]
+
     def _add_sql_table(self, query: Query, dashboard_sources: Set[str]):
         """
         Add the SQL table information to the dashboard_sources.
@@ -145,19 +248,9 @@ class LookerSource(DashboardServiceSource):
         :param query: Looker query, from a look or result_maker
         :param dashboard_sources: seen tables so far
         """
-        try:
-            explore: LookmlModelExplore = self.client.lookml_model_explore(
-                query.model, query.view
-            )
-            table_name = explore.sql_table_name
-
-            if table_name:
-                dashboard_sources.add(self._clean_table_name(table_name))
-
-        except SDKError as err:
-            logger.error(
-                f"Cannot get explore from model={query.model}, view={query.view} - {err}"
-            )
+        table_name = self.get_explore_table(query.model, query.view)
+        if table_name:
+            dashboard_sources.add(self._clean_table_name(table_name))
 
     def get_dashboard_sources(self, dashboard_details: LookerDashboard) -> Set[str]:
         """
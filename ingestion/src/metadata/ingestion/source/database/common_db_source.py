@@ -12,6 +12,7 @@
 Generic source to build SQL connectors.
 """
 
+import threading
 import traceback
 from abc import ABC
 from copy import deepcopy
@@ -50,6 +51,10 @@ from metadata.ingestion.source.database.database_service import (
     DatabaseServiceSource,
     SQLSourceStatus,
 )
+from metadata.ingestion.source.database.schema_catalog import (
+    SchemaCatalogInspector,
+    get_schema_catalog_reflector,
+)
 from metadata.ingestion.source.database.sql_column_handler import SqlColumnHandlerMixin
 from metadata.ingestion.source.database.sqlalchemy_source import SqlAlchemySource
 from metadata.utils import fqn
@@ -60,6 +65,9 @@ from metadata.utils.logger import ingestion_logger
 
 logger = ingestion_logger()
 
+# Table types whose definition is read to build their lineage
+VIEW_TABLE_TYPES = {TableType.View, TableType.SecureView, TableType.MaterializedView}
+
 
 class CommonDbSourceService(
     DatabaseServiceSource, SqlColumnHandlerMixin, SqlAlchemySource, ABC
@@ -93,6 +101,8 @@ class CommonDbSourceService(
         self.table_constraints = None
         self.database_source_state = set()
         self.context.table_views = []
+        self.schema_inspector: Optional[SchemaCatalogInspector] = None
+        self._schema_inspector_lock = threading.Lock()
         super().__init__()
 
     def set_inspector(self, database_name: str) -> None:
@@ -108,6 +118,42 @@ class CommonDbSourceService(
         self.engine = get_connection(new_service_connection)
         self.inspector = inspect(self.engine)
 
+    def get_schema_inspector(self, schema_name: str) -> Inspector:
+        """
+        Return the inspector used to describe the tables of a schema.
+
+        With `prefetchSchemaCatalog`, the catalog of the schema is
+        fetched in a few queries and kept until we move to another
+        schema, if the dialect supports it.
+        :param schema_name: schema of the tables
+        """
+        if not self.source_config.prefetchSchemaCatalog:
+            return self.inspector
+        with self._schema_inspector_lock:
+            if (
+                self.schema_inspector is None
+                or self.schema_inspector.inspector is not self.inspector
+                or self.schema_inspector.schema != schema_name
+            ):
+                reflector = get_schema_catalog_reflector(self.inspector.dialect)
+                if reflector is None:
+                    return self.inspector
+                self.schema_inspector = SchemaCatalogInspector(
+                    self.inspector, reflector, schema_name
+                )
+            return self.schema_inspector
+
+    def get_table_change_marker(
+        self, schema_name: str, table_name: str, inspector: Inspector
+    ) -> Optional[str]:
+        """
+        Value changing with the table definition, e.g., its last DDL time.
+        It comes from the schema catalog, if the dialect supports it.
+        """
+        if isinstance(inspector, SchemaCatalogInspector):
+            return inspector.get_change_marker(table_name, schema_name)
+        return None
+
     def get_database_names(self) -> Iterable[str]:
         """
         Default case with a single database.
@@ -273,19 +319,33 @@ class CommonDbSourceService(
         schema_name = self.context.database_schema.name.__root__
         db_name = self.context.database.name.__root__
         try:
+            inspector = self.get_schema_inspector(schema_name)
+
+            # Skip unchanged tables before reflecting them when we can
+            change_marker = self.get_table_change_marker(
+                schema_name=schema_name, table_name=table_name, inspector=inspector
+            )
+            if change_marker is not None and self.is_table_unchanged(
+                table_name=table_name,
+                fingerprint=self.get_table_fingerprint(change_marker=change_marker),
+            ):
+                # We still need the lineage of the unchanged views
+                if table_type in VIEW_TABLE_TYPES:
+                    self.add_table_view(table_name, table_type, schema_name, db_name)
+                return
 
             columns, table_constraints = self.get_columns_and_constraints(
                 schema_name=schema_name,
                 table_name=table_name,
                 db_name=db_name,
-                inspector=self.inspector,
+                inspector=inspector,
             )
 
             view_definition = self.get_view_definition(
                 table_type=table_type,
                 table_name=table_name,
                 schema_name=schema_name,
-                inspector=self.inspector,
+                inspector=inspector,
             )
 
             table_request = CreateTableRequest(
@@ -294,7 +354,7 @@ class CommonDbSourceService(
                 description=self.get_table_description(
                     schema_name=schema_name,
                     table_name=table_name,
-                    inspector=self.inspector,
+                    inspector=inspector,
                 ),
                 columns=columns,
                 viewDefinition=view_definition,
@@ -309,13 +369,13 @@ class CommonDbSourceService(
             )
 
             if table_type == TableType.View or view_definition:
-                table_view = {
-                    "table_name": table_name,
-                    "table_type": table_type,
-                    "schema_name": schema_name,
-                    "db_name": db_name,
-                }
-                self.context.table_views.append(table_view)
+                self.add_table_view(table_name, table_type, schema_name, db_name)
+
+            if change_marker is None and self.is_table_unchanged(
+                table_name=table_name,
+                fingerprint=self.get_table_fingerprint(table_request=table_request),
+            ):
+                return
 
             yield table_request
             self.register_record(table_request=table_request)
@@ -323,9 +383,25 @@ class CommonDbSourceService(
         except Exception as err:
             logger.debug(traceback.format_exc())
             logger.error(err)
-            self.status.failures.append(
-                "{}.{}".format(self.config.serviceName, table_name)
-            )
+            with self.topology_lock:
+                self.status.failures.append(
+                    "{}.{}".format(self.config.serviceName, table_name)
+                )
+
+    def add_table_view(
+        self, table_name: str, table_type: TableType, schema_name: str, db_name: str
+    ) -> None:
+        """
+        Keep the views to process their lineage once all the tables are ingested
+        """
+        table_view = {
+            "table_name": table_name,
+            "table_type": table_type,
+            "schema_name": schema_name,
+            "db_name": db_name,
+        }
+        with self.topology_lock:
+            self.context.table_views.append(table_view)
 
     def yield_view_lineage(self) -> Optional[Iterable[AddLineageRequest]]:
         logger.info(f"Processing Lineage for Views")
@@ -350,7 +426,7 @@ class CommonDbSourceService(
                 table_type=table_type,
                 table_name=table_name,
                 schema_name=schema_name,
-                inspector=self.inspector,
+                inspector=self.get_schema_inspector(schema_name),
             )
             # Prevent sqllineage from modifying the logger config
             # Disable the DictConfigurator.configure method while importing LineageRunner
@@ -406,6 +482,7 @@ class CommonDbSourceService(
     def close(self):
         if self.connection is not None:
             self.connection.close()
+        super().close()
 
     def fetch_table_tags(
         self, table_name: str, schema_name: str, inspector: Inspector
@@ -11,8 +11,10 @@
 """
 Base class for ingesting database services
 """
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Iterable, List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Set, Tuple, TypeVar
 
 from pydantic import BaseModel
 from sqlalchemy.engine import Inspector
@@ -49,6 +51,7 @@ from metadata.generated.schema.metadataIngestion.workflow import (
     Source as WorkflowSource,
 )
 from metadata.generated.schema.type.basic import FullyQualifiedEntityName
+from metadata.generated.schema.type.entityReference import EntityReference
 from metadata.generated.schema.type.storage import StorageServiceType
 from metadata.generated.schema.type.tagLabel import (
     LabelType,
@@ -56,25 +59,29 @@ from metadata.generated.schema.type.tagLabel import (
     TagLabel,
     TagSource,
 )
+from metadata.ingestion.api.common import Entity
 from metadata.ingestion.api.source import Source, SourceStatus
 from metadata.ingestion.api.topology_runner import TopologyRunnerMixin
 from metadata.ingestion.models.ometa_tag_category import OMetaTagAndCategory
-from metadata.ingestion.models.table_metadata import DeleteTable
+from metadata.ingestion.models.table_metadata import DeleteTables
 from metadata.ingestion.models.topology import (
     NodeStage,
     ServiceTopology,
     TopologyNode,
     create_source_context,
 )
-from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.ingestion.ometa.ometa_api import DEFAULT_BULK_WORKERS, OpenMetadata
 from metadata.ingestion.source.database.dbt_source import DBTMixin
 from metadata.utils import fqn
 from metadata.utils.dbt_config import get_dbt_details
 from metadata.utils.helpers import pretty_print_time_duration
 from metadata.utils.logger import ingestion_logger
+from metadata.utils.state_store import StateStore
 
 logger = ingestion_logger()
 
+C = TypeVar("C", bound=BaseModel)
+
 
 class DataModelLink(BaseModel):
     """
@@ -163,6 +170,7 @@ class DatabaseServiceTopology(ServiceTopology):
                 context="table",
                 processor="yield_table",
                 consumer=["database_service", "database", "database_schema"],
+                defer_ack=True,
             ),
             NodeStage(
                 type_=Location,
@@ -183,6 +191,7 @@ class DatabaseServiceTopology(ServiceTopology):
                 nullable=True,
             ),
         ],
+        threads=True,
     )
 
 
@@ -195,11 +204,17 @@ class SQLSourceStatus(SourceStatus):
     failures: List[str] = list()
     warnings: List[str] = list()
     filtered: List[str] = list()
+    unchanged: List[str] = list()
 
     def scanned(self, record: str) -> None:
         self.success.append(record)
         logger.info(f"Scanned [{record}]")
 
+    def unchanged_table(self, record: str) -> None:
+        self.success.append(record)
+        self.unchanged.append(record)
+        logger.info(f"Unchanged [{record}]")
+
     def filter(self, record: str, err: str) -> None:
         self.filtered.append(record)
         logger.warning(f"Filtered [{record}] due to {err}")
@@ -222,6 +237,9 @@ class DatabaseServiceSource(DBTMixin, TopologyRunnerMixin, Source, ABC):
     # When processing the database, the source will update the inspector if needed
     inspector: Inspector
 
+    # Fingerprints of the tables, when running incrementally
+    table_state: Optional[StateStore] = None
+
     topology = DatabaseServiceTopology()
     context = create_source_context(topology)
 
@@ -230,6 +248,9 @@ class DatabaseServiceSource(DBTMixin, TopologyRunnerMixin, Source, ABC):
         self.dbt_catalog = dbt_details[0] if dbt_details else None
         self.dbt_manifest = dbt_details[1] if dbt_details else None
         self.data_models = {}
+        self.max_workers = self.source_config.threadCount or 1
+        if self.source_config.incrementalStateFilePath:
+            self.table_state = StateStore(self.source_config.incrementalStateFilePath)
 
     def prepare(self):
         self._parse_data_model()
@@ -443,19 +464,85 @@ class DatabaseServiceSource(DBTMixin, TopologyRunnerMixin, Source, ABC):
             table_name=table_request.name.__root__,
         )
 
-        self.database_source_state.add(table_fqn)
-        self.status.scanned(table_fqn)
+        with self.topology_lock:
+            self.database_source_state.add(table_fqn)
+            self.status.scanned(table_fqn)
+
+    def get_table_fingerprint(
+        self,
+        table_request: Optional[CreateTableRequest] = None,
+        change_marker: Optional[str] = None,
+    ) -> str:
+        """
+        Fingerprint a table from the change marker given by the source,
+        e.g., its last DDL time, or from the request sent to the sink.
+
+        Change markers are combined with the source config, as it
+        shapes the request as well.
+        """
+        if change_marker is not None:
+            source_config = self.source_config.json(sort_keys=True)
+            payload = f"marker:{change_marker}:{source_config}"
+        else:
+            payload = f"request:{table_request.json(sort_keys=True)}"
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
 
-    def delete_schema_tables(self, schema_fqn: str) -> Iterable[DeleteTable]:
+    def is_table_unchanged(self, table_name: str, fingerprint: str) -> bool:
         """
-        Returns Deleted tables
+        When running incrementally, check if the table has the same
+        fingerprint as in the previous run. Unchanged tables are still
+        added to the database_source_state, so that they do not get
+        marked as deleted. Otherwise, the new fingerprint is committed
+        once the sink acknowledges the table.
+        :param table_name: table in the current schema
+        :param fingerprint: from `get_table_fingerprint`
         """
-        database_state = self.metadata.list_all_entities(
-            entity=Table, params={"database": schema_fqn}
+        if self.table_state is None:
+            return False
+
+        table_fqn = fqn.build(
+            self.metadata,
+            entity_type=Table,
+            service_name=self.context.database_service.name.__root__,
+            database_name=self.context.database.name.__root__,
+            schema_name=self.context.database_schema.name.__root__,
+            table_name=table_name,
         )
-        for table in database_state:
-            if str(table.fullyQualifiedName.__root__) not in self.database_source_state:
-                yield DeleteTable(table=table)
+        with self.topology_lock:
+            if self.table_state.get(table_fqn) != fingerprint:
+                self.table_state.stage(table_fqn, fingerprint)
+                return False
+
+            self.table_state.keep(table_fqn)
+            self.database_source_state.add(table_fqn)
+            self.status.unchanged_table(table_fqn)
+            return True
+
+    def process_ack(
+        self, stage: NodeStage, entity_request: C, entity: Optional[Entity]
+    ) -> None:
+        """
+        Commit the fingerprint of the tables written by the sink
+        """
+        if self.table_state is not None and stage.type_ is Table and entity:
+            self.table_state.commit(entity.fullyQualifiedName.__root__)
+
+    def close(self):
+        if self.table_state is not None:
+            self.table_state.save()
+
+    def get_deleted_tables(self, schema_fqn: str) -> List[EntityReference]:
+        """
+        Returns the tables of the schema in OpenMetadata
+        missing from the database_source_state
+        """
+        return [
+            EntityReference(id=table_id, type="table", fullyQualifiedName=table_fqn)
+            for table_id, table_fqn in self.metadata.list_all_entity_fqns(
+                entity=Table, params={"database": schema_fqn}
+            )
+            if table_fqn not in self.database_source_state
+        ]
 
     def mark_tables_as_deleted(self):
         """
@@ -470,13 +557,21 @@ class DatabaseServiceSource(DBTMixin, TopologyRunnerMixin, Source, ABC):
                 if self.source_config.markDeletedTablesFromFilterOnly
                 else self.get_raw_database_schema_names()
             )
-            for schema_name in schema_names_list:
-                schema_fqn = fqn.build(
+            schema_fqns = [
+                fqn.build(
                     self.metadata,
                     entity_type=DatabaseSchema,
                     service_name=self.config.serviceName,
                     database_name=self.context.database.name.__root__,
                     schema_name=schema_name,
                 )
-
-                yield from self.delete_schema_tables(schema_fqn)
+                for schema_name in schema_names_list
+            ]
+
+            # List the tables of the schemas concurrently
+            with ThreadPoolExecutor(max_workers=DEFAULT_BULK_WORKERS) as executor:
+                for deleted_tables in executor.map(
+                    self.get_deleted_tables, schema_fqns
+                ):
+                    if deleted_tables:
+                        yield DeleteTables(tables=deleted_tables)
@@ -50,27 +50,21 @@ from metadata.ingestion.source.database.database_service import (
     SQLSourceStatus,
 )
 from metadata.utils.connections import get_connection, test_connection
-from metadata.utils.filters import filter_by_table
-from metadata.utils.gcs_utils import (
-    read_csv_from_gcs,
-    read_json_from_gcs,
-    read_parquet_from_gcs,
-    read_tsv_from_gcs,
+from metadata.utils.datalake_utils import (
+    DATALAKE_SUPPORTED_FILE_TYPES,
+    SCHEMA_BUFFER_SIZE,
+    get_partitioned_table,
+    infer_schema,
+    list_keys,
+    open_object,
 )
+from metadata.utils.filters import filter_by_table
 from metadata.utils.logger import ingestion_logger
-from metadata.utils.s3_utils import (
-    read_csv_from_s3,
-    read_json_from_s3,
-    read_parquet_from_s3,
-    read_tsv_from_s3,
-)
 
 logger = ingestion_logger()
 
 DATALAKE_INT_TYPES = {"int64", "INT"}
 
-DATALAKE_SUPPORTED_FILE_TYPES = (".csv", ".tsv", ".json", ".parquet")
-
 
 class DatalakeSource(DatabaseServiceSource):
     def __init__(self, config: WorkflowSource, metadata_config: OpenMetadataConnection):
@@ -86,6 +80,8 @@ class DatalakeSource(DatabaseServiceSource):
         self.client = self.connection.client
         self.table_constraints = None
         self.database_source_state = set()
+        # Object read to infer the schema of the partitioned tables
+        self.table_keys = {}
         super().__init__()
 
     @classmethod
@@ -154,11 +150,6 @@ class DatalakeSource(DatabaseServiceSource):
             database=EntityReference(id=self.context.database.id, type="database"),
         )
 
-    def _list_s3_objects(self, **kwargs) -> Iterable:
-        paginator = self.client.get_paginator("list_objects_v2")
-        for page in paginator.paginate(**kwargs):
-            yield from page["Contents"]
-
     def get_tables_name_and_type(self) -> Optional[Iterable[Tuple[str, str]]]:
         """
         Handle table and views.
@@ -168,47 +159,53 @@ class DatalakeSource(DatabaseServiceSource):
 
         :return: tables or views, depending on config
         """
+        if not self.source_config.includeTables:
+            return
+
         bucket_name = self.context.database_schema.name.__root__
         prefix = self.service_connection.prefix
-        if self.source_config.includeTables:
-            if isinstance(self.service_connection.configSource, GCSConfig):
-                bucket = self.client.get_bucket(bucket_name)
-                for key in bucket.list_blobs(prefix=prefix):
-                    if filter_by_table(
-                        self.config.sourceConfig.config.tableFilterPattern, key.name
-                    ):
-                        self.status.filter(
-                            "{}".format(key.name),
-                            "Object pattern not allowed",
-                        )
-                        continue
-                    if not self.check_valid_file_type(key.name):
-                        logger.debug(
-                            f"Object filtered due to unsupported file type: {key.name}"
-                        )
-                        continue
-                    table_name = self.standardize_table_name(bucket_name, key.name)
-                    yield table_name, TableType.Regular
-            if isinstance(self.service_connection.configSource, S3Config):
-                kwargs = {"Bucket": bucket_name}
-                if prefix:
-                    kwargs["Prefix"] = prefix if prefix.endswith("/") else f"{prefix}/"
-                for key in self._list_s3_objects(**kwargs):
-                    if filter_by_table(
-                        self.config.sourceConfig.config.tableFilterPattern, key["Key"]
-                    ):
-                        self.status.filter(
-                            "{}".format(key["Key"]),
-                            "Object pattern not allowed",
-                        )
-                        continue
-                    if not self.check_valid_file_type(key["Key"]):
-                        logger.debug(
-                            f"Object filtered due to unsupported file type: {key['Key']}"
-                        )
-                        continue
-                    table_name = self.standardize_table_name(bucket_name, key["Key"])
-                    yield table_name, TableType.Regular
+        if (
+            prefix
+            and isinstance(self.service_connection.configSource, S3Config)
+            and not prefix.endswith("/")
+        ):
+            prefix = f"{prefix}/"
+
+        partitioned_tables = set()
+        for key in list_keys(
+            self.client,
+            self.service_connection.configSource,
+            bucket_name,
+            prefix,
+            max_workers=self.max_workers,
+        ):
+            if not self.check_valid_file_type(key):
+                logger.debug(f"Object filtered due to unsupported file type: {key}")
+                continue
+
+            table_name = key
+            partitioned_table = (
+                get_partitioned_table(key)
+                if self.service_connection.groupPartitions
+                else None
+            )
+            if partitioned_table:
+                if partitioned_table in partitioned_tables:
+                    continue
+                partitioned_tables.add(partitioned_table)
+                self.table_keys[partitioned_table] = key
+                table_name = partitioned_table
+
+            if filter_by_table(
+                self.config.sourceConfig.config.tableFilterPattern, table_name
+            ):
+                self.status.filter(
+                    "{}".format(table_name),
+                    "Object pattern not allowed",
+                )
+                continue
+            table_name = self.standardize_table_name(bucket_name, table_name)
+            yield table_name, TableType.Regular
 
     def yield_table(
         self, table_name_and_type: Tuple[str, str]
@@ -221,10 +218,10 @@ class DatalakeSource(DatabaseServiceSource):
         schema_name = self.context.database_schema.name.__root__
         try:
             table_constraints = None
-            if isinstance(self.service_connection.configSource, GCSConfig):
-                df = self.get_gcs_files(key=table_name, bucket_name=schema_name)
-            if isinstance(self.service_connection.configSource, S3Config):
-                df = self.get_s3_files(key=table_name, bucket_name=schema_name)
+            df = self.get_object_schema(
+                key=self.table_keys.get(table_name, table_name),
+                bucket_name=schema_name,
+            )
             columns = self.get_columns(df)
             table_request = CreateTableRequest(
                 name=table_name,
@@ -243,41 +240,25 @@ class DatalakeSource(DatabaseServiceSource):
         except Exception as err:
             logger.debug(traceback.format_exc())
             logger.error(err)
-            self.status.failures.append(
-                "{}.{}".format(self.config.serviceName, table_name)
-            )
-
-    def get_gcs_files(self, key, bucket_name):
-        try:
-            if key.endswith(".csv"):
-                return read_csv_from_gcs(key, bucket_name)
+            with self.topology_lock:
+                self.status.failures.append(
+                    "{}.{}".format(self.config.serviceName, table_name)
+                )
 
-            if key.endswith(".tsv"):
-                return read_tsv_from_gcs(key, bucket_name)
-
-            if key.endswith(".json"):
-                return read_json_from_gcs(self.client, key, bucket_name)
-
-            if key.endswith(".parquet"):
-                return read_parquet_from_gcs(key, bucket_name)
-
-        except Exception as err:
-            logger.debug(traceback.format_exc())
-            logger.error(err)
-
-    def get_s3_files(self, key, bucket_name):
+    def get_object_schema(self, key, bucket_name):
+        """
+        Read the Parquet footer or the first rows of the object,
+        with range requests over the client of the source
+        """
         try:
-            if key.endswith(".csv"):
-                return read_csv_from_s3(self.client, key, bucket_name)
-
-            if key.endswith(".tsv"):
-                return read_tsv_from_s3(self.client, key, bucket_name)
-
-            if key.endswith(".json"):
-                return read_json_from_s3(self.client, key, bucket_name)
-
-            if key.endswith(".parquet"):
-                return read_parquet_from_s3(self.client, key, bucket_name)
+            with open_object(
+                self.client,
+                self.service_connection.configSource,
+                bucket_name,
+                key,
+                buffer_size=SCHEMA_BUFFER_SIZE,
+            ) as file:
+                return infer_schema(file, key)
 
         except Exception as err:
             logger.debug(traceback.format_exc())
@@ -247,9 +247,10 @@ class DeltalakeSource(DatabaseServiceSource):
         except Exception as err:
             logger.debug(traceback.format_exc())
             logger.error(err)
-            self.status.failures.append(
-                "{}.{}".format(self.config.serviceName, table_name)
-            )
+            with self.topology_lock:
+                self.status.failures.append(
+                    "{}.{}".format(self.config.serviceName, table_name)
+                )
 
     def get_status(self):
         return self.status
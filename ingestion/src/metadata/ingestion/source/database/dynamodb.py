@@ -185,9 +185,10 @@ class DynamodbSource(DatabaseServiceSource):
         except Exception as err:
             logger.debug(traceback.format_exc())
             logger.error(err)
-            self.status.failures.append(
-                "{}.{}".format(self.config.serviceName, table_name)
-            )
+            with self.topology_lock:
+                self.status.failures.append(
+                    "{}.{}".format(self.config.serviceName, table_name)
+                )
 
     def yield_view_lineage(self) -> Optional[Iterable[AddLineageRequest]]:
         yield from []
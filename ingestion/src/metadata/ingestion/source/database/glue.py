@@ -69,6 +69,8 @@ class GlueSource(DatabaseServiceSource):
         self.table_constraints = None
         self.database_source_state = set()
         super().__init__()
+        # The table location link needs the location acknowledged by the sink
+        self.max_workers = 1
 
     @classmethod
     def create(cls, config_dict, metadata_config: OpenMetadataConnection):
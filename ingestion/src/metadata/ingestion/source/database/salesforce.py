@@ -148,9 +148,10 @@ class SalesforceSource(DatabaseServiceSource):
         except Exception as err:
             logger.debug(traceback.format_exc())
             logger.error(err)
-            self.status.failures.append(
-                "{}.{}".format(self.config.serviceName, table_name)
-            )
+            with self.topology_lock:
+                self.status.failures.append(
+                    "{}.{}".format(self.config.serviceName, table_name)
+                )
 
     def yield_table(
         self, table_name_and_type: Tuple[str, str]
@@ -185,9 +186,10 @@ class SalesforceSource(DatabaseServiceSource):
         except Exception as err:
             logger.debug(traceback.format_exc())
             logger.error(err)
-            self.status.failures.append(
-                "{}.{}".format(self.config.serviceName, table_name)
-            )
+            with self.topology_lock:
+                self.status.failures.append(
+                    "{}.{}".format(self.config.serviceName, table_name)
+                )
 
     def get_columns(self, salesforce_fields):
         row_order = 1
@@ -0,0 +1,741 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Reflect the catalog of a whole schema in a few queries, and
+serve the per table lookups of the inspector from memory.
+
+Each dialect plugs in the catalog queries it supports. Anything
+that is not prefetched is still asked to the SQLAlchemy inspector.
+"""
+import re
+import threading
+import traceback
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.sql import sqltypes
+from sqlalchemy.types import TypeEngine
+
+from metadata.utils.logger import ingestion_logger
+
+logger = ingestion_logger()
+
+# Rows of the columns query:
+# table, column, data type, char length, precision, scale, nullable, default, comment
+INFORMATION_SCHEMA_COLUMNS = """
+SELECT table_name, column_name, data_type, character_maximum_length,
+       numeric_precision, numeric_scale, is_nullable, column_default, NULL
+FROM information_schema.columns
+WHERE table_schema = :schema
+ORDER BY table_name, ordinal_position
+"""
+
+# Rows of the constraints query: table, constraint, constraint type, column,
+# and the referred schema, table and column of the foreign keys
+INFORMATION_SCHEMA_CONSTRAINTS = """
+SELECT tc.table_name, tc.constraint_name, tc.constraint_type, kcu.column_name,
+       rkcu.table_schema, rkcu.table_name, rkcu.column_name
+FROM information_schema.table_constraints tc
+JOIN information_schema.key_column_usage kcu
+  ON kcu.constraint_schema = tc.constraint_schema
+ AND kcu.constraint_name = tc.constraint_name
+ AND kcu.table_name = tc.table_name
+LEFT JOIN information_schema.referential_constraints rc
+  ON rc.constraint_schema = tc.constraint_schema
+ AND rc.constraint_name = tc.constraint_name
+LEFT JOIN information_schema.key_column_usage rkcu
+  ON rkcu.constraint_schema = rc.unique_constraint_schema
+ AND rkcu.constraint_name = rc.unique_constraint_name
+ AND rkcu.ordinal_position = kcu.position_in_unique_constraint
+WHERE tc.table_schema = :schema
+  AND tc.constraint_type IN ('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')
+ORDER BY tc.table_name, tc.constraint_name, kcu.ordinal_position
+"""
+
+# Rows of the table comments and view definitions queries: table, text
+INFORMATION_SCHEMA_VIEWS = """
+SELECT table_name, view_definition
+FROM information_schema.views
+WHERE table_schema = :schema
+"""
+
+# Types built with a length
+SIZED_TYPES = (sqltypes.String, sqltypes._Binary)  # pylint: disable=protected-access
+
+COLUMNS = "columns"
+CONSTRAINTS = "constraints"
+TABLE_COMMENTS = "table_comments"
+VIEW_DEFINITIONS = "view_definitions"
+CHANGE_MARKERS = "change_markers"
+
+
+class SchemaCatalogReflector:
+    """
+    Reflect a schema catalog with information_schema queries.
+
+    Dialects override the queries, or set them to None to keep
+    using the inspector, and how data types are parsed.
+
+    The change markers query returns a value changing with the table
+    definition, e.g., its last DDL time, if the source keeps track of it.
+    """
+
+    columns_query: Optional[str] = INFORMATION_SCHEMA_COLUMNS
+    constraints_query: Optional[str] = INFORMATION_SCHEMA_CONSTRAINTS
+    table_comments_query: Optional[str] = None
+    view_definitions_query: Optional[str] = INFORMATION_SCHEMA_VIEWS
+    change_markers_query: Optional[str] = None
+
+    constraint_types = {
+        "PRIMARY KEY": "PRIMARY KEY",
+        "UNIQUE": "UNIQUE",
+        "FOREIGN KEY": "FOREIGN KEY",
+    }
+
+    def __init__(self, dialect: Dialect) -> None:
+        self.dialect = dialect
+
+    def supports(self, kind: str) -> bool:
+        return getattr(self, f"{kind}_query") is not None
+
+    def normalize_name(self, name: Optional[str]) -> Optional[str]:
+        """
+        Apply the dialect name normalization, e.g., Oracle
+        and Snowflake return upper case names by default
+        """
+        if name is not None and self.dialect.requires_name_normalize:
+            return self.dialect.normalize_name(name)
+        return name
+
+    def denormalize_name(self, name: str) -> str:
+        if self.dialect.requires_name_normalize:
+            return self.dialect.denormalize_name(name)
+        return name
+
+    def _execute(self, connection: Connection, query: str, schema: str) -> List:
+        return connection.execute(
+            text(query), {"schema": self.denormalize_name(schema)}
+        ).fetchall()
+
+    def get_raw_data_type(  # pylint: disable=unused-argument
+        self, data_type: str
+    ) -> Optional[str]:
+        """
+        Source type passed along the parsed one, as the dialect
+        does to build the children of complex types
+        """
+        return None
+
+    def get_column_type(  # pylint: disable=too-many-arguments
+        self,
+        data_type: str,
+        char_length: Optional[int],
+        precision: Optional[int],
+        scale: Optional[int],
+    ) -> Optional[TypeEngine]:
+        """
+        Build the SQLAlchemy type from the names known by the dialect.
+        Returns None if the type cannot be resolved.
+        """
+        type_class = None
+        for type_name in (data_type, data_type.lower(), data_type.upper()):
+            type_class = self.dialect.ischema_names.get(type_name)
+            if type_class is not None:
+                break
+        if type_class is None:
+            return None
+
+        try:
+            if issubclass(type_class, sqltypes.Numeric) and precision is not None:
+                return type_class(precision=precision, scale=scale)
+            if issubclass(type_class, SIZED_TYPES) and char_length and char_length > 0:
+                return type_class(length=char_length)
+            return type_class()
+        except TypeError:
+            return None
+
+    def reflect_columns(
+        self, connection: Connection, schema: str
+    ) -> Dict[str, List[dict]]:
+        """
+        Columns of the tables in the format of Inspector.get_columns.
+        Tables with any type we cannot resolve are left out, so
+        that the dialect reflects them.
+        """
+        columns: Dict[str, List[dict]] = {}
+        unresolved = set()
+        for row in self._execute(connection, self.columns_query, schema):
+            (
+                table_name,
+                column_name,
+                data_type,
+                char_length,
+                precision,
+                scale,
+                nullable,
+                default,
+                comment,
+            ) = row
+            table_name = self.normalize_name(table_name)
+            col_type = self.get_column_type(data_type, char_length, precision, scale)
+            if col_type is None:
+                unresolved.add(table_name)
+                continue
+            column = {
+                "name": self.normalize_name(column_name),
+                "type": col_type,
+                "nullable": str(nullable).upper() in ("YES", "Y", "TRUE"),
+                "default": default,
+                "comment": comment or None,
+            }
+            raw_data_type = self.get_raw_data_type(data_type)
+            if raw_data_type:
+                column["raw_data_type"] = raw_data_type
+            columns.setdefault(table_name, []).append(column)
+        for table_name in unresolved:
+            logger.debug(f"Unresolved column types for {table_name}")
+            columns.pop(table_name, None)
+        return columns
+
+    def add_constraint_column(  # pylint: disable=too-many-arguments
+        self,
+        constraints: Dict[str, Dict[str, dict]],
+        table_name: str,
+        constraint_type: str,
+        constraint_name: str,
+        column_name: str,
+        referred_schema: Optional[str] = None,
+        referred_table: Optional[str] = None,
+        referred_column: Optional[str] = None,
+    ) -> None:
+        """
+        Add a column, and the column it refers to for
+        foreign keys, to the constraints of a table
+        """
+        constraint = (
+            constraints.setdefault(self.normalize_name(table_name), {})
+            .setdefault(constraint_type, {})
+            .setdefault(
+                self.normalize_name(constraint_name),
+                {
+                    "columns": [],
+                    "referred_schema": self.normalize_name(referred_schema),
+                    "referred_table": self.normalize_name(referred_table),
+                    "referred_columns": [],
+                },
+            )
+        )
+        constraint["columns"].append(self.normalize_name(column_name))
+        if referred_column is not None:
+            constraint["referred_columns"].append(self.normalize_name(referred_column))
+
+    def reflect_constraints(
+        self, connection: Connection, schema: str
+    ) -> Dict[str, Dict[str, dict]]:
+        """
+        Constraints by table, as {"PRIMARY KEY": {name: constraint}, ...}
+        """
+        constraints: Dict[str, Dict[str, dict]] = {}
+        for (
+            table_name,
+            constraint_name,
+            constraint_type,
+            column_name,
+            referred_schema,
+            referred_table,
+            referred_column,
+        ) in self._execute(connection, self.constraints_query, schema):
+            constraint_type = self.constraint_types.get(constraint_type)
+            if constraint_type is None:
+                continue
+            self.add_constraint_column(
+                constraints,
+                table_name,
+                constraint_type,
+                constraint_name,
+                column_name,
+                referred_schema,
+                referred_table,
+                referred_column,
+            )
+        return constraints
+
+    def reflect_table_comments(
+        self, connection: Connection, schema: str
+    ) -> Dict[str, dict]:
+        return {
+            self.normalize_name(table_name): {"text": comment or None}
+            for table_name, comment in self._execute(
+                connection, self.table_comments_query, schema
+            )
+        }
+
+    def reflect_view_definitions(
+        self, connection: Connection, schema: str
+    ) -> Dict[str, Optional[str]]:
+        return {
+            self.normalize_name(view_name): definition
+            for view_name, definition in self._execute(
+                connection, self.view_definitions_query, schema
+            )
+        }
+
+    def reflect_change_markers(
+        self, connection: Connection, schema: str
+    ) -> Dict[str, str]:
+        return {
+            self.normalize_name(table_name): str(marker)
+            for table_name, marker in self._execute(
+                connection, self.change_markers_query, schema
+            )
+            if marker is not None
+        }
+
+    def reflect(self, kind: str, connection: Connection, schema: str) -> Dict:
+        return getattr(self, f"reflect_{kind}")(connection, schema)
+
+
+class PostgresCatalogReflector(SchemaCatalogReflector):
+    """
+    Comments and view definitions come from pg_catalog, as the
+    dialect does, since information_schema only shows the
+    definitions of the views we own.
+    """
+
+    columns_query = """
+    SELECT c.table_name, c.column_name, c.data_type, c.character_maximum_length,
+           c.numeric_precision, c.numeric_scale, c.is_nullable, c.column_default,
+           d.description
+    FROM information_schema.columns c
+    LEFT JOIN pg_catalog.pg_namespace n ON n.nspname = c.table_schema
+    LEFT JOIN pg_catalog.pg_class cl
+      ON cl.relnamespace = n.oid AND cl.relname = c.table_name
+    LEFT JOIN pg_catalog.pg_description d
+      ON d.objoid = cl.oid
+     AND d.classoid = 'pg_catalog.pg_class'::regclass
+     AND d.objsubid = c.ordinal_position
+    WHERE c.table_schema = :schema
+    ORDER BY c.table_name, c.ordinal_position
+    """
+
+    table_comments_query = """
+    SELECT c.relname, pg_catalog.obj_description(c.oid, 'pg_class')
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = :schema AND c.relkind IN ('r', 'p', 'f', 'v', 'm')
+    """
+
+    view_definitions_query = """
+    SELECT c.relname, pg_catalog.pg_get_viewdef(c.oid)
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = :schema AND c.relkind IN ('v', 'm')
+    """
+
+
+class MySQLCatalogReflector(SchemaCatalogReflector):
+    """
+    Views are left to the dialect, which returns the
+    whole CREATE VIEW statement instead of its body.
+    """
+
+    columns_query = """
+    SELECT table_name, column_name, data_type, character_maximum_length,
+           numeric_precision, numeric_scale, is_nullable, column_default,
+           column_comment
+    FROM information_schema.columns
+    WHERE table_schema = :schema
+    ORDER BY table_name, ordinal_position
+    """
+
+    # Constraint names are only unique per table, and
+    # the referred columns are in key_column_usage
+    constraints_query = """
+    SELECT tc.table_name, tc.constraint_name, tc.constraint_type, kcu.column_name,
+           kcu.referenced_table_schema, kcu.referenced_table_name,
+           kcu.referenced_column_name
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage kcu
+      ON kcu.constraint_schema = tc.constraint_schema
+     AND kcu.constraint_name = tc.constraint_name
+     AND kcu.table_name = tc.table_name
+    WHERE tc.table_schema = :schema
+      AND tc.constraint_type IN ('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')
+    ORDER BY tc.table_name, tc.constraint_name, kcu.ordinal_position
+    """
+
+    table_comments_query = """
+    SELECT table_name, CASE WHEN table_type = 'VIEW' THEN NULL ELSE table_comment END
+    FROM information_schema.tables
+    WHERE table_schema = :schema
+    """
+
+    view_definitions_query = None
+
+
+class SnowflakeCatalogReflector(SchemaCatalogReflector):
+    """
+    Snowflake does not have key_column_usage,
+    so constraints come from SHOW commands.
+    """
+
+    columns_query = """
+    SELECT table_name, column_name, data_type, character_maximum_length,
+           numeric_precision, numeric_scale, is_nullable, column_default, comment
+    FROM information_schema.columns
+    WHERE table_schema = :schema
+    ORDER BY table_name, ordinal_position
+    """
+
+    constraints_query = "SHOW {keys} IN SCHEMA {schema}"
+
+    table_comments_query = """
+    SELECT table_name, comment
+    FROM information_schema.tables
+    WHERE table_schema = :schema
+    """
+
+    change_markers_query = """
+    SELECT table_name, last_altered
+    FROM information_schema.tables
+    WHERE table_schema = :schema
+    """
+
+    def reflect_constraints(
+        self, connection: Connection, schema: str
+    ) -> Dict[str, Dict[str, dict]]:
+        quoted_schema = self.dialect.identifier_preparer.quote_identifier(
+            self.denormalize_name(schema)
+        )
+        constraints: Dict[str, Dict[str, dict]] = {}
+        for keys, constraint_type, prefix, name_column in (
+            ("PRIMARY KEYS", "PRIMARY KEY", "", "constraint_name"),
+            ("UNIQUE KEYS", "UNIQUE", "", "constraint_name"),
+            ("IMPORTED KEYS", "FOREIGN KEY", "fk_", "fk_name"),
+        ):
+            rows = connection.execute(
+                text(self.constraints_query.format(keys=keys, schema=quoted_schema))
+            )
+            for row in sorted(rows, key=lambda row: row._mapping["key_sequence"]):
+                mapping = row._mapping
+                referred = (
+                    (
+                        mapping["pk_schema_name"],
+                        mapping["pk_table_name"],
+                        mapping["pk_column_name"],
+                    )
+                    if prefix
+                    else ()
+                )
+                self.add_constraint_column(
+                    constraints,
+                    mapping[f"{prefix}table_name"],
+                    constraint_type,
+                    mapping[name_column],
+                    mapping[f"{prefix}column_name"],
+                    *referred,
+                )
+        return constraints
+
+
+class MSSQLCatalogReflector(SchemaCatalogReflector):
+    """
+    information_schema.views truncates the definitions,
+    so we read them from sys.sql_modules. Table comments
+    are not supported by the dialect.
+    """
+
+    view_definitions_query = """
+    SELECT v.name, m.definition
+    FROM sys.views v
+    JOIN sys.schemas s ON s.schema_id = v.schema_id
+    JOIN sys.sql_modules m ON m.object_id = v.object_id
+    WHERE s.name = :schema
+    """
+
+    change_markers_query = """
+    SELECT o.name, o.modify_date
+    FROM sys.objects o
+    JOIN sys.schemas s ON s.schema_id = o.schema_id
+    WHERE s.name = :schema AND o.type IN ('U', 'V')
+    """
+
+
+class OracleCatalogReflector(SchemaCatalogReflector):
+    """
+    Read the ALL_* dictionary views of the schema owner
+    """
+
+    columns_query = """
+    SELECT c.table_name, c.column_name, c.data_type, c.char_length,
+           c.data_precision, c.data_scale, c.nullable, NULL, cc.comments
+    FROM all_tab_columns c
+    LEFT JOIN all_col_comments cc
+      ON cc.owner = c.owner
+     AND cc.table_name = c.table_name
+     AND cc.column_name = c.column_name
+    WHERE c.owner = :schema
+    ORDER BY c.table_name, c.column_id
+    """
+
+    constraints_query = """
+    SELECT c.table_name, c.constraint_name, c.constraint_type, cc.column_name,
+           rc.owner, rc.table_name, rcc.column_name
+    FROM all_constraints c
+    JOIN all_cons_columns cc
+      ON cc.owner = c.owner
+     AND cc.constraint_name = c.constraint_name
+     AND cc.table_name = c.table_name
+    LEFT JOIN all_constraints rc
+      ON rc.owner = c.r_owner
+     AND rc.constraint_name = c.r_constraint_name
+    LEFT JOIN all_cons_columns rcc
+      ON rcc.owner = rc.owner
+     AND rcc.constraint_name = rc.constraint_name
+     AND rcc.position = cc.position
+    WHERE c.owner = :schema AND c.constraint_type IN ('P', 'U', 'R')
+    ORDER BY c.table_name, c.constraint_name, cc.position
+    """
+
+    table_comments_query = """
+    SELECT table_name, comments FROM all_tab_comments WHERE owner = :schema
+    """
+
+    view_definitions_query = """
+    SELECT view_name, text FROM all_views WHERE owner = :schema
+    """
+
+    change_markers_query = """
+    SELECT object_name, last_ddl_time FROM all_objects
+    WHERE owner = :schema AND object_type IN ('TABLE', 'VIEW', 'MATERIALIZED VIEW')
+    """
+
+    constraint_types = {"P": "PRIMARY KEY", "U": "UNIQUE", "R": "FOREIGN KEY"}
+
+    def get_column_type(
+        self,
+        data_type: str,
+        char_length: Optional[int],
+        precision: Optional[int],
+        scale: Optional[int],
+    ) -> Optional[TypeEngine]:
+        # e.g., TIMESTAMP(6) WITH TIME ZONE
+        data_type = re.sub(r"\(\d+\)", "", data_type)
+        if data_type == "NUMBER" and precision is None and scale == 0:
+            return sqltypes.INTEGER()
+        return super().get_column_type(data_type, char_length, precision, scale)
+
+
+class TrinoCatalogReflector(SchemaCatalogReflector):
+    """
+    Trino has no constraints. Types are parsed as the patched dialect
+    does, keeping the raw row and array types to build their children.
+    Comments and view definitions are left to the dialect.
+    """
+
+    columns_query = """
+    SELECT table_name, column_name, data_type, NULL, NULL, NULL,
+           is_nullable, column_default, comment
+    FROM information_schema.columns
+    WHERE table_schema = :schema
+    ORDER BY table_name, ordinal_position
+    """
+
+    view_definitions_query = None
+
+    def get_column_type(
+        self,
+        data_type: str,
+        char_length: Optional[int],
+        precision: Optional[int],
+        scale: Optional[int],
+    ) -> Optional[TypeEngine]:
+        from trino.sqlalchemy.datatype import (  # pylint: disable=import-outside-toplevel
+            parse_sqltype,
+        )
+
+        return parse_sqltype(data_type)
+
+    def get_raw_data_type(self, data_type: str) -> Optional[str]:
+        from metadata.ingestion.source.database.trino import (  # pylint: disable=import-outside-toplevel
+            get_raw_data_type,
+        )
+
+        return get_raw_data_type(data_type)
+
+    def reflect_constraints(
+        self, connection: Connection, schema: str
+    ) -> Dict[str, Dict[str, dict]]:
+        return {}
+
+
+SCHEMA_CATALOG_REFLECTORS: Dict[str, Type[SchemaCatalogReflector]] = {
+    "postgresql": PostgresCatalogReflector,
+    "mysql": MySQLCatalogReflector,
+    "mariadb": MySQLCatalogReflector,
+    "snowflake": SnowflakeCatalogReflector,
+    "mssql": MSSQLCatalogReflector,
+    "oracle": OracleCatalogReflector,
+    "trino": TrinoCatalogReflector,
+}
+
+
+def get_schema_catalog_reflector(
+    dialect: Dialect,
+) -> Optional[SchemaCatalogReflector]:
+    """
+    Return the reflector plugged in for the dialect, if any
+    """
+    reflector_class = SCHEMA_CATALOG_REFLECTORS.get(dialect.name)
+    return reflector_class(dialect) if reflector_class else None
+
+
+class SchemaCatalogInspector:
+    """
+    Wrap an inspector to answer the table lookups of a schema from
+    its prefetched catalog. Each kind of information is reflected
+    on its first lookup and kept for the lifetime of the object.
+
+    Lookups of other schemas, of tables missing from the catalog
+    and any other inspector method go to the wrapped inspector.
+    """
+
+    def __init__(
+        self, inspector: Inspector, reflector: SchemaCatalogReflector, schema: str
+    ) -> None:
+        self.inspector = inspector
+        self.reflector = reflector
+        self.schema = schema
+        self._catalog: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inspector, name)
+
+    def _reflect(self, kind: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if kind not in self._catalog:
+                self._catalog[kind] = None
+                if self.reflector.supports(kind):
+                    try:
+                        with self.inspector.bind.connect() as connection:
+                            self._catalog[kind] = self.reflector.reflect(
+                                kind, connection, self.schema
+                            )
+                        logger.debug(
+                            f"Prefetched {kind} of {len(self._catalog[kind])}"
+                            f" tables in schema {self.schema}"
+                        )
+                    except Exception as exc:  # pylint: disable=broad-except
+                        logger.debug(traceback.format_exc())
+                        logger.warning(
+                            f"Could not prefetch {kind} of schema {self.schema}: {exc}"
+                        )
+            return self._catalog[kind]
+
+    def _lookup(
+        self,
+        kind: str,
+        table_name: str,
+        schema: Optional[str],
+        fallback: Callable[[], Any],
+        default: Callable[[], Any] = None,
+    ) -> Any:
+        """
+        Find the table in the catalog. If the catalog has been
+        reflected but does not know the table, return the `default`
+        when given, e.g., tables without constraints.
+        """
+        if schema == self.schema:
+            catalog = self._reflect(kind)
+            if catalog is not None:
+                if table_name in catalog:
+                    return catalog[table_name]
+                if default is not None:
+                    return default()
+        return fallback()
+
+    def get_columns(self, table_name: str, schema: str = None, **kw) -> List[dict]:
+        return self._lookup(
+            COLUMNS,
+            table_name,
+            schema,
+            lambda: self.inspector.get_columns(table_name, schema, **kw),
+        )
+
+    def _get_constraints(self, table_name: str, schema: str, constraint_type: str):
+        constraints = self._lookup(
+            CONSTRAINTS, table_name, schema, fallback=lambda: None, default=dict
+        )
+        if constraints is None:
+            return None
+        return constraints.get(constraint_type, {})
+
+    def get_pk_constraint(self, table_name: str, schema: str = None, **kw) -> dict:
+        constraints = self._get_constraints(table_name, schema, "PRIMARY KEY")
+        if constraints is None:
+            return self.inspector.get_pk_constraint(table_name, schema, **kw)
+        for name, constraint in constraints.items():
+            return {"name": name, "constrained_columns": constraint["columns"]}
+        return {"name": None, "constrained_columns": []}
+
+    def get_unique_constraints(
+        self, table_name: str, schema: str = None, **kw
+    ) -> List[dict]:
+        constraints = self._get_constraints(table_name, schema, "UNIQUE")
+        if constraints is None:
+            return self.inspector.get_unique_constraints(table_name, schema, **kw)
+        return [
+            {"name": name, "column_names": constraint["columns"]}
+            for name, constraint in constraints.items()
+        ]
+
+    def get_foreign_keys(self, table_name: str, schema: str = None, **kw) -> List[dict]:
+        constraints = self._get_constraints(table_name, schema, "FOREIGN KEY")
+        if constraints is None:
+            return self.inspector.get_foreign_keys(table_name, schema, **kw)
+        return [
+            {
+                "name": name,
+                "constrained_columns": constraint["columns"],
+                "referred_schema": constraint["referred_schema"],
+                "referred_table": constraint["referred_table"],
+                "referred_columns": constraint["referred_columns"],
+            }
+            for name, constraint in constraints.items()
+        ]
+
+    def get_table_comment(self, table_name: str, schema: str = None, **kw) -> dict:
+        return self._lookup(
+            TABLE_COMMENTS,
+            table_name,
+            schema,
+            lambda: self.inspector.get_table_comment(table_name, schema, **kw),
+            default=lambda: {"text": None},
+        )
+
+    def get_view_definition(
+        self, view_name: str, schema: str = None, **kw
+    ) -> Optional[str]:
+        return self._lookup(
+            VIEW_DEFINITIONS,
+            view_name,
+            schema,
+            lambda: self.inspector.get_view_definition(view_name, schema, **kw),
+        )
+
+    def get_change_marker(self, table_name: str, schema: str = None) -> Optional[str]:
+        """
+        Value changing with the table definition, if the source has it
+        """
+        return self._lookup(CHANGE_MARKERS, table_name, schema, lambda: None)
@@ -13,6 +13,7 @@ from typing import Iterable
 
 from snowflake.sqlalchemy.custom_types import VARIANT
 from snowflake.sqlalchemy.snowdialect import SnowflakeDialect, ischema_names
+from sqlalchemy import event
 from sqlalchemy.engine import reflection
 
 from metadata.generated.schema.api.tags.createTag import CreateTagRequest
@@ -134,15 +135,26 @@ class SnowflakeSource(CommonDbSourceService):
 
     def set_session_query_tag(self) -> None:
         """
-        Method to set query tag for current session
+        Method to set query tag for every session of the engine,
+        as the tables can be described by several workers, each
+        with its own pooled connection
         """
         if self.service_connection.queryTag:
-            self.engine.execute(
-                SNOWFLAKE_SESSION_TAG_QUERY.format(
-                    query_tag=self.service_connection.queryTag
-                )
+            query_tag = SNOWFLAKE_SESSION_TAG_QUERY.format(
+                query_tag=self.service_connection.queryTag
             )
 
+            def set_query_tag(dbapi_connection, _):
+                cursor = dbapi_connection.cursor()
+                try:
+                    cursor.execute(query_tag)
+                finally:
+                    cursor.close()
+
+            event.listen(self.engine, "connect", set_query_tag)
+            # Connections opened before the listener would miss the tag
+            self.engine.dispose()
+
     def get_database_names(self) -> Iterable[str]:
         configured_db = self.config.serviceConnection.__root__.config.database
         if configured_db:
@@ -93,6 +93,20 @@ def parse_row_data_type(type_str: str) -> str:
     return final[:-1] + ">"
 
 
+def get_raw_data_type(data_type: str) -> Optional[str]:
+    """
+    Return the OpenMetadata format of the complex row and array types,
+    from which we build the column children, or None for other types
+    """
+    type_str = data_type.strip().lower()
+    type_name, type_opts = get_type_name_and_opts(type_str)
+    if type_opts and type_name == ROW_DATA_TYPE:
+        return parse_row_data_type(type_str)
+    if type_opts and type_name == ARRAY_DATA_TYPE:
+        return parse_array_data_type(type_str)
+    return None
+
+
 def _get_columns(
     self, connection: Connection, table_name: str, schema: str = None, **kw
 ) -> List[Dict[str, Any]]:
@@ -109,12 +123,9 @@ def _get_columns(
             nullable=record.is_nullable == "YES",
             default=record.column_default,
         )
-        type_str = record.data_type.strip().lower()
-        type_name, type_opts = get_type_name_and_opts(type_str)
-        if type_opts and type_name == ROW_DATA_TYPE:
-            column["raw_data_type"] = parse_row_data_type(type_str)
-        elif type_opts and type_name == ARRAY_DATA_TYPE:
-            column["raw_data_type"] = parse_array_data_type(type_str)
+        raw_data_type = get_raw_data_type(record.data_type)
+        if raw_data_type:
+            column["raw_data_type"] = raw_data_type
         columns.append(column)
     return columns
 
@@ -10,7 +10,11 @@
 #  limitations under the License.
 """Metadata source module"""
 
-from typing import Iterable, List
+import queue
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple, Type
 
 from metadata.generated.schema.entity.data.dashboard import Dashboard
 from metadata.generated.schema.entity.data.glossary import Glossary
@@ -39,6 +43,10 @@ from metadata.utils.logger import ingestion_logger
 
 logger = ingestion_logger()
 
+# Seconds waited by the exporting threads before checking
+# if the export was stopped while the page queue is full
+PAGE_QUEUE_TIMEOUT = 1
+
 
 class MetadataSourceStatus(SourceStatus):
 
@@ -71,12 +79,15 @@ class MetadataSource(Source[Entity]):
         super().__init__()
         self.config = config
         self.metadata_config = metadata_config
-        self.metadata = OpenMetadata(metadata_config)
         self.service_connection = config.serviceConnection.__root__.config
+        self.raw_data = bool(getattr(self.service_connection, "rawData", False))
+        self.metadata = OpenMetadata(metadata_config, raw_data=self.raw_data)
         self.status = MetadataSourceStatus()
         self.wrote_something = False
         self.tables = None
         self.topics = None
+        self.thread_count = max(self.service_connection.threadCount or 1, 1)
+        self.prefetch_pages = max(self.service_connection.prefetchPages or 1, 1)
 
     def prepare(self):
         pass
@@ -85,117 +96,165 @@ class MetadataSource(Source[Entity]):
     def create(cls, config_dict, metadata_config: OpenMetadataConnection):
         raise NotImplementedError("Create Method not implemented")
 
-    def next_record(self) -> Iterable[Entity]:
+    def get_entity_types(self) -> List[Tuple[Type[Entity], List[str]]]:
+        """
+        Entity types to export, with the fields to fetch for each of them
+        """
+        entity_types = []
         if self.service_connection.includeTables:
-            yield from self.fetch_entities(
-                entity_class=Table,
-                fields=[
-                    "columns",
-                    "tableConstraints",
-                    "usageSummary",
-                    "owner",
-                    "tags",
-                    "followers",
-                ],
+            entity_types.append(
+                (
+                    Table,
+                    [
+                        "columns",
+                        "tableConstraints",
+                        "usageSummary",
+                        "owner",
+                        "tags",
+                        "followers",
+                    ],
+                )
             )
         if self.service_connection.includeTopics:
-            yield from self.fetch_entities(
-                entity_class=Topic,
-                fields=["owner", "tags", "followers"],
-            )
+            entity_types.append((Topic, ["owner", "tags", "followers"]))
         if self.service_connection.includeDashboards:
-            yield from self.fetch_entities(
-                entity_class=Dashboard,
-                fields=[
-                    "owner",
-                    "tags",
-                    "followers",
-                    "charts",
-                    "usageSummary",
-                ],
+            entity_types.append(
+                (
+                    Dashboard,
+                    [
+                        "owner",
+                        "tags",
+                        "followers",
+                        "charts",
+                        "usageSummary",
+                    ],
+                )
             )
 
         if self.service_connection.includePipelines:
-            yield from self.fetch_entities(
-                entity_class=Pipeline,
-                fields=["owner", "tags", "followers", "tasks"],
-            )
+            entity_types.append((Pipeline, ["owner", "tags", "followers", "tasks"]))
         if self.service_connection.includeMlModels:
-            yield from self.fetch_entities(
-                entity_class=MlModel,
-                fields=["owner", "tags", "followers"],
-            )
+            entity_types.append((MlModel, ["owner", "tags", "followers"]))
         if self.service_connection.includeUsers:
-            yield from self.fetch_entities(
-                entity_class=User,
-                fields=["teams", "roles"],
-            )
+            entity_types.append((User, ["teams", "roles"]))
 
         if self.service_connection.includeTeams:
-            yield from self.fetch_entities(
-                entity_class=Team,
-                fields=["users", "owns"],
-            )
+            entity_types.append((Team, ["users", "owns"]))
 
         if self.service_connection.includeGlossaryTerms:
-            yield from self.fetch_entities(
-                entity_class=GlossaryTerm,
-                fields=[],
-            )
-            yield from self.fetch_entities(
-                entity_class=Glossary,
-                fields=["owner", "tags", "reviewers", "usageCount"],
+            entity_types.append((GlossaryTerm, []))
+            entity_types.append(
+                (Glossary, ["owner", "tags", "reviewers", "usageCount"])
             )
 
         if self.service_connection.includePolicy:
-            yield from self.fetch_entities(
-                entity_class=Policy,
-                fields=[],
-            )
+            entity_types.append((Policy, []))
         if self.service_connection.includeTags:
-            yield from self.fetch_entities(
-                entity_class=TagCategory,
-                fields=[],
-            )
+            entity_types.append((TagCategory, []))
 
         if self.service_connection.includeMessagingServices:
-            yield from self.fetch_entities(
-                entity_class=MessagingService,
-                fields=["owner"],
-            )
+            entity_types.append((MessagingService, ["owner"]))
 
         if self.service_connection.includeDatabaseServices:
-            yield from self.fetch_entities(
-                entity_class=DatabaseService,
-                fields=["owner"],
-            )
+            entity_types.append((DatabaseService, ["owner"]))
 
         if self.service_connection.includePipelineServices:
-            yield from self.fetch_entities(
-                entity_class=PipelineService,
-                fields=["owner"],
-            )
+            entity_types.append((PipelineService, ["owner"]))
+        return entity_types
+
+    def next_record(self) -> Iterable[Entity]:
+        yield from self.export_entities(self.get_entity_types())
 
     def fetch_entities(self, entity_class, fields):
-        try:
-            after = None
-            while True:
-                entities_list = self.metadata.list_entities(
-                    entity=entity_class,
-                    fields=fields,
-                    after=after,
-                    limit=self.service_connection.limitRecords,
-                )
-                for entity in entities_list.entities:
-                    self.status.scanned_entity(entity_class.__name__, entity.name)
-                    yield entity
-                if entities_list.after is None:
-                    break
+        yield from self.export_entities([(entity_class, fields)])
+
+    def fetch_pages(self, entity_class: Type[Entity], fields: List[str]) -> Iterable:
+        """
+        Pages of entities, as models or as the dictionaries
+        of the API response in raw data mode
+        """
+        after = None
+        while True:
+            entities_list = self.metadata.list_entities(
+                entity=entity_class,
+                fields=fields,
+                after=after,
+                limit=self.service_connection.limitRecords,
+            )
+            if self.raw_data:
+                yield entities_list["data"]
+                after = entities_list["paging"].get("after")
+            else:
+                yield entities_list.entities
                 after = entities_list.after
+            if after is None:
+                break
+
+    def _put_page(self, pages: queue.Queue, item, stop: threading.Event) -> bool:
+        """
+        Wait for room in the queue, unless the export is stopped
+        """
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=PAGE_QUEUE_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _export_pages(
+        self,
+        entity_class: Type[Entity],
+        fields: List[str],
+        pages: queue.Queue,
+        stop: threading.Event,
+    ) -> None:
+        """
+        Fetch the pages of an entity type into the queue,
+        ending with an empty item once they are all listed
+        """
+        try:
+            for page in self.fetch_pages(entity_class, fields):
+                if not self._put_page(pages, (entity_class, page), stop):
+                    return
+        except Exception as err:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.error(f"Fetching entities failed for {entity_class.__name__}: {err}")
+        self._put_page(pages, (entity_class, None), stop)
+
+    def export_entities(
+        self, entity_types: List[Tuple[Type[Entity], List[str]]]
+    ) -> Iterable[Entity]:
+        """
+        Export the entity types in `thread_count` threads. Each thread
+        fetches the next pages of its type while the previous ones are
+        sent to the sink, keeping at most `prefetch_pages` pages waiting.
+        """
+        pages: queue.Queue = queue.Queue(maxsize=self.prefetch_pages)
+        stop = threading.Event()
+        with ThreadPoolExecutor(max_workers=self.thread_count) as executor:
+            for entity_class, fields in entity_types:
+                executor.submit(self._export_pages, entity_class, fields, pages, stop)
+            try:
+                pending = len(entity_types)
+                while pending:
+                    entity_class, page = pages.get()
+                    if page is None:
+                        pending -= 1
+                        continue
+                    for entity in page:
+                        self.status.scanned_entity(
+                            entity_class.__name__, self._get_name(entity)
+                        )
+                        yield entity
+            finally:
+                stop.set()
 
-        except Exception as err:
-            logger.debug(err)
-            logger.error(f"Fetching entities failed for {entity_class.__name__}")
+    @staticmethod
+    def _get_name(entity) -> Optional[str]:
+        if isinstance(entity, dict):
+            return entity.get("name")
+        return entity.name
 
     def get_status(self) -> SourceStatus:
         return self.status
@@ -9,17 +9,17 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import json
 import os
 import shutil
 import traceback
+from typing import Dict, Tuple
 
 from metadata.config.common import ConfigModel
 from metadata.generated.schema.entity.data.table import SqlQuery
 from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
     OpenMetadataConnection,
 )
-from metadata.generated.schema.type.queryParserData import QueryParserData
+from metadata.generated.schema.type.queryParserData import ParsedData, QueryParserData
 from metadata.generated.schema.type.tableUsageCount import TableUsageCount
 from metadata.ingestion.api.stage import Stage, StageStatus
 from metadata.utils.logger import ingestion_logger
@@ -29,9 +29,21 @@ logger = ingestion_logger()
 
 class TableStageConfig(ConfigModel):
     filename: str
+    # Number of staged queries aggregated in memory before
+    # writing them to a new sorted file of each partition
+    max_staged_queries: int = 100000
 
 
 class TableUsageStage(Stage[QueryParserData]):
+    """
+    Aggregate the usage of each table and date during the whole run.
+
+    The usage is written in partitions, one directory per service and date,
+    whenever the number of staged queries reaches `max_staged_queries` and on
+    close. Each file has one JSON line per table, sorted by table name, so that
+    the bulk sink can merge the files of a partition while streaming them.
+    """
+
     config: TableStageConfig
     status: StageStatus
 
@@ -43,8 +55,9 @@ class TableUsageStage(Stage[QueryParserData]):
         self.config = config
         self.metadata_config = metadata_config
         self.status = StageStatus()
-        self.table_usage = {}
-        self.table_queries = {}
+        self.table_usage: Dict[Tuple[str, str], TableUsageCount] = {}
+        self.staged_queries = 0
+        self.spills = 0
         isdir = os.path.isdir(self.config.filename)
         if not isdir:
             os.mkdir(self.config.filename)
@@ -58,65 +71,77 @@ class TableUsageStage(Stage[QueryParserData]):
         config = TableStageConfig.parse_obj(config_dict)
         return cls(config, metadata_config)
 
-    def _add_sql_query(self, record, table):
-        if self.table_queries.get((table, record.date)):
-            self.table_queries[(table, record.date)].append(SqlQuery(query=record.sql))
-        else:
-            self.table_queries[(table, record.date)] = [SqlQuery(query=record.sql)]
+    def _add_table_usage(self, record: ParsedData, table: str) -> None:
+        """
+        Add the query to the usage of the table on the query date
+        """
+        table_usage_count = self.table_usage.get((table, record.date))
+        if table_usage_count is None:
+            table_usage_count = TableUsageCount(
+                table=table,
+                databaseName=record.databaseName,
+                date=record.date,
+                count=0,
+                joins=[],
+                serviceName=record.serviceName,
+                sqlQueries=[],
+                databaseSchema=record.databaseSchema,
+            )
+            self.table_usage[(table, record.date)] = table_usage_count
+
+        table_usage_count.count += 1
+        table_usage_count.sqlQueries.append(SqlQuery(query=record.sql))
+        table_joins = record.joins.get(table)
+        if table_joins:
+            table_usage_count.joins.extend(table_joins)
 
     def stage_record(self, data: QueryParserData) -> None:
         if not data or not data.parsedData:
             return
-        self.table_usage = {}
-        self.table_queries = {}
         for record in data.parsedData:
             if record is None:
                 continue
             for table in record.tables:
-                table_joins = record.joins.get(table)
                 try:
-                    self._add_sql_query(record=record, table=table)
-                    table_usage_count = self.table_usage.get((table, record.date))
-                    if table_usage_count is not None:
-                        table_usage_count.count = table_usage_count.count + 1
-                        if table_joins:
-                            table_usage_count.joins.extend(table_joins)
-                    else:
-                        joins = []
-                        if table_joins:
-                            joins.extend(table_joins)
-
-                        table_usage_count = TableUsageCount(
-                            table=table,
-                            databaseName=record.databaseName,
-                            date=record.date,
-                            joins=joins,
-                            serviceName=record.serviceName,
-                            sqlQueries=[],
-                            databaseSchema=record.databaseSchema,
-                        )
-
+                    self._add_table_usage(record=record, table=table)
+                    self.staged_queries += 1
+                    logger.debug(f"Successfully record staged for {table}")
                 except Exception as exc:
                     logger.error("Error in staging record - {}".format(exc))
                     logger.error(traceback.format_exc())
-                self.table_usage[(table, record.date)] = table_usage_count
-                logger.info(f"Successfully record staged for {table}")
-        self.dump_data_to_file()
+
+        if self.staged_queries >= self.config.max_staged_queries:
+            self.dump_data_to_file()
+            self.table_usage = {}
+            self.staged_queries = 0
 
     def get_status(self):
         return self.status
 
-    def dump_data_to_file(self):
-        for key, value in self.table_usage.items():
-            if value:
-                value.sqlQueries = self.table_queries.get(key, [])
-                data = value.json()
-                with open(
-                    os.path.join(self.config.filename, f"{value.serviceName}_{key[1]}"),
-                    "a+",
-                ) as file:
-                    file.write(json.dumps(data))
+    def dump_data_to_file(self) -> None:
+        """
+        Write the aggregated usage in a new file of each
+        service and date partition, sorted by table name
+        """
+        partitions: Dict[str, list] = {}
+        for key in sorted(self.table_usage):
+            table_usage_count = self.table_usage[key]
+            partition = f"{table_usage_count.serviceName}_{key[1]}"
+            partitions.setdefault(partition, []).append(table_usage_count)
+
+        for partition, table_usage_counts in partitions.items():
+            partition_dir = os.path.join(self.config.filename, partition)
+            os.makedirs(partition_dir, exist_ok=True)
+            with open(
+                os.path.join(partition_dir, f"{self.spills:05d}.json"), "w"
+            ) as file:
+                for table_usage_count in table_usage_counts:
+                    file.write(table_usage_count.json())
                     file.write("\n")
+        self.spills += 1
 
     def close(self) -> None:
-        return super().close()
+        # Write the usage aggregated since the last file
+        if self.staged_queries:
+            self.dump_data_to_file()
+            self.staged_queries = 0
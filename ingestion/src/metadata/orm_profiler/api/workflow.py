@@ -16,9 +16,12 @@ Workflow definition for the ORM Profiler.
 - How to specify the entities to run
 - How to define metrics & tests
 """
+import time
 import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from copy import deepcopy
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import click
 from pydantic import ValidationError
@@ -26,10 +29,9 @@ from pydantic import ValidationError
 from metadata.config.common import WorkflowExecutionError
 from metadata.config.workflow import get_sink
 from metadata.generated.schema.entity.data.database import Database
-from metadata.generated.schema.entity.data.table import (
-    ColumnProfilerConfig,
-    Table,
-    TableProfile,
+from metadata.generated.schema.entity.data.table import ColumnProfilerConfig, Table
+from metadata.generated.schema.entity.services.connections.database.datalakeConnection import (
+    DatalakeConnection,
 )
 from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
     OpenMetadataConnection,
@@ -38,6 +40,7 @@ from metadata.generated.schema.entity.services.databaseService import DatabaseSe
 from metadata.generated.schema.entity.services.serviceType import ServiceType
 from metadata.generated.schema.metadataIngestion.databaseServiceProfilerPipeline import (
     DatabaseServiceProfilerPipeline,
+    TablePriorityType,
 )
 from metadata.generated.schema.metadataIngestion.workflow import (
     OpenMetadataWorkflowConfig,
@@ -47,19 +50,25 @@ from metadata.ingestion.api.processor import ProcessorStatus
 from metadata.ingestion.api.sink import Sink
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.ingestion.source.database.common_db_source import SQLSourceStatus
-from metadata.orm_profiler.api.models import ProfilerProcessorConfig
+from metadata.orm_profiler.api.models import ProfilerProcessorConfig, ProfilerResponse
 from metadata.orm_profiler.interfaces.sqa_profiler_interface import SQAProfilerInterface
 from metadata.orm_profiler.metrics.registry import Metrics
 from metadata.orm_profiler.profiler.core import Profiler
 from metadata.orm_profiler.profiler.default import DefaultProfiler, get_default_metrics
+from metadata.orm_profiler.profiler.incremental import IncrementalProfile, TablePartial
 from metadata.orm_profiler.validations.models import TableConfig, TablePartitionConfig
 from metadata.utils import fqn
 from metadata.utils.class_helper import (
     get_service_class_from_service_type,
     get_service_type_from_source_type,
 )
+from metadata.utils.connections import (
+    create_and_bind_thread_safe_session,
+    get_connection,
+)
 from metadata.utils.filters import filter_by_database, filter_by_schema, filter_by_table
 from metadata.utils.logger import profiler_logger
+from metadata.utils.state_store import StateStore
 
 logger = profiler_logger()
 
@@ -72,6 +81,8 @@ class ProfilerWorkflow:
     config: OpenMetadataWorkflowConfig
     sink: Sink
     metadata: OpenMetadata
+    # Partial aggregates of the tables, when profiling incrementally
+    profile_state: Optional[StateStore] = None
 
     def __init__(self, config: OpenMetadataWorkflowConfig):
         self.config = config
@@ -92,6 +103,8 @@ class ProfilerWorkflow:
         )
         self.source_status = SQLSourceStatus()
         self.status = ProcessorStatus()
+        if self.source_config.incrementalStateFilePath:
+            self.profile_state = StateStore(self.source_config.incrementalStateFilePath)
 
         if self.config.sink:
             self.sink = get_sink(
@@ -206,8 +219,64 @@ class ProfilerWorkflow:
 
         return None
 
-    def create_profiler_interface(self, service_connection_config, table_entity: Table):
+    def get_incremental_profile(self, entity: Table) -> Optional[IncrementalProfile]:
+        """
+        Tables are profiled incrementally when a state file is informed
+        and the table has a partition field. The partials can only be
+        merged when profiling all the new rows, without sample nor query.
+        """
+        if self.profile_state is None or isinstance(
+            self.config.source.serviceConnection.__root__.config, DatalakeConnection
+        ):
+            return None
+
+        partition_config = self.get_partition_details(entity)
+        if not partition_config or not partition_config.partitionField:
+            return None
+
+        table_fqn = entity.fullyQualifiedName.__root__
+        if self.get_profile_sample(entity) or self.get_profile_query(entity):
+            logger.debug(
+                f"Profiling {table_fqn} from scratch, as partials of a sample cannot be merged"
+            )
+            return None
+
+        # Keep the previous partials unless this run is sent
+        self.profile_state.keep(table_fqn)
+        previous = None
+        state = self.profile_state.get(table_fqn)
+        if state:
+            try:
+                previous = TablePartial.loads(state)
+            except (KeyError, TypeError, ValueError) as exc:
+                logger.debug(traceback.format_exc())
+                logger.warning(f"Ignoring the stored partials of {table_fqn}: {exc}")
+        return IncrementalProfile(partition_config.partitionField, previous)
+
+    def create_profiler_interface(
+        self,
+        service_connection_config,
+        table_entity: Table,
+        session_factory=None,
+        high_water_mark=None,
+        incremental: bool = False,
+    ):
         """Creates a profiler interface object"""
+        if isinstance(service_connection_config, DatalakeConnection):
+            # pylint: disable=import-outside-toplevel
+            from metadata.orm_profiler.interfaces.datalake_profiler_interface import (
+                DatalakeProfilerInterface,
+            )
+
+            return DatalakeProfilerInterface(
+                service_connection_config,
+                metadata_config=self.metadata_config,
+                thread_count=self.source_config.threadCount,
+                table_entity=table_entity,
+                profile_sample=self.get_profile_sample(table_entity),
+                ometa_client=self.metadata,
+            )
+
         return SQAProfilerInterface(
             service_connection_config,
             metadata_config=self.metadata_config,
@@ -222,17 +291,26 @@ class ProfilerWorkflow:
             partition_config=self.get_partition_details(table_entity)
             if not self.get_profile_query(table_entity)
             else None,
+            sampling_method=self.source_config.samplingMethod,
+            session_factory=session_factory,
+            ometa_client=self.metadata,
+            high_water_mark=high_water_mark,
+            incremental=incremental,
         )
 
     def create_profiler_obj(
-        self, table_entity: Table, profiler_interface: SQAProfilerInterface
+        self,
+        table_entity: Table,
+        profiler_interface: SQAProfilerInterface,
+        incremental_profile: Optional[IncrementalProfile] = None,
     ):
         """Profile a single entity"""
         if not self.profiler_config.profiler:
-            self.profiler_obj = DefaultProfiler(
+            profiler_obj = DefaultProfiler(
                 profiler_interface=profiler_interface,
                 include_columns=self.get_include_columns(table_entity),
                 exclude_columns=self.get_exclude_columns(table_entity),
+                incremental_profile=incremental_profile,
             )
         else:
             metrics = (
@@ -241,13 +319,17 @@ class ProfilerWorkflow:
                 else get_default_metrics(profiler_interface.table)
             )
 
-            self.profiler_obj = Profiler(
+            profiler_obj = Profiler(
                 *metrics,
                 profiler_interface=profiler_interface,
                 include_columns=self.get_include_columns(table_entity),
                 exclude_columns=self.get_exclude_columns(table_entity),
+                incremental_profile=incremental_profile,
             )
 
+        self.profiler_obj = profiler_obj
+        return profiler_obj
+
     def filter_databases(self, database: Database) -> Optional[Database]:
         """Returns filtered database entities"""
         if filter_by_database(
@@ -322,12 +404,13 @@ class ProfilerWorkflow:
 
         Same with `schema_filter_pattern`.
         """
+        fields = ["tableProfilerConfig", "tests"]
+        if self.source_config.tablePriority != TablePriorityType.ListingOrder:
+            fields.append("profile")
+
         all_tables = self.metadata.list_all_entities(
             entity=Table,
-            fields=[
-                "tableProfilerConfig",
-                "tests",
-            ],
+            fields=fields,
             params={
                 "service": self.config.source.serviceName,
                 "database": fqn.build(
@@ -358,6 +441,119 @@ class ProfilerWorkflow:
 
         return copy_service_connection_config
 
+    def sort_entities(self, tables: List[Table]) -> List[Table]:
+        """Order the tables by the configured priority"""
+        if self.source_config.tablePriority == TablePriorityType.RowCount:
+            return sorted(
+                tables,
+                key=lambda table: (table.profile and table.profile.rowCount) or 0,
+                reverse=True,
+            )
+        if self.source_config.tablePriority == TablePriorityType.Staleness:
+            return sorted(
+                tables,
+                key=lambda table: table.profile.timestamp.__root__
+                if table.profile
+                else 0,
+            )
+        return tables
+
+    def profile_entity(
+        self, entity: Table, service_connection_config, session_factory
+    ) -> ProfilerResponse:
+        """Profile a single table"""
+        incremental_profile = self.get_incremental_profile(entity)
+        profiler_interface = self.create_profiler_interface(
+            service_connection_config,
+            entity,
+            session_factory=session_factory,
+            high_water_mark=incremental_profile.high_water_mark
+            if incremental_profile
+            else None,
+            incremental=incremental_profile is not None,
+        )
+        try:
+            profiler_obj = self.create_profiler_obj(
+                entity, profiler_interface, incremental_profile=incremental_profile
+            )
+            profile = profiler_obj.process(self.source_config.generateSampleData)
+            if incremental_profile and incremental_profile.partial:
+                # Committed once the profile is sent
+                self.profile_state.stage(
+                    entity.fullyQualifiedName.__root__,
+                    incremental_profile.partial.dumps(),
+                )
+            return profile
+        finally:
+            profiler_interface.close()
+
+    def profile_entities(
+        self, entities: List[Table], service_connection_config, session_factory
+    ) -> Iterable[Tuple[Table, ProfilerResponse]]:
+        """
+        Profile the tables with a bounded pool of workers,
+        yielding the profiles as they are computed.
+
+        A table running for longer than the table timeout is reported as
+        failed. Its worker is only released once the running query returns,
+        so no other table is scheduled on it until then.
+        """
+        workers = self.source_config.tableThreadCount or 1
+        table_timeout = self.source_config.tableTimeout
+        pending = deque(entities)
+        running: Dict[Future, Tuple[Table, float]] = {}
+        timed_out: Set[Future] = set()
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            while pending or running:
+                timed_out = {future for future in timed_out if not future.done()}
+                while pending and len(running) + len(timed_out) < workers:
+                    entity = pending.popleft()
+                    future = executor.submit(
+                        self.profile_entity,
+                        entity,
+                        service_connection_config,
+                        session_factory,
+                    )
+                    running[future] = (entity, time.monotonic())
+
+                if not running:
+                    wait(timed_out, return_when=FIRST_COMPLETED)
+                    continue
+
+                wait_timeout = None
+                if table_timeout:
+                    first_start = min(start for _, start in running.values())
+                    wait_timeout = max(
+                        first_start + table_timeout - time.monotonic(), 0
+                    )
+                done, _ = wait(
+                    running, timeout=wait_timeout, return_when=FIRST_COMPLETED
+                )
+
+                for future in done:
+                    entity, _ = running.pop(future)
+                    try:
+                        yield entity, future.result()
+                    except Exception as err:  # pylint: disable=broad-except
+                        logger.error(err)
+                        logger.error(traceback.format_exc())
+
+                if table_timeout:
+                    now = time.monotonic()
+                    for future, (entity, start) in list(running.items()):
+                        if now - start >= table_timeout:
+                            running.pop(future)
+                            timed_out.add(future)
+                            logger.error(
+                                f"Profiling {entity.fullyQualifiedName.__root__}"
+                                f" took more than {table_timeout} seconds"
+                            )
+                            self.status.failure(entity.fullyQualifiedName.__root__)
+        finally:
+            executor.shutdown(wait=False)
+
     def execute(self):
         """
         Run the profiling and tests
@@ -373,26 +569,40 @@ class ProfilerWorkflow:
 
         for database in databases:
             copied_service_config = self.copy_service_config(database)
+            engine = None
+            session_factory = None
             try:
-                for entity in self.get_table_entities(database=database):
+                # The tables of a database share the engine and its pool.
+                # Datalake objects are profiled in process, without engine.
+                if not isinstance(copied_service_config, DatalakeConnection):
+                    engine = get_connection(copied_service_config)
+                    session_factory = create_and_bind_thread_safe_session(engine)
+                entities = self.sort_entities(
+                    list(self.get_table_entities(database=database))
+                )
+                for entity, profile in self.profile_entities(
+                    entities, copied_service_config, session_factory
+                ):
                     try:
-                        profiler_interface = self.create_profiler_interface(
-                            copied_service_config, entity
-                        )
-                        self.create_profiler_obj(entity, profiler_interface)
-                        profile: TableProfile = self.profiler_obj.process(
-                            self.source_config.generateSampleData
-                        )
-                        profiler_interface.close()
                         if hasattr(self, "sink"):
                             self.sink.write_record(profile)
                         self.status.processed(entity.fullyQualifiedName.__root__)
+                        if self.profile_state is not None:
+                            self.profile_state.commit(
+                                entity.fullyQualifiedName.__root__
+                            )
                     except Exception as err:  # pylint: disable=broad-except
                         logger.error(err)
                         logger.error(traceback.format_exc())
             except Exception as err:  # pylint: disable=broad-except
                 logger.error(err)
                 logger.debug(traceback.format_exc())
+            finally:
+                if engine is not None:
+                    engine.dispose()
+
+        if self.profile_state is not None:
+            self.profile_state.save()
 
     def print_status(self) -> int:
         """
@@ -0,0 +1,347 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Interface to profile the files of a datalake in process,
+without a SQL engine.
+
+The object of the table is read in batches of rows, and the
+metrics of all the columns are computed with vectorized kernels
+in a single pass. Only the columns requiring a scan are read:
+for Parquet files, the null counts, min and max of the footer
+statistics are used when nothing else is asked for a column.
+
+Tables grouping partitioned objects are named after their prefix,
+and all the objects under it are read one after the other.
+"""
+import concurrent.futures
+import traceback
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Column
+
+from metadata.generated.schema.entity.data.table import Table, TableData
+from metadata.generated.schema.entity.services.connections.database.datalakeConnection import (
+    DatalakeConnection,
+)
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.generated.schema.tests.basic import TestCaseResult
+from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.orm_profiler.interfaces.interface_protocol import InterfaceProtocol
+from metadata.orm_profiler.metrics.core import MetricTypes
+from metadata.orm_profiler.metrics.registry import Metrics
+from metadata.orm_profiler.orm.converter import build_orm_col
+from metadata.orm_profiler.profiler.columnar import ColumnAggregator
+from metadata.utils import fqn
+from metadata.utils.connections import get_connection
+from metadata.utils.datalake_utils import (
+    DATALAKE_SUPPORTED_FILE_TYPES,
+    DEFAULT_BATCH_SIZE,
+    get_parquet_statistics,
+    list_keys,
+    open_object,
+    read_batches,
+)
+from metadata.utils.logger import profiler_logger
+
+logger = profiler_logger()
+
+SAMPLE_SEED = 42
+
+# Metrics answered by the footer of Parquet files
+PARQUET_STATISTICS_METRICS = {
+    Metrics.COUNT.value.name(),
+    Metrics.NULL_COUNT.value.name(),
+    Metrics.MIN.value.name(),
+    Metrics.MAX.value.name(),
+}
+
+
+def merge_statistics(
+    left: Optional[Dict[str, Any]], right: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Statistics of two objects, for the columns informed in both"""
+    if left is None:
+        return right
+    columns = {}
+    for name, stats in left["columns"].items():
+        other = right["columns"].get(name)
+        if other is None:
+            continue
+        columns[name] = {
+            "nullCount": stats["nullCount"] + other["nullCount"],
+            "min": min(stats["min"], other["min"]),
+            "max": max(stats["max"], other["max"]),
+        }
+    return {"rowCount": left["rowCount"] + right["rowCount"], "columns": columns}
+
+
+class DatalakeProfilerInterface(InterfaceProtocol):
+    """
+    Interface to profile the CSV, JSON and Parquet
+    objects of a datalake with pandas and numpy.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        service_connection_config: DatalakeConnection,
+        metadata_config: Optional[OpenMetadataConnection] = None,
+        thread_count: Optional[int] = 5,
+        table_entity: Optional[Table] = None,
+        profile_sample: Optional[float] = None,
+        ometa_client: Optional[OpenMetadata] = None,
+        client: Optional[Any] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """Instantiate the Datalake Interface object
+
+        The object of the table is the key named after the
+        table, in the bucket named after its schema.
+        """
+        self._thread_count = thread_count
+        self.table_entity = table_entity
+        self.service_connection_config = service_connection_config
+        self._metadata = ometa_client
+        if not ometa_client and metadata_config:
+            self._metadata = OpenMetadata(metadata_config)
+
+        self.client = client or get_connection(service_connection_config).client
+        self.profile_sample = profile_sample
+        self.batch_size = batch_size
+
+        self.bucket_name = fqn.split(self.table_entity.fullyQualifiedName.__root__)[2]
+        self.key = self.table_entity.name.__root__
+        self._keys: Optional[List[str]] = None
+        # No ORM table to map datalake objects to
+        self.table = None
+
+    @property
+    def keys(self) -> List[str]:
+        """Objects of the table, under its prefix for partitioned tables"""
+        if self._keys is None:
+            self._keys = (
+                [self.key]
+                if self.key.endswith(DATALAKE_SUPPORTED_FILE_TYPES)
+                else [
+                    key
+                    for key in list_keys(
+                        self.client,
+                        self.service_connection_config.configSource,
+                        self.bucket_name,
+                        f"{self.key}/",
+                    )
+                    if key.endswith(DATALAKE_SUPPORTED_FILE_TYPES)
+                ]
+            )
+        return self._keys
+
+    def _open(self, key: str):
+        return open_object(
+            self.client,
+            self.service_connection_config.configSource,
+            self.bucket_name,
+            key,
+        )
+
+    def get_columns(self) -> List[Column]:
+        """Columns of the table entity"""
+        return [
+            build_orm_col(idx, col, self.table_entity.serviceType)
+            for idx, col in enumerate(self.table_entity.columns)
+        ]
+
+    def create_sampler(self, *args, **kwargs) -> None:
+        """Rows are sampled batch by batch while reading the object"""
+        return None
+
+    def create_runner(self, *args, **kwargs) -> None:
+        """There is no query to run, the object is read in batches"""
+        return None
+
+    def _get_statistics(self) -> Optional[Dict[str, Any]]:
+        """
+        Footer statistics of Parquet objects, when profiling all the rows.
+        The statistics of partitioned objects are merged.
+        """
+        if (
+            self.profile_sample
+            or not self.keys
+            or not all(key.endswith(".parquet") for key in self.keys)
+        ):
+            return None
+        try:
+            statistics = None
+            for key in self.keys:
+                with self._open(key) as file:
+                    statistics = merge_statistics(
+                        statistics, get_parquet_statistics(file)
+                    )
+            return statistics
+        except Exception as err:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Cannot read the statistics of {self.key} - {err}")
+            return None
+
+    def _read_batches(self, columns: Optional[List[str]]):
+        """Batches of the sampled rows, with the number of rows read"""
+        for key in self.keys:
+            with self._open(key) as file:
+                for batch in read_batches(file, key, columns, self.batch_size):
+                    row_count = len(batch)
+                    if self.profile_sample:
+                        batch = batch.sample(
+                            frac=self.profile_sample / 100, random_state=SAMPLE_SEED
+                        )
+                    yield batch, row_count
+
+    def _update_aggregators(self, batch, aggregators: Dict[str, ColumnAggregator]):
+        def update(aggregator: ColumnAggregator):
+            try:
+                aggregator.update(batch[aggregator.name])
+            except Exception as err:  # pylint: disable=broad-except
+                logger.debug(traceback.format_exc())
+                logger.warning(
+                    f"Error computing the metrics of {self.key}.{aggregator.name} - {err}"
+                )
+
+        if self._thread_count and self._thread_count > 1 and len(aggregators) > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._thread_count
+            ) as executor:
+                list(executor.map(update, aggregators.values()))
+        else:
+            for aggregator in aggregators.values():
+                update(aggregator)
+
+    def get_all_metrics(
+        self,
+        metric_funcs: list,
+    ):
+        """get all profiler metrics in a single pass over the object"""
+        column_metrics = defaultdict(list)
+        table_metrics = []
+        for metrics, metric_type, column, _ in metric_funcs:
+            if metric_type == MetricTypes.Table:
+                table_metrics.extend(metrics)
+            else:
+                column_metrics[column.name].extend(
+                    metrics if isinstance(metrics, list) else [metrics]
+                )
+
+        statistics = self._get_statistics()
+        stats_columns = {
+            name
+            for name, metrics in column_metrics.items()
+            if statistics
+            and name in statistics["columns"]
+            and {metric.name() for metric in metrics} <= PARQUET_STATISTICS_METRICS
+        }
+        aggregators = {
+            name: ColumnAggregator(name)
+            for name in column_metrics
+            if name not in stats_columns
+        }
+
+        row_count = 0
+        if aggregators or not statistics:
+            logger.debug(
+                f"Reading {len(aggregators)} columns of {self.key} in batches of {self.batch_size} rows"
+            )
+            for batch, batch_row_count in self._read_batches(list(aggregators)):
+                row_count += batch_row_count
+                self._update_aggregators(batch, aggregators)
+        if statistics:
+            row_count = statistics["rowCount"]
+
+        profile_results = {
+            "table": self._get_table_results(table_metrics, row_count),
+            "columns": defaultdict(dict),
+        }
+        for name, metrics in column_metrics.items():
+            if name in stats_columns:
+                stats = statistics["columns"][name]
+                results = {
+                    Metrics.COUNT.value.name(): row_count - stats["nullCount"],
+                    **stats,
+                }
+            else:
+                results = aggregators[name].get_results(
+                    num_bins=next(
+                        (metric.bins for metric in metrics if hasattr(metric, "bins")),
+                        5,
+                    )
+                )
+            profile_results["columns"][name].update(
+                {
+                    "name": name,
+                    "timestamp": datetime.now(tz=timezone.utc).timestamp(),
+                    **{
+                        metric.name(): results.get(metric.name())
+                        for metric in metrics
+                        if metric.name() in results
+                    },
+                }
+            )
+        return profile_results
+
+    def _get_table_results(self, metrics: list, row_count: int) -> Dict[str, Any]:
+        column_names = [col.name.__root__ for col in self.table_entity.columns]
+        results = {
+            Metrics.ROW_COUNT.value.name(): row_count,
+            Metrics.COLUMN_COUNT.value.name(): len(column_names),
+            Metrics.COLUMN_NAMES.value.name(): ",".join(column_names),
+        }
+        return {
+            metric.name(): results[metric.name()]
+            for metric in metrics
+            if metric.name() in results
+        }
+
+    def fetch_sample_data(self) -> Optional[TableData]:
+        """First rows of the object"""
+        for batch, _ in self._read_batches(None):
+            sample = batch.head(100)
+            return TableData(
+                columns=[str(name) for name in sample.columns],
+                rows=[list(row) for row in sample.itertuples(index=False)],
+            )
+        return None
+
+    def get_composed_metrics(
+        self, column: Column, metric: Metrics, column_results: Dict
+    ):
+        """Given a list of metrics, compute the given results
+        and returns the values
+
+        Args:
+            column: the column to compute the metrics against
+            metrics: list of metrics to compute
+        Returns:
+            dictionnary of results
+        """
+        try:
+            return metric(column).fn(column_results)
+        except Exception as err:  # pylint: disable=broad-except
+            logger.error(err)
+            return None
+
+    def run_test_case(self, *args, **kwargs) -> Optional[TestCaseResult]:
+        """Data quality tests run against a SQL engine"""
+        logger.warning("Test cases are not supported yet for Datalake tables")
+        return None
+
+    def close(self):
+        """Nothing to release, objects are opened per read"""
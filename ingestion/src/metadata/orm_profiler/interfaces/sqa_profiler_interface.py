@@ -16,13 +16,16 @@ supporting sqlalchemy abstraction layer
 
 import concurrent.futures
 import threading
+import traceback
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Type, Union
 
-from sqlalchemy import Column, inspect
+from sqlalchemy import Column
+from sqlalchemy import column as sqa_column
+from sqlalchemy import func, inspect
 from sqlalchemy.engine.row import Row
-from sqlalchemy.orm import DeclarativeMeta, Session
+from sqlalchemy.orm import DeclarativeMeta, Session, scoped_session
 
 from metadata.generated.schema.entity.data.table import Table, TableProfile
 from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
@@ -31,17 +34,26 @@ from metadata.generated.schema.entity.services.connections.metadata.openMetadata
 from metadata.generated.schema.entity.services.databaseService import (
     DatabaseServiceType,
 )
+from metadata.generated.schema.metadataIngestion.databaseServiceProfilerPipeline import (
+    SamplingMethodType,
+)
 from metadata.generated.schema.tests.basic import TestCaseResult
 from metadata.generated.schema.tests.testCase import TestCase
 from metadata.generated.schema.tests.testDefinition import TestDefinition
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.orm_profiler.interfaces.interface_protocol import InterfaceProtocol
+from metadata.orm_profiler.metrics.approximate.sketches import HyperLogLog
+from metadata.orm_profiler.metrics.core import ApproximateMetric, MetricTypes
 from metadata.orm_profiler.metrics.registry import Metrics
 from metadata.orm_profiler.orm.converter import ometa_to_orm
 from metadata.orm_profiler.profiler.handle_partition import (
     get_partition_cols,
     is_partitioned,
 )
+from metadata.orm_profiler.profiler.query_planner import (
+    StaticMetricsQuery,
+    StaticMetricsQueryPlanner,
+)
 from metadata.orm_profiler.profiler.runner import QueryRunner
 from metadata.orm_profiler.profiler.sampler import Sampler
 from metadata.orm_profiler.validations.core import validation_enum_registry
@@ -78,20 +90,42 @@ class SQAProfilerInterface(InterfaceProtocol):
         profile_sample: Optional[float] = None,
         profile_query: Optional[str] = None,
         partition_config: Optional[TablePartitionConfig] = None,
+        sampling_method: Optional[SamplingMethodType] = None,
+        session_factory: Optional[scoped_session] = None,
+        ometa_client: Optional[OpenMetadata] = None,
+        high_water_mark: Optional[Any] = None,
+        incremental: bool = False,
     ):
-        """Instantiate SQA Interface object"""
+        """Instantiate SQA Interface object
+
+        A session factory and an OpenMetadata client can be
+        shared by the interfaces of the tables of a database,
+        so that we don't create an engine and client per table.
+
+        When profiling incrementally, only the rows with a partition
+        field greater than the high water mark are profiled. Without
+        high water mark, e.g., on the first run, the whole table is.
+        """
         self._thread_count = thread_count
         self.table_entity = table_entity
-        self._create_ometa_obj(metadata_config)
+        if ometa_client:
+            self._metadata = ometa_client
+        else:
+            self._create_ometa_obj(metadata_config)
 
         # Allows SQA Interface to be used without OM server config
         self.table = table or self._convert_table_to_orm_object()
 
-        self.session_factory = self._session_factory(service_connection_config)
+        self.session_factory = session_factory or self._session_factory(
+            service_connection_config
+        )
         self.session: Session = self.session_factory()
 
         self.profile_sample = profile_sample
         self.profile_query = profile_query
+        self.sampling_method = sampling_method
+        self.high_water_mark = high_water_mark
+        self.incremental = incremental
         self.partition_details = (
             self._get_partition_details(partition_config)
             if not self.profile_query
@@ -99,6 +133,8 @@ class SQAProfilerInterface(InterfaceProtocol):
         )
 
         self._sampler = self.create_sampler()
+        if self.sampling_method == SamplingMethodType.Materialized:
+            self._sampler.materialize_sample()
         self._runner = self.create_runner()
 
     @property
@@ -146,6 +182,15 @@ class SQAProfilerInterface(InterfaceProtocol):
         self, partition_config: TablePartitionConfig
     ) -> Optional[Dict]:
         """From partition config, get the partition table for a table entity"""
+        if self.incremental and partition_config and partition_config.partitionField:
+            if self.high_water_mark is None:
+                # The partials must cover the whole table, not a partition window
+                return None
+            return {
+                "partition_field": partition_config.partitionField,
+                "high_water_mark": self.high_water_mark,
+            }
+
         if self.table_entity.serviceType == DatabaseServiceType.BigQuery:
             if is_partitioned(self.session, self.table):
                 start, end = get_start_and_end(partition_config.partitionQueryDuration)
@@ -184,6 +229,8 @@ class SQAProfilerInterface(InterfaceProtocol):
                 profile_sample=self.profile_sample,
                 partition_details=self.partition_details,
                 profile_sample_query=self.profile_query,
+                sampling_method=self.sampling_method,
+                sample_table=self.sampler.sample_table,
             )
         return thread_local.sampler
 
@@ -254,6 +301,155 @@ class SQAProfilerInterface(InterfaceProtocol):
 
         return row, column
 
+    def compute_static_metrics_in_thread(
+        self,
+        query: StaticMetricsQuery,
+        table: DeclarativeMeta,
+    ) -> Dict[str, Dict]:
+        """Run the static metrics of a group of columns
+        in a single query in processor worker
+
+        If the fused query fails, e.g., because of a single column,
+        fall back to one query per column.
+        """
+        logger.debug(
+            f"Running static metrics of {len(query.columns)} columns for "
+            f"{table.__tablename__} on thread {threading.current_thread()}"
+        )
+        Session = self.session_factory
+        session = Session()
+        sampler = self._create_thread_safe_sampler(
+            session,
+            table,
+        )
+        sample = sampler.random_sample()
+        runner = self._create_thread_safe_runner(
+            session,
+            table,
+            sample,
+        )
+
+        if not query.expressions:
+            return query.get_results({})
+
+        try:
+            row = runner.select_first_from_sample(*query.expressions)
+            return query.get_results(row)
+        except Exception as err:
+            logger.warning(
+                f"Error computing the static metrics of {table.__tablename__} in a single query,"
+                f" running one query per column - {err}"
+            )
+            session.rollback()
+
+        return {
+            column.name: get_static_metrics(
+                metrics,
+                runner=runner,
+                session=session,
+                column=column,
+            )
+            for column, metrics in query.columns
+        }
+
+    def compute_sketch_metrics_in_thread(
+        self,
+        column: Column,
+        metrics: List[Type[ApproximateMetric]],
+        table: DeclarativeMeta,
+    ) -> Dict[str, Dict]:
+        """Compute the approximate metrics of a column client-side,
+        updating their sketches in a single pass over the sample
+        """
+        logger.debug(
+            f"Running sketch metrics of {column.name} for "
+            f"{table.__tablename__} on thread {threading.current_thread()}"
+        )
+        Session = self.session_factory
+        session = Session()
+        sampler = self._create_thread_safe_sampler(
+            session,
+            table,
+        )
+        sample = sampler.random_sample()
+        runner = self._create_thread_safe_runner(
+            session,
+            table,
+            sample,
+        )
+
+        instances = [metric(column) for metric in metrics]
+        sketches = [(instance, instance.sketch()) for instance in instances]
+        sketches = [(instance, sketch) for instance, sketch in sketches if sketch]
+        try:
+            for (value,) in runner.yield_from_sample(sqa_column(column.name)):
+                if value is None:
+                    continue
+                for _, sketch in sketches:
+                    sketch.update(value)
+        except Exception as err:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Error computing the sketch metrics of {column.name} - {err}"
+            )
+            session.rollback()
+            return {column.name: {}}
+
+        return {
+            column.name: {
+                instance.name(): instance.sketch_result(sketch)
+                for instance, sketch in sketches
+            }
+        }
+
+    def _create_table_runner(self) -> QueryRunner:
+        """Runner over the rows of the table, filtered by the partition details"""
+        return QueryRunner(
+            session=self.session,
+            table=self.table,
+            sample=self.sample,
+            partition_details=self.partition_details,
+            profile_sample_query=self.profile_query,
+        )
+
+    def get_high_water_mark(self, partition_field: str) -> Optional[Any]:
+        """Highest value of the partition field among the profiled rows"""
+        runner = self._create_table_runner()
+        row = runner.select_first_from_table(func.max(sqa_column(partition_field)))
+        return row[0] if row else None
+
+    def compute_distinct_sketches(
+        self, columns: List[Column], precision: int = 14
+    ) -> Dict[str, HyperLogLog]:
+        """Distinct sketches of the columns, in a single pass over the profiled rows"""
+        sketches = {col.name: HyperLogLog(precision) for col in columns}
+        if not columns:
+            return sketches
+        runner = self._create_table_runner()
+        rows = runner.yield_from_table(*[sqa_column(col.name) for col in columns])
+        for row in rows:
+            for col, value in zip(columns, row):
+                if value is not None:
+                    sketches[col.name].update(value)
+        return sketches
+
+    def _get_static_column_metrics(self, metric_funcs: list) -> list:
+        return [
+            (column, metrics)
+            for metrics, metric_type, column, _ in metric_funcs
+            if metric_type == MetricTypes.Static
+        ]
+
+    def plan_static_metrics(self, metric_funcs: list) -> List[StaticMetricsQuery]:
+        """Fuse the static metrics of all the columns in as few queries as possible"""
+        planner = StaticMetricsQueryPlanner(self.session.get_bind().dialect.name)
+        return planner.plan(self._get_static_column_metrics(metric_funcs))
+
+    def plan_sketch_metrics(self, metric_funcs: list) -> list:
+        """Approximate metrics without a native function in the dialect"""
+        planner = StaticMetricsQueryPlanner(self.session.get_bind().dialect.name)
+        return planner.plan_sketches(self._get_static_column_metrics(metric_funcs))
+
     def get_all_metrics(
         self,
         metric_funcs: list,
@@ -261,19 +457,47 @@ class SQAProfilerInterface(InterfaceProtocol):
         """get all profiler metrics"""
         logger.info(f"Computing metrics with {self._thread_count} threads.")
         profile_results = {"table": dict(), "columns": defaultdict(dict)}
+        static_queries = self.plan_static_metrics(metric_funcs)
+        sketch_metrics = self.plan_sketch_metrics(metric_funcs)
         with concurrent.futures.ThreadPoolExecutor(
             max_workers=self._thread_count
         ) as executor:
+            static_futures = [
+                executor.submit(
+                    self.compute_static_metrics_in_thread,
+                    query,
+                    self.table,
+                )
+                for query in static_queries
+            ]
+            static_futures.extend(
+                executor.submit(
+                    self.compute_sketch_metrics_in_thread,
+                    column,
+                    metrics,
+                    self.table,
+                )
+                for column, metrics in sketch_metrics
+            )
             futures = [
                 executor.submit(
                     self.compute_metrics_in_thread,
                     metric_func,
                 )
                 for metric_func in metric_funcs
+                if metric_func[1] != MetricTypes.Static
             ]
 
-        for future in concurrent.futures.as_completed(futures):
-            profile, column = future.result()
+        results = [
+            (profile, column)
+            for future in concurrent.futures.as_completed(static_futures)
+            for column, profile in future.result().items()
+        ]
+        results.extend(
+            future.result() for future in concurrent.futures.as_completed(futures)
+        )
+
+        for profile, column in results:
             if not isinstance(profile, dict):
                 profile = dict()
             if not column:
@@ -303,6 +527,7 @@ class SQAProfilerInterface(InterfaceProtocol):
             profile_sample=self.profile_sample,
             partition_details=self.partition_details,
             profile_sample_query=self.profile_query,
+            sampling_method=self.sampling_method,
         )
 
     def create_runner(self) -> None:
@@ -363,7 +588,8 @@ class SQAProfilerInterface(InterfaceProtocol):
         )
 
     def close(self):
-        """close session"""
+        """drop the materialized sample and close session"""
+        self.sampler.drop_sample()
         self.session.close()
 
 
@@ -0,0 +1,53 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Approximate Distinct Count Metric definition
+"""
+# pylint: disable=duplicate-code
+
+from sqlalchemy import column
+
+from metadata.orm_profiler.metrics.approximate.sketches import HyperLogLog
+from metadata.orm_profiler.metrics.core import ApproximateMetric, _label
+from metadata.orm_profiler.orm.functions.approx import (
+    APPROX_COUNT_DISTINCT_DIALECTS,
+    ApproxCountDistinctFn,
+)
+
+
+class ApproxDistinctCount(ApproximateMetric):
+    """
+    APPROX_DISTINCT_COUNT Metric
+
+    Given a column, estimate the number of distinct values
+    without the sort or hash aggregation of the exact count.
+    """
+
+    native_dialects = APPROX_COUNT_DISTINCT_DIALECTS
+
+    @classmethod
+    def name(cls):
+        return "distinctCount"
+
+    @property
+    def metric_type(self):
+        return int
+
+    @_label
+    def fn(self):
+        return ApproxCountDistinctFn(column(self.col.name))
+
+    def sketch(self):
+        return HyperLogLog()
+
+    def sketch_result(self, sketch: HyperLogLog):
+        return sketch.count()
@@ -0,0 +1,79 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Approximate Histogram Metric definition
+"""
+import math
+from collections import defaultdict
+from typing import Optional
+
+from metadata.orm_profiler.metrics.approximate.sketches import KLLSketch
+from metadata.orm_profiler.metrics.core import ApproximateMetric
+from metadata.orm_profiler.orm.registry import is_quantifiable
+from metadata.utils.logger import profiler_logger
+
+logger = profiler_logger()
+
+
+def histogram_from_sketch(sketch: KLLSketch, num_bins: int) -> Optional[dict]:
+    """Frequencies of the values of the sketch in num_bins equally sized bins"""
+    if sketch.min is None or sketch.min == sketch.max:
+        return None
+
+    step = float(sketch.max - sketch.min) / (num_bins - 1)
+    frequencies = defaultdict(int)
+    for value, weight in sketch.weighted_values():
+        frequencies[math.floor(float(value) / step)] += weight
+
+    bins = sorted(frequencies)
+    return {
+        "boundaries": [f"{index * step} to {(index + 1) * step}" for index in bins],
+        "frequencies": [frequencies[index] for index in bins],
+    }
+
+
+class ApproxHistogram(ApproximateMetric):
+    """
+    APPROX_HISTOGRAM Metric
+
+    Given a column, return the approximate frequencies of
+    the values falling into equally sized bins.
+
+    Computed from a KLL sketch in a single pass, instead of
+    querying the MIN and MAX before bucketing the values.
+    """
+
+    @classmethod
+    def name(cls):
+        return "histogram"
+
+    @property
+    def metric_type(self):
+        return dict
+
+    def fn(self):
+        return None
+
+    def sketch(self):
+        if is_quantifiable(self.col.type):
+            return KLLSketch()
+        return None
+
+    def sketch_result(self, sketch: KLLSketch):
+        num_bins = self.bins if hasattr(self, "bins") else 5
+
+        histogram = histogram_from_sketch(sketch, num_bins)
+        if histogram is None:
+            logger.debug(
+                f"MIN({self.col.name}) == MAX({self.col.name}) or EMPTY table. Aborting histogram computation."
+            )
+        return histogram
@@ -0,0 +1,69 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Approximate Median Metric definition
+"""
+# pylint: disable=duplicate-code
+
+from sqlalchemy import column
+
+from metadata.orm_profiler.metrics.approximate.sketches import KLLSketch
+from metadata.orm_profiler.metrics.core import ApproximateMetric, _label
+from metadata.orm_profiler.orm.functions.approx import (
+    APPROX_MEDIAN_DIALECTS,
+    ApproxMedianFn,
+)
+from metadata.orm_profiler.orm.registry import is_quantifiable
+from metadata.utils.logger import profiler_logger
+
+logger = profiler_logger()
+
+
+class ApproxMedian(ApproximateMetric):
+    """
+    APPROX_MEDIAN Metric
+
+    Given a column, return an approximation of the Median value.
+    Unlike the exact Median, it is computed as an aggregate and
+    not as a window function.
+
+    - For a quantifiable value, return the approximate Median
+    """
+
+    native_dialects = APPROX_MEDIAN_DIALECTS
+
+    @classmethod
+    def name(cls):
+        return "median"
+
+    @property
+    def metric_type(self):
+        return float
+
+    @_label
+    def fn(self):
+        if is_quantifiable(self.col.type):
+            return ApproxMedianFn(column(self.col.name))
+
+        logger.debug(
+            f"Don't know how to process type {self.col.type} when computing Median"
+        )
+        return None
+
+    def sketch(self):
+        if is_quantifiable(self.col.type):
+            return KLLSketch()
+        return None
+
+    def sketch_result(self, sketch: KLLSketch):
+        median = sketch.quantile(0.5)
+        return float(median) if median is not None else None
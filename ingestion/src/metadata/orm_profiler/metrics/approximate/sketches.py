@@ -0,0 +1,174 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Streaming sketches used to approximate metrics client-side
+in a single pass over the values of a column.
+
+- HyperLogLog for distinct counts
+- KLL for quantiles and histograms
+"""
+import base64
+import hashlib
+import math
+import random
+from typing import Any, Iterable, List, Optional, Tuple
+
+
+class HyperLogLog:
+    """
+    Estimate the number of distinct values with
+    a relative error around 1.04 / sqrt(2 ** precision)
+    """
+
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = bytearray(self.num_registers)
+
+    @staticmethod
+    def _hash(value: Any) -> int:
+        data = value if isinstance(value, bytes) else str(value).encode("utf-8")
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+    def update(self, value: Any) -> None:
+        hashed = self._hash(value)
+        index = hashed >> (64 - self.precision)
+        remaining_bits = 64 - self.precision
+        remaining = hashed & ((1 << remaining_bits) - 1)
+        rank = remaining_bits - remaining.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self) -> int:
+        """Estimated distinct count"""
+        alpha = 0.7213 / (1 + 1.079 / self.num_registers)
+        estimate = (
+            alpha
+            * self.num_registers**2
+            / sum(2.0**-register for register in self.registers)
+        )
+        zeros = self.registers.count(0)
+        # Linear counting is more accurate for small cardinalities
+        if estimate <= 2.5 * self.num_registers and zeros:
+            estimate = self.num_registers * math.log(self.num_registers / zeros)
+        return int(round(estimate))
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Union of the values seen by both sketches"""
+        if other.precision != self.precision:
+            raise ValueError(
+                f"Cannot merge HyperLogLog sketches of precision {self.precision} and {other.precision}"
+            )
+        merged = HyperLogLog(self.precision)
+        merged.registers = bytearray(
+            max(left, right) for left, right in zip(self.registers, other.registers)
+        )
+        return merged
+
+    def dumps(self) -> str:
+        return base64.b64encode(bytes(self.registers)).decode("ascii")
+
+    @classmethod
+    def loads(cls, data: str) -> "HyperLogLog":
+        registers = base64.b64decode(data)
+        hll = cls(precision=len(registers).bit_length() - 1)
+        hll.registers = bytearray(registers)
+        return hll
+
+
+class KLLSketch:
+    """
+    Quantiles sketch of Karnin, Lang and Liberty.
+
+    Values are kept in compactors of increasing weight.
+    When full, a compactor sorts its values and promotes
+    every other one to the next level, keeping the memory
+    bounded by O(k log n).
+    """
+
+    def __init__(self, k: int = 200, c: float = 2.0 / 3.0):
+        self.k = k
+        self.c = c
+        self.compactors: List[List[Any]] = []
+        self.size = 0
+        self.max_size = 0
+        self.count = 0
+        self.min: Optional[Any] = None
+        self.max: Optional[Any] = None
+        self._grow()
+
+    def _grow(self) -> None:
+        self.compactors.append([])
+        self.max_size = sum(
+            self._capacity(height) for height in range(len(self.compactors))
+        )
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self.compactors) - height - 1
+        return int(math.ceil(self.c**depth * self.k)) + 1
+
+    def update(self, value: Any) -> None:
+        self.compactors[0].append(value)
+        self.size += 1
+        self.count += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if self.size >= self.max_size:
+            self._compress()
+
+    def update_many(self, values: Iterable[Any]) -> None:
+        """Add a batch of values at once"""
+        values = list(values)
+        if not values:
+            return
+        self.compactors[0].extend(values)
+        self.size += len(values)
+        self.count += len(values)
+        batch_min, batch_max = min(values), max(values)
+        self.min = batch_min if self.min is None else min(self.min, batch_min)
+        self.max = batch_max if self.max is None else max(self.max, batch_max)
+        while self.size >= self.max_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        for height, compactor in enumerate(self.compactors):
+            if len(compactor) >= self._capacity(height):
+                if height + 1 >= len(self.compactors):
+                    self._grow()
+                compactor.sort()
+                # An odd item out stays at this level
+                leftover = [compactor.pop()] if len(compactor) % 2 else []
+                self.compactors[height + 1].extend(compactor[random.randint(0, 1) :: 2])
+                self.compactors[height] = leftover
+                self.size = sum(len(items) for items in self.compactors)
+                return
+
+    def weighted_values(self) -> List[Tuple[Any, int]]:
+        """Sorted retained values with the number of values they stand for"""
+        return sorted(
+            (value, 1 << height)
+            for height, compactor in enumerate(self.compactors)
+            for value in compactor
+        )
+
+    def quantile(self, fraction: float) -> Optional[Any]:
+        """Approximate value at the given rank fraction"""
+        weighted = self.weighted_values()
+        if not weighted:
+            return None
+        total = sum(weight for _, weight in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= fraction * total:
+                return value
+        return weighted[-1][0]
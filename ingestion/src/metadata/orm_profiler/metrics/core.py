@@ -16,7 +16,7 @@ Metric Core definitions
 from abc import ABC, abstractmethod
 from enum import Enum
 from functools import wraps
-from typing import Any, Dict, Optional, Tuple, TypeVar
+from typing import Any, Dict, Optional, Set, Tuple, TypeVar
 
 from sqlalchemy import Column
 from sqlalchemy.orm import DeclarativeMeta, Session
@@ -164,6 +164,35 @@ class StaticMetric(Metric, ABC):
         """
 
 
+class ApproximateMetric(StaticMetric, ABC):
+    """
+    Static metric approximated with a native function on
+    the dialects supporting one, or with a sketch computed
+    client-side in a single pass over the column values.
+    """
+
+    native_dialects: Set[str] = set()
+
+    @classmethod
+    def is_native(cls, dialect_name: str) -> bool:
+        """
+        Check if the metric can be computed in the database
+        """
+        return dialect_name in cls.native_dialects
+
+    @abstractmethod
+    def sketch(self):
+        """
+        Sketch to update with each non-null value of the column
+        """
+
+    @abstractmethod
+    def sketch_result(self, sketch):
+        """
+        Metric value from the sketch filled with all the values
+        """
+
+
 class QueryMetric(Metric, ABC):
     """
     Metric that needs to execute a fully fledged
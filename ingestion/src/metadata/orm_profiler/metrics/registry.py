@@ -18,6 +18,11 @@ Note that we are using our own Registry definition
 that allows us to directly call our metrics without
 having the verbosely pass .value all the time...
 """
+from metadata.orm_profiler.metrics.approximate.approx_distinct_count import (
+    ApproxDistinctCount,
+)
+from metadata.orm_profiler.metrics.approximate.approx_histogram import ApproxHistogram
+from metadata.orm_profiler.metrics.approximate.approx_median import ApproxMedian
 from metadata.orm_profiler.metrics.composed.distinct_ratio import DistinctRatio
 from metadata.orm_profiler.metrics.composed.duplicate_count import DuplicateCount
 from metadata.orm_profiler.metrics.composed.ilike_ratio import ILikeRatio
@@ -78,6 +83,11 @@ class Metrics(MetricRegistry):
     UNIQUE_RATIO = UniqueRatio
     COLUMN_NAMES = ColumnNames
 
+    # Approximate Metrics, replacing their exact counterpart
+    APPROX_DISTINCT_COUNT = ApproxDistinctCount
+    APPROX_HISTOGRAM = ApproxHistogram
+    APPROX_MEDIAN = ApproxMedian
+
     # Composed Metrics
     DUPLICATE_COUNT = DuplicateCount
     ILIKE_RATIO = ILikeRatio
@@ -0,0 +1,146 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Define the native approximate distinct count and median functions
+"""
+# Keep SQA docs style defining custom constructs
+# pylint: disable=consider-using-f-string,duplicate-code
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+from metadata.orm_profiler.metrics.core import CACHE
+from metadata.orm_profiler.orm.registry import Dialects
+
+APPROX_COUNT_DISTINCT_DIALECTS = {
+    Dialects.Snowflake,
+    Dialects.BigQuery,
+    Dialects.MSSQL,
+    Dialects.Oracle,
+    Dialects.Databricks,
+    Dialects.Druid,
+    Dialects.Trino,
+    Dialects.Presto,
+    Dialects.Athena,
+    Dialects.Redshift,
+    Dialects.ClickHouse,
+    Dialects.Vertica,
+}
+
+APPROX_MEDIAN_DIALECTS = {
+    Dialects.Snowflake,
+    Dialects.BigQuery,
+    Dialects.Oracle,
+    Dialects.Databricks,
+    Dialects.Trino,
+    Dialects.Presto,
+    Dialects.Athena,
+    Dialects.Redshift,
+    Dialects.ClickHouse,
+    Dialects.Vertica,
+}
+
+
+class ApproxCountDistinctFn(FunctionElement):
+    inherit_cache = CACHE
+
+
+@compiles(ApproxCountDistinctFn)
+def _(element, compiler, **kw):
+    """Exact count on dialects without an approximation"""
+    return "COUNT(DISTINCT %s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(ApproxCountDistinctFn, Dialects.Snowflake)
+@compiles(ApproxCountDistinctFn, Dialects.BigQuery)
+@compiles(ApproxCountDistinctFn, Dialects.MSSQL)
+@compiles(ApproxCountDistinctFn, Dialects.Oracle)
+@compiles(ApproxCountDistinctFn, Dialects.Databricks)
+@compiles(ApproxCountDistinctFn, Dialects.Druid)
+def _(element, compiler, **kw):
+    return "APPROX_COUNT_DISTINCT(%s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(ApproxCountDistinctFn, Dialects.Trino)
+@compiles(ApproxCountDistinctFn, Dialects.Presto)
+@compiles(ApproxCountDistinctFn, Dialects.Athena)
+def _(element, compiler, **kw):
+    return "approx_distinct(%s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(ApproxCountDistinctFn, Dialects.Redshift)
+def _(element, compiler, **kw):
+    return "APPROXIMATE COUNT(DISTINCT %s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(ApproxCountDistinctFn, Dialects.ClickHouse)
+def _(element, compiler, **kw):
+    return "uniq(%s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(ApproxCountDistinctFn, Dialects.Vertica)
+def _(element, compiler, **kw):
+    return "APPROXIMATE_COUNT_DISTINCT(%s)" % compiler.process(element.clauses, **kw)
+
+
+class ApproxMedianFn(FunctionElement):
+    inherit_cache = CACHE
+
+
+@compiles(ApproxMedianFn)
+def _(element, compiler, **kw):
+    """Exact median on dialects without an approximation"""
+    col = compiler.process(element.clauses, **kw)
+    return "percentile_cont(0.5) WITHIN GROUP (ORDER BY %s ASC)" % col
+
+
+@compiles(ApproxMedianFn, Dialects.Snowflake)
+def _(element, compiler, **kw):
+    return "APPROX_PERCENTILE(%s, 0.5)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(ApproxMedianFn, Dialects.BigQuery)
+def _(element, compiler, **kw):
+    col = compiler.process(element.clauses, **kw)
+    return "APPROX_QUANTILES(%s, 2)[OFFSET(1)]" % col
+
+
+@compiles(ApproxMedianFn, Dialects.Oracle)
+def _(element, compiler, **kw):
+    return "APPROX_MEDIAN(%s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(ApproxMedianFn, Dialects.Databricks)
+def _(element, compiler, **kw):
+    return "percentile_approx(%s, 0.5)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(ApproxMedianFn, Dialects.Trino)
+@compiles(ApproxMedianFn, Dialects.Presto)
+@compiles(ApproxMedianFn, Dialects.Athena)
+def _(element, compiler, **kw):
+    return "approx_percentile(%s, 0.5)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(ApproxMedianFn, Dialects.Redshift)
+def _(element, compiler, **kw):
+    col = compiler.process(element.clauses, **kw)
+    return "APPROXIMATE PERCENTILE_DISC(0.5) WITHIN GROUP (ORDER BY %s)" % col
+
+
+@compiles(ApproxMedianFn, Dialects.ClickHouse)
+def _(element, compiler, **kw):
+    return "quantile(0.5)(%s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(ApproxMedianFn, Dialects.Vertica)
+def _(element, compiler, **kw):
+    return "APPROXIMATE_MEDIAN(%s)" % compiler.process(element.clauses, **kw)
@@ -0,0 +1,90 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Define the native TABLESAMPLE clause and the
+CREATE TABLE AS statement used to materialize samples
+"""
+from sqlalchemy import func, literal_column, tablesample
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.ddl import DDLElement
+from sqlalchemy.sql.selectable import TableSample
+
+from metadata.orm_profiler.orm.registry import Dialects
+
+# Dialects where TABLESAMPLE SYSTEM is supported
+NATIVE_SAMPLE_DIALECTS = {
+    Dialects.Postgres,
+    Dialects.Snowflake,
+    Dialects.BigQuery,
+    Dialects.Trino,
+    Dialects.Presto,
+    Dialects.MSSQL,
+}
+
+# Dialects accepting REPEATABLE (seed), so that every
+# query over the sample reads the same rows
+REPEATABLE_SAMPLE_DIALECTS = {Dialects.Postgres, Dialects.MSSQL}
+
+SAMPLE_SEED = 42
+
+
+def native_sample(table, profile_sample: float, dialect_name: str) -> TableSample:
+    """TABLESAMPLE SYSTEM over profile_sample percent of the table"""
+    return tablesample(
+        table,
+        func.system(literal_column(str(float(profile_sample)))),
+        seed=literal_column(str(SAMPLE_SEED))
+        if dialect_name in REPEATABLE_SAMPLE_DIALECTS
+        else None,
+    )
+
+
+@compiles(TableSample, Dialects.MSSQL)
+@compiles(TableSample, Dialects.BigQuery)
+def _(element, compiler, **kw):
+    """The percentage requires the PERCENT keyword"""
+    method = element._get_method()  # pylint: disable=protected-access
+    percent = compiler.process(list(method.clauses)[0], **kw)
+    kw["asfrom"] = True
+    text = (
+        f"{compiler.visit_alias(element, **kw)} TABLESAMPLE SYSTEM ({percent} PERCENT)"
+    )
+    if element.seed is not None:
+        text += f" REPEATABLE ({compiler.process(element.seed, **kw)})"
+    return text
+
+
+class CreateTableAs(DDLElement):
+    """
+    Create a table from the results of a SELECT
+    """
+
+    inherit_cache = False
+
+    def __init__(self, table, selectable):
+        self.table = table
+        self.selectable = selectable
+
+
+@compiles(CreateTableAs)
+def _(element, compiler, **kw):
+    table = compiler.preparer.format_table(element.table)
+    select = compiler.sql_compiler.process(element.selectable, literal_binds=True)
+    return f"CREATE TABLE {table} AS {select}"
+
+
+@compiles(CreateTableAs, Dialects.MSSQL)
+def _(element, compiler, **kw):
+    """SQL Server creates tables from queries with SELECT INTO"""
+    table = compiler.preparer.format_table(element.table)
+    select = compiler.sql_compiler.process(element.selectable, literal_binds=True)
+    return f"SELECT * INTO {table} FROM ({select}) AS sample"
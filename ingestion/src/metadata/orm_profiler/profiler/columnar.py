@@ -0,0 +1,170 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Vectorized computation of the column metrics over batches
+of rows, so that the objects of a datalake are profiled in
+a single streaming pass with bounded memory.
+
+Each ColumnAggregator keeps the running aggregates of a column:
+counts, sums and sums of squares, bounds, lengths, value counts
+and sketches for the quantiles.
+"""
+import math
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
+
+from metadata.orm_profiler.metrics.approximate.approx_histogram import (
+    histogram_from_sketch,
+)
+from metadata.orm_profiler.metrics.approximate.sketches import HyperLogLog, KLLSketch
+from metadata.orm_profiler.metrics.registry import Metrics
+
+# Past this number of distinct values, the exact value counts
+# are replaced by a HyperLogLog sketch to bound the memory.
+# The unique count is not computed anymore.
+MAX_EXACT_DISTINCT = 100_000
+
+
+def update_hll(hll: HyperLogLog, values: pd.Series) -> None:
+    """Vectorized update of the registers of the sketch"""
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+    remaining_bits = 64 - hll.precision
+    index = (hashes >> np.uint64(remaining_bits)).astype(np.int64)
+    remaining = hashes & np.uint64((1 << remaining_bits) - 1)
+    # frexp gives the bit length of the remaining bits, 0 for 0
+    _, bit_length = np.frexp(remaining.astype(np.float64))
+    rank = (remaining_bits - bit_length + 1).astype(np.uint8)
+    registers = np.frombuffer(hll.registers, dtype=np.uint8)
+    np.maximum.at(registers, index, rank)
+
+
+def _to_python(value: Any) -> Any:
+    """numpy and pandas scalars to their Python type"""
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _bound(current: Any, value: Any, bound) -> Any:
+    return value if current is None else bound(current, value)
+
+
+class ColumnAggregator:
+    """
+    Running aggregates of a column, updated batch by batch
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, name: str):
+        self.name = name
+        self.values_count = 0
+        self.null_count = 0
+        self.quantifiable = False
+        self.total = 0
+        self.sum_squares = 0.0
+        self.min = None
+        self.max = None
+        self.min_length = None
+        self.max_length = None
+        self.value_counts: Optional[pd.Series] = None
+        self.hll: Optional[HyperLogLog] = None
+        self.quantiles = KLLSketch()
+
+    def update(self, values: pd.Series) -> None:
+        """Add a batch of values of the column"""
+        nulls = values.isna()
+        self.null_count += int(nulls.sum())
+        non_null = values[~nulls]
+        if non_null.empty:
+            return
+        self.values_count += len(non_null)
+
+        if is_numeric_dtype(non_null) and not is_bool_dtype(non_null):
+            self.quantifiable = True
+            array = non_null.to_numpy(dtype=np.float64)
+            self.total += _to_python(non_null.sum())
+            self.sum_squares += float(np.square(array).sum())
+            self.quantiles.update_many(array.tolist())
+            self._update_bounds(non_null)
+        elif is_datetime64_any_dtype(non_null):
+            self._update_bounds(non_null)
+        elif is_object_dtype(non_null) or is_string_dtype(non_null):
+            lengths = non_null.astype(str).str.len()
+            self.min_length = _bound(self.min_length, int(lengths.min()), min)
+            self.max_length = _bound(self.max_length, int(lengths.max()), max)
+
+        self._update_distinct(non_null)
+
+    def _update_bounds(self, values: pd.Series) -> None:
+        self.min = _bound(self.min, _to_python(values.min()), min)
+        self.max = _bound(self.max, _to_python(values.max()), max)
+
+    def _update_distinct(self, values: pd.Series) -> None:
+        if self.hll is not None:
+            update_hll(self.hll, values)
+            return
+
+        counts = values.value_counts()
+        self.value_counts = (
+            counts
+            if self.value_counts is None
+            else self.value_counts.add(counts, fill_value=0)
+        )
+        if len(self.value_counts) > MAX_EXACT_DISTINCT:
+            self.hll = HyperLogLog()
+            update_hll(self.hll, self.value_counts.index.to_series())
+            self.value_counts = None
+
+    def get_results(self, num_bins: int = 5) -> Dict[str, Any]:
+        """Metrics of the values seen so far, keyed by metric name"""
+        results = {
+            Metrics.COUNT.value.name(): self.values_count,
+            Metrics.NULL_COUNT.value.name(): self.null_count,
+        }
+        if self.quantifiable and self.values_count:
+            mean = self.total / self.values_count
+            results[Metrics.SUM.value.name()] = self.total
+            results[Metrics.MEAN.value.name()] = mean
+            results[Metrics.STDDEV.value.name()] = math.sqrt(
+                max(self.sum_squares / self.values_count - mean**2, 0)
+            )
+            results[Metrics.MEDIAN.value.name()] = self.quantiles.quantile(0.5)
+            results[Metrics.HISTOGRAM.value.name()] = histogram_from_sketch(
+                self.quantiles, num_bins
+            )
+        if self.min is not None:
+            results[Metrics.MIN.value.name()] = self.min
+            results[Metrics.MAX.value.name()] = self.max
+        if self.min_length is not None:
+            results[Metrics.MIN_LENGTH.value.name()] = self.min_length
+            results[Metrics.MAX_LENGTH.value.name()] = self.max_length
+        if self.hll is not None:
+            results[Metrics.DISTINCT_COUNT.value.name()] = self.hll.count()
+        elif self.value_counts is not None:
+            results[Metrics.DISTINCT_COUNT.value.name()] = len(self.value_counts)
+            results[Metrics.UNIQUE_COUNT.value.name()] = int(
+                (self.value_counts == 1).sum()
+            )
+        else:
+            results[Metrics.DISTINCT_COUNT.value.name()] = 0
+            results[Metrics.UNIQUE_COUNT.value.name()] = 0
+        return results
@@ -44,6 +44,7 @@ from metadata.orm_profiler.metrics.core import (
 )
 from metadata.orm_profiler.metrics.static.row_count import RowCount
 from metadata.orm_profiler.orm.registry import NOT_COMPUTE
+from metadata.orm_profiler.profiler.incremental import IncrementalProfile
 from metadata.utils.logger import profiler_logger
 
 logger = profiler_logger()
@@ -75,6 +76,7 @@ class Profiler(Generic[TMetric]):
         profile_date: datetime = datetime.now(tz=timezone.utc).timestamp(),
         include_columns: List[Optional[ColumnProfilerConfig]] = None,
         exclude_columns: List[Optional[str]] = None,
+        incremental_profile: Optional[IncrementalProfile] = None,
     ):
         """
         :param metrics: Metrics to run. We are receiving the uninitialized classes
@@ -82,11 +84,13 @@ class Profiler(Generic[TMetric]):
         :param table: DeclarativeMeta containing table info
         :param ignore_cols: List of columns to ignore when computing the profile
         :param profile_sample: % of rows to use for sampling column metrics
+        :param incremental_profile: partials of the previous runs to merge the results with
         """
 
         self.profiler_interface = profiler_interface
         self.include_columns = include_columns
         self.exclude_columns = exclude_columns
+        self.incremental_profile = incremental_profile
         self._metrics = metrics
         self._profile_date = profile_date
 
@@ -357,6 +361,13 @@ class Profiler(Generic[TMetric]):
     def compute_metrics(self) -> Self:
         """Run the whole profiling using multithreading"""
         self.profile_entity()
+        if self.incremental_profile:
+            self.incremental_profile.merge(
+                self.profiler_interface,
+                self.columns,
+                self._table_results,
+                self._column_results,
+            )
         for column in self.columns:
             self.run_composed_metrics(column)
 
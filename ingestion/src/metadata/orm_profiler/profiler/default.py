@@ -21,6 +21,7 @@ from metadata.orm_profiler.interfaces.sqa_profiler_interface import SQAProfilerI
 from metadata.orm_profiler.metrics.core import Metric, add_props
 from metadata.orm_profiler.metrics.registry import Metrics
 from metadata.orm_profiler.profiler.core import Profiler
+from metadata.orm_profiler.profiler.incremental import IncrementalProfile
 
 
 def get_default_metrics(table: DeclarativeMeta) -> List[Metric]:
@@ -61,6 +62,7 @@ class DefaultProfiler(Profiler):
         profiler_interface: SQAProfilerInterface,
         include_columns: List[Optional[ColumnProfilerConfig]] = None,
         exclude_columns: List[Optional[str]] = None,
+        incremental_profile: Optional[IncrementalProfile] = None,
     ):
 
         _metrics = get_default_metrics(profiler_interface.table)
@@ -70,4 +72,5 @@ class DefaultProfiler(Profiler):
             profiler_interface=profiler_interface,
             include_columns=include_columns,
             exclude_columns=exclude_columns,
+            incremental_profile=incremental_profile,
         )
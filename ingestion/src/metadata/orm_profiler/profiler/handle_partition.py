@@ -127,6 +127,10 @@ def build_partition_predicate(partition_details: dict, col):
     col_type = None
     if col is not None:
         col_type = col.type
+    if partition_details.get("high_water_mark") is not None:
+        return text(
+            f"{partition_details['partition_field']} > :high_water_mark"
+        ).bindparams(high_water_mark=partition_details["high_water_mark"])
     if partition_details["partition_values"]:
         return text(
             f"{partition_details['partition_field']} in "
@@ -0,0 +1,346 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Incremental profiling of partitioned tables.
+
+Each run only profiles the rows past the high water mark, i.e., the
+highest partition value seen by the previous run. The results of
+the new rows are merged with the partial aggregates stored for the
+table:
+
+- row, values and null counts are added up
+- min, max, minLength and maxLength are compared
+- sums and sums of squares give the mean and stddev
+- distinct counts come from the union of HyperLogLog sketches
+
+Unique and pattern counts cannot be merged. They are dropped, so that
+their ratios are not computed against the count of all the rows. Other
+metrics, e.g., median or histogram, describe the new rows only.
+"""
+import json
+import math
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Column
+
+from metadata.orm_profiler.metrics.approximate.sketches import HyperLogLog
+from metadata.orm_profiler.metrics.registry import Metrics
+from metadata.utils.logger import profiler_logger
+
+logger = profiler_logger()
+
+# 4KB of registers per column, with a relative error around 1.6%
+HLL_PRECISION = 12
+
+# Counts of the new rows only, which would give wrong composed ratios
+UNMERGEABLE_COUNTS = {
+    Metrics.UNIQUE_COUNT.value.name(),
+    Metrics.LIKE_COUNT.value.name(),
+    Metrics.ILIKE_COUNT.value.name(),
+}
+
+
+def _encode(value: Any) -> Any:
+    """Keep dates and datetimes through JSON"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "datetime" in value:
+            return datetime.fromisoformat(value["datetime"])
+        if "date" in value:
+            return date.fromisoformat(value["date"])
+    return value
+
+
+def _merge_bound(left: Any, right: Any, bound) -> Any:
+    """min or max of two values, any of them possibly missing"""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    try:
+        return bound(left, right)
+    except TypeError:
+        # e.g., the column type changed between runs
+        return right
+
+
+def _float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def _add(
+    left: Optional[float], right: Optional[float], left_count: int, right_count: int
+) -> Optional[float]:
+    """Sum of the aggregates, unknown if any side with values is missing"""
+    if not left_count:
+        return right
+    if not right_count:
+        return left
+    if left is None or right is None:
+        return None
+    return left + right
+
+
+class ColumnPartial:
+    """
+    Mergeable aggregates of a column
+    """
+
+    # pylint: disable=too-many-arguments,redefined-builtin
+    def __init__(
+        self,
+        values_count: int = 0,
+        null_count: int = 0,
+        total: Optional[float] = None,
+        sum_squares: Optional[float] = None,
+        min: Optional[Any] = None,
+        max: Optional[Any] = None,
+        min_length: Optional[int] = None,
+        max_length: Optional[int] = None,
+        hll: Optional[HyperLogLog] = None,
+    ):
+        self.values_count = values_count
+        self.null_count = null_count
+        self.total = total
+        self.sum_squares = sum_squares
+        self.min = min
+        self.max = max
+        self.min_length = min_length
+        self.max_length = max_length
+        self.hll = hll
+
+    @classmethod
+    def from_results(
+        cls, results: Dict[str, Any], hll: Optional[HyperLogLog] = None
+    ) -> "ColumnPartial":
+        """Partial aggregates from the profile of the new rows"""
+        values_count = results.get(Metrics.COUNT.value.name()) or 0
+        mean = _float(results.get(Metrics.MEAN.value.name()))
+        stddev = _float(results.get(Metrics.STDDEV.value.name()))
+        total = _float(results.get(Metrics.SUM.value.name()))
+        if total is None and mean is not None:
+            total = mean * values_count
+
+        sum_squares = None
+        if mean is not None and stddev is not None:
+            # Population stddev: var = E[X^2] - E[X]^2
+            sum_squares = values_count * (stddev**2 + mean**2)
+
+        return cls(
+            values_count=values_count,
+            null_count=results.get(Metrics.NULL_COUNT.value.name()) or 0,
+            total=total,
+            sum_squares=sum_squares,
+            min=results.get(Metrics.MIN.value.name()),
+            max=results.get(Metrics.MAX.value.name()),
+            min_length=results.get(Metrics.MIN_LENGTH.value.name()),
+            max_length=results.get(Metrics.MAX_LENGTH.value.name()),
+            hll=hll,
+        )
+
+    def merge(self, other: "ColumnPartial") -> "ColumnPartial":
+        if self.hll is None or other.hll is None:
+            hll = self.hll or other.hll
+        else:
+            hll = self.hll.merge(other.hll)
+        return ColumnPartial(
+            values_count=self.values_count + other.values_count,
+            null_count=self.null_count + other.null_count,
+            total=_add(self.total, other.total, self.values_count, other.values_count),
+            sum_squares=_add(
+                self.sum_squares,
+                other.sum_squares,
+                self.values_count,
+                other.values_count,
+            ),
+            min=_merge_bound(self.min, other.min, min),
+            max=_merge_bound(self.max, other.max, max),
+            min_length=_merge_bound(self.min_length, other.min_length, min),
+            max_length=_merge_bound(self.max_length, other.max_length, max),
+            hll=hll,
+        )
+
+    def get_results(self) -> Dict[str, Any]:
+        """Column metrics of all the rows seen so far"""
+        results = {
+            Metrics.COUNT.value.name(): self.values_count,
+            Metrics.NULL_COUNT.value.name(): self.null_count,
+            Metrics.MIN.value.name(): self.min,
+            Metrics.MAX.value.name(): self.max,
+            Metrics.MIN_LENGTH.value.name(): self.min_length,
+            Metrics.MAX_LENGTH.value.name(): self.max_length,
+            Metrics.SUM.value.name(): self.total,
+        }
+        if self.total is not None and self.values_count:
+            mean = self.total / self.values_count
+            results[Metrics.MEAN.value.name()] = mean
+            if self.sum_squares is not None:
+                results[Metrics.STDDEV.value.name()] = math.sqrt(
+                    max(self.sum_squares / self.values_count - mean**2, 0)
+                )
+        if self.hll is not None:
+            results[Metrics.DISTINCT_COUNT.value.name()] = self.hll.count()
+        return results
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "valuesCount": self.values_count,
+            "nullCount": self.null_count,
+            "sum": self.total,
+            "sumSquares": self.sum_squares,
+            "min": _encode(self.min),
+            "max": _encode(self.max),
+            "minLength": self.min_length,
+            "maxLength": self.max_length,
+            "hll": self.hll.dumps() if self.hll is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnPartial":
+        return cls(
+            values_count=data.get("valuesCount") or 0,
+            null_count=data.get("nullCount") or 0,
+            total=data.get("sum"),
+            sum_squares=data.get("sumSquares"),
+            min=_decode(data.get("min")),
+            max=_decode(data.get("max")),
+            min_length=data.get("minLength"),
+            max_length=data.get("maxLength"),
+            hll=HyperLogLog.loads(data["hll"]) if data.get("hll") else None,
+        )
+
+
+class TablePartial:
+    """
+    Mergeable aggregates of a table up to its high water mark
+    """
+
+    def __init__(
+        self,
+        high_water_mark: Optional[Any] = None,
+        row_count: int = 0,
+        columns: Optional[Dict[str, ColumnPartial]] = None,
+    ):
+        self.high_water_mark = high_water_mark
+        self.row_count = row_count
+        self.columns = columns or {}
+
+    def merge(self, other: "TablePartial") -> "TablePartial":
+        """Add the partials of newer rows"""
+        columns = dict(self.columns)
+        for name, partial in other.columns.items():
+            columns[name] = columns[name].merge(partial) if name in columns else partial
+        return TablePartial(
+            high_water_mark=_merge_bound(
+                self.high_water_mark, other.high_water_mark, max
+            ),
+            row_count=self.row_count + other.row_count,
+            columns=columns,
+        )
+
+    def dumps(self) -> str:
+        return json.dumps(
+            {
+                "highWaterMark": _encode(self.high_water_mark),
+                "rowCount": self.row_count,
+                "columns": {
+                    name: partial.to_dict() for name, partial in self.columns.items()
+                },
+            }
+        )
+
+    @classmethod
+    def loads(cls, data: str) -> "TablePartial":
+        state = json.loads(data)
+        return cls(
+            high_water_mark=_decode(state.get("highWaterMark")),
+            row_count=state.get("rowCount") or 0,
+            columns={
+                name: ColumnPartial.from_dict(partial)
+                for name, partial in (state.get("columns") or {}).items()
+            },
+        )
+
+
+class IncrementalProfile:
+    """
+    Profile of a table merged with the partials of the previous runs
+    """
+
+    def __init__(self, partition_field: str, previous: Optional[TablePartial] = None):
+        self.partition_field = partition_field
+        self.previous = previous
+        self.partial: Optional[TablePartial] = None
+
+    @property
+    def high_water_mark(self) -> Optional[Any]:
+        """Only the rows past this value need to be profiled"""
+        return self.previous.high_water_mark if self.previous else None
+
+    def merge(
+        self,
+        profiler_interface,
+        columns: List[Column],
+        table_results: Dict[str, Any],
+        column_results: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Compute the partials of the profiled rows and merge them
+        with the previous ones, updating the results in place.
+
+        The first run profiles the whole table, so its exact
+        results are kept and only the partials are recorded.
+        """
+        sketches = profiler_interface.compute_distinct_sketches(columns, HLL_PRECISION)
+        new_partial = TablePartial(
+            high_water_mark=profiler_interface.get_high_water_mark(
+                self.partition_field
+            ),
+            row_count=table_results.get(Metrics.ROW_COUNT.value.name()) or 0,
+            columns={
+                col.name: ColumnPartial.from_results(
+                    column_results.get(col.name) or {}, sketches.get(col.name)
+                )
+                for col in columns
+            },
+        )
+        if self.previous is None:
+            self.partial = new_partial
+            return
+
+        self.partial = self.previous.merge(new_partial)
+        logger.debug(
+            f"Merged the profile of {new_partial.row_count} new rows"
+            f" up to {self.partial.high_water_mark}"
+        )
+        if Metrics.ROW_COUNT.value.name() in table_results:
+            table_results[Metrics.ROW_COUNT.value.name()] = self.partial.row_count
+        for name, results in column_results.items():
+            if name not in self.partial.columns:
+                continue
+            merged = self.partial.columns[name].get_results()
+            results.update(
+                {metric: value for metric, value in merged.items() if metric in results}
+            )
+            for metric in UNMERGEABLE_COUNTS.intersection(results):
+                results[metric] = None
@@ -0,0 +1,175 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Plan the static metrics of all the columns of a table
+into as few queries as the dialect allows.
+
+Instead of scanning the sample once per column, the
+metric expressions of several columns are fused in
+the same SELECT, e.g.,
+SELECT count(a), min(a), ..., count(b), min(b), ... FROM sample
+"""
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import Column
+from sqlalchemy.sql.elements import Label
+
+from metadata.orm_profiler.metrics.core import ApproximateMetric, Metric
+from metadata.orm_profiler.orm.registry import Dialects
+from metadata.utils.logger import profiler_logger
+
+logger = profiler_logger()
+
+DEFAULT_MAX_EXPRESSIONS = 1000
+
+# Maximum number of expressions allowed in a SELECT list
+DIALECT_MAX_EXPRESSIONS = {
+    Dialects.Oracle: 1000,
+    Dialects.Postgres: 1664,
+    Dialects.Redshift: 1600,
+    Dialects.MySQL: 4096,
+    Dialects.MariaDB: 4096,
+    Dialects.SingleStore: 4096,
+    Dialects.MSSQL: 4096,
+    Dialects.AzureSQL: 4096,
+    Dialects.SQLite: 2000,
+}
+
+
+class StaticMetricsQuery:
+    """
+    Static metrics of a group of columns computed
+    in a single SELECT.
+
+    Each expression gets a positional label, as column
+    names might be too long or not valid as labels, and
+    the results are mapped back to their column and metric.
+    """
+
+    def __init__(self):
+        self.columns: List[Tuple[Column, List[Type[Metric]]]] = []
+        self.expressions: List[Label] = []
+        self._labels: Dict[str, Tuple[str, str]] = {}
+
+    def add_column(
+        self, column: Column, metrics: List[Type[Metric]], expressions: List[Label]
+    ) -> None:
+        """Add the labeled metric expressions of a column"""
+        col_index = len(self.columns)
+        self.columns.append((column, metrics))
+        for expr in expressions:
+            label = f"c{col_index}_{len(self.expressions)}"
+            self._labels[label] = (column.name, expr.name)
+            self.expressions.append(expr.element.label(label))
+
+    def get_results(self, row) -> Dict[str, Dict[str, Any]]:
+        """Split the result row by column"""
+        results = {column.name: {} for column, _ in self.columns}
+        for label, value in dict(row).items():
+            col_name, metric_name = self._labels[label]
+            results[col_name][metric_name] = value
+        return results
+
+
+class StaticMetricsQueryPlanner:
+    """
+    Group the static metrics of the columns of a table into
+    queries, splitting only when the expression budget of the
+    dialect or the optional column budget is exceeded.
+
+    The metrics of a column are never split across queries.
+    """
+
+    def __init__(
+        self,
+        dialect_name: str,
+        max_expressions: Optional[int] = None,
+        max_columns: Optional[int] = None,
+    ):
+        self.dialect_name = dialect_name
+        self.max_expressions = max_expressions or DIALECT_MAX_EXPRESSIONS.get(
+            dialect_name, DEFAULT_MAX_EXPRESSIONS
+        )
+        self.max_columns = max_columns
+
+    def is_sketch(self, metric: Type[Metric]) -> bool:
+        """Approximate metrics without a native function in the dialect"""
+        return issubclass(metric, ApproximateMetric) and not metric.is_native(
+            self.dialect_name
+        )
+
+    def get_column_expressions(
+        self, column: Column, metrics: List[Type[Metric]]
+    ) -> List[Label]:
+        """Labeled expressions of the static metrics supported by the column type"""
+        expressions = []
+        for metric in metrics:
+            if metric.is_window_metric() or self.is_sketch(metric):
+                continue
+            try:
+                expr = metric(column).fn()
+            except Exception as err:  # pylint: disable=broad-except
+                logger.error(
+                    f"Error building {metric.name()} for column {column.name} - {err}"
+                )
+                continue
+            if expr is not None:
+                expressions.append(expr)
+        return expressions
+
+    def _is_full(self, query: StaticMetricsQuery, size: int) -> bool:
+        if not query.expressions:
+            return False
+        if self.max_columns and len(query.columns) >= self.max_columns:
+            return True
+        return len(query.expressions) + size > self.max_expressions
+
+    def plan(
+        self, column_metrics: List[Tuple[Column, List[Type[Metric]]]]
+    ) -> List[StaticMetricsQuery]:
+        """
+        Build the queries computing the static metrics of
+        the given columns.
+
+        Args:
+            column_metrics: static metrics to compute for each column
+        Returns:
+            list of queries to run against the sample
+        """
+        queries = [StaticMetricsQuery()]
+        for column, metrics in column_metrics:
+            # Columns without any supported metric still get an empty profile
+            expressions = self.get_column_expressions(column, metrics)
+            if expressions and self._is_full(queries[-1], len(expressions)):
+                queries.append(StaticMetricsQuery())
+            queries[-1].add_column(column, metrics, expressions)
+
+        queries = [query for query in queries if query.columns]
+        logger.debug(
+            f"Planned the static metrics of {len(column_metrics)} columns"
+            f" in {len(queries)} queries"
+        )
+        return queries
+
+    def plan_sketches(
+        self, column_metrics: List[Tuple[Column, List[Type[Metric]]]]
+    ) -> List[Tuple[Column, List[Type[ApproximateMetric]]]]:
+        """
+        Approximate metrics to compute client-side, in a single
+        pass over the values of each column
+        """
+        sketches = []
+        for column, metrics in column_metrics:
+            sketch_metrics = [metric for metric in metrics if self.is_sketch(metric)]
+            if sketch_metrics:
+                sketches.append((column, sketch_metrics))
+        return sketches
@@ -22,7 +22,10 @@ from sqlalchemy import text
 from sqlalchemy.orm import DeclarativeMeta, Query, Session
 from sqlalchemy.orm.util import AliasedClass
 
-from metadata.orm_profiler.profiler.handle_partition import partition_filter_handler
+from metadata.orm_profiler.profiler.handle_partition import (
+    build_partition_predicate,
+    partition_filter_handler,
+)
 
 
 class QueryRunner:
@@ -83,6 +86,32 @@ class QueryRunner:
     def select_all_from_sample(self, *entities, **kwargs):
         return self._select_from_sample(*entities, **kwargs).all()
 
+    def yield_from_table(self, *entities, batch_size: int = 10_000, **kwargs):
+        """Stream the rows of the table without loading them in memory"""
+        if self._profile_sample_query:
+            query = self._select_from_user_query(*entities, **kwargs)
+        else:
+            query = self._build_query(*entities, **kwargs).select_from(self.table)
+        return self._yield_per(query, batch_size)
+
+    def yield_from_sample(self, *entities, batch_size: int = 10_000, **kwargs):
+        """Stream the rows of the sample without loading them in memory"""
+        return self._yield_per(
+            self._select_from_sample(*entities, **kwargs), batch_size
+        )
+
+    def _yield_per(self, query: Query, batch_size: int):
+        if self._partition_details:
+            query = query.filter(
+                build_partition_predicate(
+                    self._partition_details,
+                    self.table.__table__.c.get(
+                        self._partition_details["partition_field"]
+                    ),
+                )
+            )
+        return query.yield_per(batch_size)
+
     @staticmethod
     def select_first_from_query(query: Query):
         return query.first()
@@ -12,16 +12,33 @@
 Helper module to handle data sampling
 for the profiler
 """
+import traceback
+import uuid
 from typing import Dict, Optional, Union
 
-from sqlalchemy import column, inspect, text
+from sqlalchemy import Column, MetaData, Table, column, inspect, text
 from sqlalchemy.orm import DeclarativeMeta, Query, Session, aliased
 from sqlalchemy.orm.util import AliasedClass
+from sqlalchemy.schema import DropTable
 
 from metadata.generated.schema.entity.data.table import TableData
+from metadata.generated.schema.metadataIngestion.databaseServiceProfilerPipeline import (
+    SamplingMethodType,
+)
 from metadata.orm_profiler.orm.functions.modulo import ModuloFn
 from metadata.orm_profiler.orm.functions.random_num import RandomNumFn
-from metadata.orm_profiler.profiler.handle_partition import partition_filter_handler
+from metadata.orm_profiler.orm.functions.table_sample import (
+    NATIVE_SAMPLE_DIALECTS,
+    CreateTableAs,
+    native_sample,
+)
+from metadata.orm_profiler.profiler.handle_partition import (
+    build_partition_predicate,
+    partition_filter_handler,
+)
+from metadata.utils.logger import profiler_logger
+
+logger = profiler_logger()
 
 RANDOM_LABEL = "random"
 
@@ -39,12 +56,16 @@ class Sampler:
         profile_sample: Optional[float] = None,
         partition_details: Optional[Dict] = None,
         profile_sample_query: Optional[str] = None,
+        sampling_method: Optional[SamplingMethodType] = None,
+        sample_table: Optional[Table] = None,
     ):
         self.profile_sample = profile_sample
         self.session = session
         self.table = table
         self._partition_details = partition_details
         self._profile_sample_query = profile_sample_query
+        self.sampling_method = sampling_method or SamplingMethodType.Random
+        self.sample_table = sample_table
 
         self.sample_limit = 100
 
@@ -68,6 +89,22 @@ class Sampler:
 
             return self.table
 
+        if self.sample_table is not None:
+            return aliased(self.table, self.sample_table)
+
+        if self.sampling_method == SamplingMethodType.Native:
+            dialect_name = self.session.get_bind().dialect.name
+            if dialect_name in NATIVE_SAMPLE_DIALECTS:
+                return aliased(
+                    self.table,
+                    native_sample(
+                        self.table.__table__, self.profile_sample, dialect_name
+                    ),
+                )
+            logger.debug(
+                f"TABLESAMPLE is not supported for {dialect_name}, using random sampling"
+            )
+
         # Add new RandomNumFn column
         rnd = self.get_sample_query()
 
@@ -89,6 +126,19 @@ class Sampler:
         if self._profile_sample_query:
             return self._fetch_sample_data_from_user_query()
 
+        if self.sample_table is not None:
+            sqa_columns = list(self.sample_table.c)
+            sqa_sample = (
+                self.session.query(*sqa_columns)
+                .select_from(self.sample_table)
+                .limit(self.sample_limit)
+                .all()
+            )
+            return TableData(
+                columns=[column.name for column in sqa_columns],
+                rows=[list(row) for row in sqa_sample],
+            )
+
         # Add new RandomNumFn column
         rnd = self.get_sample_query()
         sqa_columns = [col for col in inspect(rnd).c if col.name != RANDOM_LABEL]
@@ -105,6 +155,65 @@ class Sampler:
             rows=[list(row) for row in sqa_sample],
         )
 
+    def materialize_sample(self) -> Optional[Table]:
+        """
+        Store the random sample in a table, so that the source
+        table is only scanned once and all the metrics and the
+        sample data are computed over the same rows.
+
+        If the table cannot be created, e.g., because of missing
+        permissions, we keep sampling in each query.
+        """
+        if self._profile_sample_query or not self.profile_sample:
+            return None
+
+        table = self.table.__table__
+        sample_table = Table(
+            f"om_sample_{uuid.uuid4().hex[:16]}",
+            MetaData(),
+            *[Column(col.name, col.type) for col in table.columns],
+            schema=table.schema,
+        )
+        query = self.session.query(*table.columns).filter(
+            ModuloFn(RandomNumFn(), 100) <= self.profile_sample
+        )
+        if self._partition_details:
+            query = query.filter(
+                build_partition_predicate(
+                    self._partition_details,
+                    table.c.get(self._partition_details["partition_field"]),
+                )
+            )
+
+        try:
+            self.session.execute(CreateTableAs(sample_table, query.statement))
+            self.session.commit()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Could not materialize the sample of {table.name}, sampling in each query instead - {exc}"
+            )
+            self.session.rollback()
+            return None
+
+        self.sample_table = sample_table
+        return sample_table
+
+    def drop_sample(self) -> None:
+        """Drop the materialized sample, if any"""
+        if self.sample_table is None:
+            return
+        try:
+            self.session.execute(DropTable(self.sample_table))
+            self.session.commit()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Could not drop the sample table {self.sample_table.name} - {exc}"
+            )
+            self.session.rollback()
+        self.sample_table = None
+
     def _fetch_sample_data_from_user_query(self) -> TableData:
         """Returns a table data object using results from query execution"""
         rnd = self.session.execute(f"{self._profile_sample_query}")
@@ -126,6 +235,15 @@ class Sampler:
     def _random_sample_for_partitioned_tables(self) -> Query:
         """Return the Query object for partitioned tables"""
         partition_field = self._partition_details["partition_field"]
+        if self._partition_details.get("high_water_mark") is not None:
+            sample = (
+                self.session.query(self.table)
+                .filter(
+                    column(partition_field) > self._partition_details["high_water_mark"]
+                )
+                .subquery()
+            )
+            return aliased(self.table, sample)
         if not self._partition_details.get("partition_values"):
             sample = (
                 self.session.query(self.table)
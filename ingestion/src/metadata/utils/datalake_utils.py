@@ -0,0 +1,325 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+List the objects of a datalake and stream them in
+batches of rows, without downloading the whole file
+"""
+import io
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+from pandas import DataFrame
+
+from metadata.generated.schema.entity.services.connections.database.datalakeConnection import (
+    GCSConfig,
+    S3Config,
+)
+from metadata.utils.logger import utils_logger
+
+logger = utils_logger()
+
+DATALAKE_SUPPORTED_FILE_TYPES = (".csv", ".tsv", ".json", ".parquet")
+
+DEFAULT_BATCH_SIZE = 100_000
+
+# Size of the range requests when reading objects
+DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Inferring the schema only needs the first rows or the Parquet footer
+SCHEMA_BUFFER_SIZE = 256 * 1024
+SCHEMA_SAMPLE_SIZE = 100
+
+# Hive style partition, e.g., `dt=2022-10-01`
+PARTITION_SEGMENT_RE = re.compile(r"^[^/=]+=[^/]*$")
+
+
+class S3ObjectFile(io.RawIOBase):
+    """
+    Seekable read-only file over an S3 object.
+
+    Each read is a range request, so that readers like
+    Parquet only fetch the footer and the column chunks
+    they need instead of the whole object.
+    """
+
+    def __init__(self, client: Any, bucket_name: str, key: str):
+        super().__init__()
+        self.client = client
+        self.bucket_name = bucket_name
+        self.key = key
+        self.size = client.head_object(Bucket=bucket_name, Key=key)["ContentLength"]
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence {whence}")
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        if self._position >= self.size or not len(buffer):
+            return 0
+        end = min(self._position + len(buffer), self.size) - 1
+        data = self.client.get_object(
+            Bucket=self.bucket_name,
+            Key=self.key,
+            Range=f"bytes={self._position}-{end}",
+        )["Body"].read()
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+def open_object(
+    client: Any,
+    config_source: Any,
+    bucket_name: str,
+    key: str,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> IO[bytes]:
+    """Open an object of the datalake as a seekable binary file"""
+    if isinstance(config_source, S3Config):
+        return io.BufferedReader(
+            S3ObjectFile(client, bucket_name, key), buffer_size=buffer_size
+        )
+    if isinstance(config_source, GCSConfig):
+        return client.bucket(bucket_name).blob(key).open("rb", chunk_size=buffer_size)
+    raise NotImplementedError(f"Unsupported datalake source {type(config_source)}")
+
+
+def _list_s3(client: Any, bucket_name: str, **kwargs) -> Tuple[List[str], List[str]]:
+    keys, prefixes = [], []
+    paginator = client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name, **kwargs):
+        keys.extend(obj["Key"] for obj in page.get("Contents", []))
+        prefixes.extend(prefix["Prefix"] for prefix in page.get("CommonPrefixes", []))
+    return keys, prefixes
+
+
+def _list_gcs(client: Any, bucket_name: str, **kwargs) -> Tuple[List[str], List[str]]:
+    blobs = client.list_blobs(bucket_name, **kwargs)
+    keys = [blob.name for blob in blobs]
+    # Prefixes are only known once all the pages are read
+    return keys, sorted(blobs.prefixes)
+
+
+def list_objects(
+    client: Any,
+    config_source: Any,
+    bucket_name: str,
+    prefix: Optional[str] = None,
+    delimiter: Optional[str] = None,
+) -> Tuple[List[str], List[str]]:
+    """
+    Keys under the prefix. With a delimiter, the keys of the first
+    level only, and the prefixes of the levels below.
+    """
+    if isinstance(config_source, S3Config):
+        kwargs = {"Prefix": prefix, "Delimiter": delimiter}
+        return _list_s3(
+            client, bucket_name, **{key: val for key, val in kwargs.items() if val}
+        )
+    if isinstance(config_source, GCSConfig):
+        return _list_gcs(client, bucket_name, prefix=prefix, delimiter=delimiter)
+    raise NotImplementedError(f"Unsupported datalake source {type(config_source)}")
+
+
+def list_keys(
+    client: Any,
+    config_source: Any,
+    bucket_name: str,
+    prefix: Optional[str] = None,
+    max_workers: int = 1,
+) -> Iterable[str]:
+    """
+    List the keys under the prefix.
+
+    With more than one worker, the prefixes of the first level
+    below the given one are listed concurrently, each of them
+    being paginated on its own.
+    """
+    if max_workers <= 1:
+        keys, _ = list_objects(client, config_source, bucket_name, prefix)
+        yield from keys
+        return
+
+    keys, shards = list_objects(
+        client, config_source, bucket_name, prefix, delimiter="/"
+    )
+    yield from keys
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for shard_keys, _ in executor.map(
+            lambda shard: list_objects(client, config_source, bucket_name, shard),
+            shards,
+        ):
+            yield from shard_keys
+
+
+def get_partitioned_table(key: str) -> Optional[str]:
+    """
+    Prefix of the key before its first Hive style partition,
+    e.g., `events` for `events/dt=2022-10-01/part-0.parquet`
+    """
+    segments = key.split("/")[:-1]
+    for idx, segment in enumerate(segments):
+        if PARTITION_SEGMENT_RE.match(segment):
+            return "/".join(segments[:idx]) or None
+    return None
+
+
+def _is_json_lines(file: IO[bytes]) -> bool:
+    """
+    JSON Lines objects hold a complete value in their first line.
+    Arrays and pretty-printed documents are read at once.
+    """
+    line = file.readline()
+    while line and not line.strip():
+        line = file.readline()
+    file.seek(0)
+    if line.lstrip().startswith(b"["):
+        return False
+    try:
+        json.loads(line)
+        return True
+    except ValueError:
+        return False
+
+
+def _read_json_document(file: IO[bytes]) -> DataFrame:
+    """A document holds an array of records or a single one"""
+    document = json.load(file)
+    return pd.DataFrame.from_records(
+        document if isinstance(document, list) else [document]
+    )
+
+
+def read_batches(
+    file: IO[bytes],
+    key: str,
+    columns: Optional[List[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterable[DataFrame]:
+    """
+    Yield the rows of the object in DataFrames of batch_size rows,
+    only reading the given columns when the format allows it.
+
+    Columns missing from the object are skipped.
+    """
+    if key.endswith(".parquet"):
+        # pylint: disable=import-outside-toplevel
+        from pyarrow.parquet import ParquetFile
+
+        parquet_file = ParquetFile(file)
+        if columns is not None:
+            names = set(parquet_file.schema_arrow.names)
+            columns = [column for column in columns if column in names]
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+            yield batch.to_pandas()
+
+    elif key.endswith((".csv", ".tsv")):
+        yield from pd.read_csv(
+            file,
+            sep="\t" if key.endswith(".tsv") else ",",
+            usecols=(lambda name: name in columns) if columns is not None else None,
+            chunksize=batch_size,
+        )
+
+    elif key.endswith(".json"):
+        if _is_json_lines(file):
+            batches = pd.read_json(file, lines=True, chunksize=batch_size)
+        else:
+            batches = [_read_json_document(file)]
+        for batch in batches:
+            if columns is not None:
+                batch = batch[[column for column in columns if column in batch.columns]]
+            yield batch
+
+    else:
+        raise NotImplementedError(f"Unsupported file type for {key}")
+
+
+def infer_schema(
+    file: IO[bytes], key: str, sample_size: int = SCHEMA_SAMPLE_SIZE
+) -> DataFrame:
+    """
+    Empty or sample DataFrame with the columns of the object,
+    only reading the Parquet footer or the first rows of the file.
+    """
+    if key.endswith(".parquet"):
+        # pylint: disable=import-outside-toplevel
+        from pyarrow.parquet import ParquetFile
+
+        return ParquetFile(file).schema_arrow.empty_table().to_pandas()
+
+    if key.endswith((".csv", ".tsv")):
+        return pd.read_csv(
+            file, sep="\t" if key.endswith(".tsv") else ",", nrows=sample_size
+        )
+
+    if key.endswith(".json"):
+        if _is_json_lines(file):
+            return pd.read_json(file, lines=True, nrows=sample_size)
+        return _read_json_document(file).head(sample_size)
+
+    raise NotImplementedError(f"Unsupported file type for {key}")
+
+
+def get_parquet_statistics(file: IO[bytes]) -> Dict[str, Any]:
+    """
+    Number of rows, and the null count, min and max of the columns
+    whose statistics are informed in every row group of the file,
+    read from the footer only.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pyarrow.parquet import ParquetFile
+
+    metadata = ParquetFile(file).metadata
+    statistics: Dict[str, Dict[str, Any]] = {}
+    for index in range(metadata.num_columns):
+        name = metadata.schema.column(index).name
+        column_stats = {"nullCount": 0, "min": None, "max": None}
+        for row_group in range(metadata.num_row_groups):
+            stats = metadata.row_group(row_group).column(index).statistics
+            if stats is None or not stats.has_null_count or not stats.has_min_max:
+                column_stats = None
+                break
+            column_stats["nullCount"] += stats.null_count
+            column_stats["min"] = (
+                stats.min
+                if column_stats["min"] is None
+                else min(column_stats["min"], stats.min)
+            )
+            column_stats["max"] = (
+                stats.max
+                if column_stats["max"] is None
+                else max(column_stats["max"], stats.max)
+            )
+        if column_stats is not None:
+            statistics[name] = column_stats
+
+    return {"rowCount": metadata.num_rows, "columns": statistics}
@@ -143,6 +143,13 @@ def _(
 
     if not database_name or not schema_name:
 
+        if metadata.fqn_index is not None:
+            table_fqns = metadata.fqn_index.search(
+                metadata, service_name, database_name, schema_name, table_name
+            )
+            if table_fqns:
+                return table_fqns if fetch_multiple_entities else table_fqns[0]
+
         fqn_search_string = _build(
             service_name, database_name or "*", schema_name or "*", table_name
         )
@@ -150,6 +157,7 @@ def _(
         es_result = metadata.es_search_from_fqn(
             entity_type=Table,
             fqn_search_string=fqn_search_string,
+            fields=[],  # Only the FQN is needed
         )
         entity: Optional[Union[Table, List[Table]]] = get_entity_from_es_result(
             entity_list=es_result, fetch_multiple_entities=fetch_multiple_entities
@@ -0,0 +1,77 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Local state kept between ingestion runs
+"""
+import json
+import os
+import threading
+import traceback
+from typing import Dict, Optional
+
+from metadata.utils.logger import utils_logger
+
+logger = utils_logger()
+
+
+class StateStore:
+    """
+    Key-value state stored in a local JSON file.
+
+    Reads return the values of the previous run. New values are staged
+    and only become part of the state once committed, e.g., when the sink
+    has acknowledged the record. Values of the previous run still valid
+    need to be kept. Anything else is dropped when saving the state.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.previous: Dict[str, str] = {}
+        self.current: Dict[str, str] = {}
+        self.staged: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as file:
+                    self.previous = json.load(file)
+            except (OSError, ValueError) as exc:
+                logger.debug(traceback.format_exc())
+                logger.warning(f"Ignoring the state file {path}: {exc}")
+
+    def get(self, key: str) -> Optional[str]:
+        return self.previous.get(key)
+
+    def stage(self, key: str, value: str) -> None:
+        with self._lock:
+            self.staged[key] = value
+
+    def commit(self, key: str) -> None:
+        with self._lock:
+            if key in self.staged:
+                self.current[key] = self.staged.pop(key)
+
+    def keep(self, key: str) -> None:
+        with self._lock:
+            if key in self.previous:
+                self.current[key] = self.previous[key]
+
+    def save(self) -> None:
+        """
+        Replace the state file with the committed and kept values
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with self._lock:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(self.current, file, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,168 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Test the approximate metrics and their sketches
+"""
+import os
+from unittest import TestCase
+from uuid import uuid4
+
+from sqlalchemy import Column, Integer, String, column, select
+from sqlalchemy.dialects import mssql, oracle
+from sqlalchemy.orm import declarative_base
+
+from metadata.generated.schema.entity.data.table import Column as EntityColumn
+from metadata.generated.schema.entity.data.table import ColumnName, DataType, Table
+from metadata.generated.schema.entity.services.connections.database.sqliteConnection import (
+    SQLiteConnection,
+    SQLiteScheme,
+)
+from metadata.orm_profiler.interfaces.sqa_profiler_interface import SQAProfilerInterface
+from metadata.orm_profiler.metrics.approximate.sketches import HyperLogLog, KLLSketch
+from metadata.orm_profiler.metrics.registry import Metrics
+from metadata.orm_profiler.orm.functions.approx import (
+    ApproxCountDistinctFn,
+    ApproxMedianFn,
+)
+from metadata.orm_profiler.profiler.core import Profiler
+from metadata.orm_profiler.profiler.query_planner import StaticMetricsQueryPlanner
+
+Base = declarative_base()
+
+
+class Numbers(Base):
+    __tablename__ = "numbers"
+    id = Column(Integer, primary_key=True)
+    value = Column(Integer)
+    label = Column(String(256))
+
+
+class SketchesTest(TestCase):
+    """
+    Check the accuracy of the sketches
+    """
+
+    def test_hyperloglog(self):
+        hll = HyperLogLog()
+        for value in range(10_000):
+            hll.update(value)
+            hll.update(value)
+        self.assertAlmostEqual(hll.count(), 10_000, delta=300)
+
+        small = HyperLogLog()
+        for value in ["a", "b", "c", "a"]:
+            small.update(value)
+        self.assertEqual(small.count(), 3)
+
+    def test_kll_quantiles(self):
+        kll = KLLSketch()
+        for value in range(100_000):
+            kll.update(value)
+
+        self.assertLess(sum(len(items) for items in kll.compactors), 2_000)
+        self.assertEqual(sum(weight for _, weight in kll.weighted_values()), 100_000)
+        self.assertAlmostEqual(kll.quantile(0.5), 50_000, delta=2_000)
+        self.assertEqual((kll.min, kll.max), (0, 99_999))
+        self.assertIsNone(KLLSketch().quantile(0.5))
+
+
+class ApproximateMetricsTest(TestCase):
+    """
+    Run the approximate metrics through the profiler
+    """
+
+    db_path = os.path.join(os.path.dirname(__file__), "test_approximate.db")
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        sqlite_conn = SQLiteConnection(
+            scheme=SQLiteScheme.sqlite_pysqlite,
+            databaseMode=cls.db_path + "?check_same_thread=False",
+        )
+        cls.sqa_profiler_interface = SQAProfilerInterface(
+            sqlite_conn,
+            table=Numbers,
+            table_entity=Table(
+                id=uuid4(),
+                name="numbers",
+                columns=[
+                    EntityColumn(name=ColumnName(__root__="id"), dataType=DataType.INT)
+                ],
+            ),
+        )
+        session = cls.sqa_profiler_interface.session
+        Numbers.__table__.create(bind=session.get_bind())
+        session.add_all(
+            [
+                Numbers(value=value % 100, label=f"label_{value % 10}")
+                for value in range(1_000)
+            ]
+            + [Numbers(value=None, label=None)]
+        )
+        session.commit()
+
+    def test_sketches_planned(self):
+        metrics = [
+            Metrics.COUNT.value,
+            Metrics.APPROX_DISTINCT_COUNT.value,
+            Metrics.APPROX_MEDIAN.value,
+        ]
+        columns = [(Numbers.value.property.columns[0], metrics)]
+
+        planner = StaticMetricsQueryPlanner("sqlite")
+        self.assertEqual(len(planner.plan(columns)[0].expressions), 1)
+        self.assertEqual(
+            planner.plan_sketches(columns)[0][1],
+            [Metrics.APPROX_DISTINCT_COUNT.value, Metrics.APPROX_MEDIAN.value],
+        )
+
+        # Native functions are fused with the other static metrics
+        planner = StaticMetricsQueryPlanner("oracle")
+        self.assertEqual(len(planner.plan(columns)[0].expressions), 3)
+        self.assertEqual(planner.plan_sketches(columns), [])
+
+    def test_profiler(self):
+        profiler = Profiler(
+            Metrics.COUNT.value,
+            Metrics.APPROX_DISTINCT_COUNT.value,
+            Metrics.APPROX_MEDIAN.value,
+            Metrics.APPROX_HISTOGRAM.value,
+            profiler_interface=self.sqa_profiler_interface,
+        )
+        profiler.compute_metrics()
+        results = profiler.column_results
+
+        self.assertEqual(results["value"]["valuesCount"], 1_000)
+        self.assertEqual(results["value"]["distinctCount"], 100)
+        self.assertEqual(results["label"]["distinctCount"], 10)
+        self.assertAlmostEqual(results["value"]["median"], 50, delta=1)
+        self.assertIsNone(results["label"].get("median"))
+        self.assertEqual(sum(results["value"]["histogram"]["frequencies"]), 1_000)
+
+    def test_native_functions(self):
+        query = select(
+            ApproxCountDistinctFn(column("value")), ApproxMedianFn(column("value"))
+        )
+
+        self.assertIn(
+            "APPROX_COUNT_DISTINCT(value)",
+            str(query.compile(dialect=mssql.dialect())),
+        )
+        compiled = str(query.compile(dialect=oracle.dialect()))
+        self.assertIn("APPROX_COUNT_DISTINCT(value)", compiled)
+        self.assertIn("APPROX_MEDIAN(value)", compiled)
+        # Exact computation on dialects without an approximation
+        self.assertIn("COUNT(DISTINCT value)", str(query))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        os.remove(cls.db_path)
@@ -0,0 +1,238 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Test the in process profiler of Datalake objects
+"""
+import io
+import json
+from unittest import TestCase
+from uuid import uuid4
+
+import pandas as pd
+
+from metadata.generated.schema.entity.data.table import Column as EntityColumn
+from metadata.generated.schema.entity.data.table import ColumnName, DataType, Table
+from metadata.generated.schema.entity.services.connections.database.datalakeConnection import (
+    DatalakeConnection,
+    S3Config,
+)
+from metadata.generated.schema.security.credentials.awsCredentials import AWSCredentials
+from metadata.orm_profiler.interfaces.datalake_profiler_interface import (
+    DatalakeProfilerInterface,
+)
+from metadata.orm_profiler.metrics.core import add_props
+from metadata.orm_profiler.metrics.registry import Metrics
+from metadata.orm_profiler.profiler.columnar import ColumnAggregator
+from metadata.orm_profiler.profiler.core import Profiler
+from metadata.utils import fqn
+from metadata.utils.datalake_utils import S3ObjectFile
+
+DATALAKE_CONNECTION = DatalakeConnection(
+    configSource=S3Config(
+        securityConfig=AWSCredentials(awsRegion="us-east-1"),
+    ),
+)
+
+
+class FakeS3Client:
+    """
+    Serve the objects from memory, keeping track of the range requests
+    """
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.ranges = []
+
+    def head_object(self, Bucket, Key):  # pylint: disable=invalid-name
+        return {"ContentLength": len(self.objects[(Bucket, Key)])}
+
+    def get_paginator(self, _):
+        return self
+
+    def paginate(self, Bucket, Prefix):  # pylint: disable=invalid-name
+        yield {
+            "Contents": [
+                {"Key": key}
+                for bucket, key in sorted(self.objects)
+                if bucket == Bucket and key.startswith(Prefix)
+            ]
+        }
+
+    def get_object(self, Bucket, Key, Range):  # pylint: disable=invalid-name
+        start, end = Range.replace("bytes=", "").split("-")
+        self.ranges.append((int(start), int(end)))
+        return {
+            "Body": io.BytesIO(self.objects[(Bucket, Key)][int(start) : int(end) + 1])
+        }
+
+
+def get_table_entity(key: str) -> Table:
+    return Table(
+        id=uuid4(),
+        name=key,
+        fullyQualifiedName=fqn._build("datalake", "default", "bucket", key),
+        columns=[
+            EntityColumn(name=ColumnName(__root__="id"), dataType=DataType.INT),
+            EntityColumn(name=ColumnName(__root__="age"), dataType=DataType.INT),
+            EntityColumn(name=ColumnName(__root__="name"), dataType=DataType.STRING),
+        ],
+    )
+
+
+ROWS = [
+    {"id": idx, "age": idx % 10 if idx % 5 else None, "name": f"name_{idx % 7}"}
+    for idx in range(100)
+]
+
+METRICS = [
+    Metrics.ROW_COUNT.value,
+    Metrics.COLUMN_COUNT.value,
+    Metrics.COUNT.value,
+    Metrics.NULL_COUNT.value,
+    Metrics.NULL_RATIO.value,
+    Metrics.MIN.value,
+    Metrics.MAX.value,
+    Metrics.SUM.value,
+    Metrics.MEAN.value,
+    Metrics.MEDIAN.value,
+    Metrics.DISTINCT_COUNT.value,
+    Metrics.UNIQUE_COUNT.value,
+    Metrics.MIN_LENGTH.value,
+    Metrics.MAX_LENGTH.value,
+    add_props(bins=3)(Metrics.HISTOGRAM.value),
+]
+
+
+class DatalakeProfilerTest(TestCase):
+    """
+    Profile CSV and JSON objects in batches
+    """
+
+    def get_profile(self, key: str, data: bytes, **kwargs):
+        client = FakeS3Client({("bucket", key): data})
+        interface = DatalakeProfilerInterface(
+            DATALAKE_CONNECTION,
+            table_entity=get_table_entity(key),
+            client=client,
+            batch_size=30,
+            **kwargs,
+        )
+        return Profiler(*METRICS, profiler_interface=interface).compute_metrics()
+
+    def assert_profile(self, profiler):
+        self.assertEqual(profiler._table_results["rowCount"], 100)
+        self.assertEqual(profiler._table_results["columnCount"], 3)
+
+        age = profiler._column_results["age"]
+        self.assertEqual(age["valuesCount"], 80)
+        self.assertEqual(age["nullCount"], 20)
+        self.assertEqual(age["nullProportion"], 0.2)
+        self.assertEqual((age["min"], age["max"]), (1, 9))
+        self.assertEqual(age["sum"], 400)
+        self.assertEqual(age["mean"], 5)
+        self.assertEqual(age["distinctCount"], 8)
+        self.assertEqual(sum(age["histogram"]["frequencies"]), 80)
+
+        name = profiler._column_results["name"]
+        self.assertEqual(name["distinctCount"], 7)
+        self.assertEqual(name["uniqueCount"], 0)
+        self.assertEqual((name["minLength"], name["maxLength"]), (6, 6))
+        self.assertNotIn("sum", name)
+
+        self.assertEqual(profiler._column_results["id"]["uniqueCount"], 100)
+
+    def test_csv(self):
+        data = pd.DataFrame(ROWS).to_csv(index=False).encode()
+        self.assert_profile(self.get_profile("users.csv", data))
+
+    def test_json_lines(self):
+        data = "\n".join(json.dumps(row) for row in ROWS).encode()
+        self.assert_profile(self.get_profile("users.json", data))
+
+    def test_partitioned_table(self):
+        rows = pd.DataFrame(ROWS)
+        client = FakeS3Client(
+            {
+                ("bucket", "users/dt=1/part-0.csv"): rows[:60]
+                .to_csv(index=False)
+                .encode(),
+                ("bucket", "users/dt=2/part-0.csv"): rows[60:]
+                .to_csv(index=False)
+                .encode(),
+                ("bucket", "users/_SUCCESS"): b"",
+            }
+        )
+        interface = DatalakeProfilerInterface(
+            DATALAKE_CONNECTION,
+            table_entity=get_table_entity("users"),
+            client=client,
+            batch_size=30,
+        )
+        self.assertEqual(
+            interface.keys, ["users/dt=1/part-0.csv", "users/dt=2/part-0.csv"]
+        )
+        self.assert_profile(
+            Profiler(*METRICS, profiler_interface=interface).compute_metrics()
+        )
+
+    def test_sample(self):
+        data = pd.DataFrame(ROWS).to_csv(index=False).encode()
+        profiler = self.get_profile("users.csv", data, profile_sample=50)
+
+        # All the rows are counted, the column metrics use the sample
+        self.assertEqual(profiler._table_results["rowCount"], 100)
+        self.assertLess(profiler._column_results["id"]["valuesCount"], 100)
+
+    def test_sample_data(self):
+        data = pd.DataFrame(ROWS).to_csv(index=False).encode()
+        interface = DatalakeProfilerInterface(
+            DATALAKE_CONNECTION,
+            table_entity=get_table_entity("users.csv"),
+            client=FakeS3Client({("bucket", "users.csv"): data}),
+        )
+        sample_data = interface.fetch_sample_data()
+        self.assertEqual(
+            [column.__root__ for column in sample_data.columns], ["id", "age", "name"]
+        )
+        self.assertEqual(len(sample_data.rows), 100)
+
+
+class ColumnarTest(TestCase):
+    """
+    Aggregates and range reads
+    """
+
+    def test_aggregator_batches(self):
+        values = pd.Series([3.0, None, 1.0, 2.0, 2.0])
+        aggregator = ColumnAggregator("col")
+        aggregator.update(values[:2])
+        aggregator.update(values[2:])
+
+        results = aggregator.get_results()
+        self.assertEqual(results["valuesCount"], 4)
+        self.assertEqual(results["nullCount"], 1)
+        self.assertEqual(results["mean"], 2.0)
+        self.assertAlmostEqual(results["stddev"], 0.5**0.5)
+        self.assertEqual(results["median"], 2.0)
+        self.assertEqual(results["distinctCount"], 3)
+        self.assertEqual(results["uniqueCount"], 2)
+
+    def test_range_reads(self):
+        data = bytes(range(256)) * 4
+        client = FakeS3Client({("bucket", "key"): data})
+        file = S3ObjectFile(client, "bucket", "key")
+
+        file.seek(-10, io.SEEK_END)
+        self.assertEqual(file.read(), data[-10:])
+        file.seek(100)
+        self.assertEqual(file.read(5), data[100:105])
+        self.assertEqual(client.ranges, [(1014, 1023), (100, 104)])
@@ -0,0 +1,251 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Test the incremental profiling of partitioned tables
+"""
+import os
+from datetime import date
+from unittest import TestCase
+from unittest.mock import patch
+from uuid import uuid4
+
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import declarative_base
+
+from metadata.generated.schema.entity.data.table import Column as EntityColumn
+from metadata.generated.schema.entity.data.table import ColumnName, DataType, Table
+from metadata.generated.schema.entity.services.connections.database.sqliteConnection import (
+    SQLiteConnection,
+    SQLiteScheme,
+)
+from metadata.generated.schema.entity.services.databaseService import (
+    DatabaseServiceType,
+)
+from metadata.orm_profiler.interfaces.sqa_profiler_interface import SQAProfilerInterface
+from metadata.orm_profiler.metrics.approximate.sketches import HyperLogLog
+from metadata.orm_profiler.metrics.registry import Metrics
+from metadata.orm_profiler.profiler.core import Profiler
+from metadata.orm_profiler.profiler.incremental import (
+    ColumnPartial,
+    IncrementalProfile,
+    TablePartial,
+)
+from metadata.orm_profiler.validations.models import TablePartitionConfig
+
+Base = declarative_base()
+
+
+class Events(Base):
+    __tablename__ = "events"
+    id = Column(Integer, primary_key=True)
+    day = Column(Integer)
+    amount = Column(Integer)
+    name = Column(String(256))
+
+
+METRICS = [
+    Metrics.ROW_COUNT.value,
+    Metrics.COUNT.value,
+    Metrics.NULL_COUNT.value,
+    Metrics.MIN.value,
+    Metrics.MAX.value,
+    Metrics.SUM.value,
+    Metrics.MEAN.value,
+    Metrics.DISTINCT_COUNT.value,
+    Metrics.NULL_RATIO.value,
+    Metrics.UNIQUE_COUNT.value,
+    Metrics.UNIQUE_RATIO.value,
+]
+
+
+def events_of_day(day: int):
+    return [
+        Events(day=day, amount=day * 10 + value, name=f"name_{day}_{value % 3}")
+        for value in range(10)
+    ] + [Events(day=day, amount=None, name=None)]
+
+
+class PartialsTest(TestCase):
+    """
+    Merge and serialize the partial aggregates
+    """
+
+    def test_merge(self):
+        # Values [1, 3] and [5, 7]
+        left = ColumnPartial.from_results(
+            {"valuesCount": 2, "nullCount": 1, "min": 1, "max": 3, "mean": 2.0},
+        )
+        right = ColumnPartial.from_results(
+            {
+                "valuesCount": 2,
+                "nullCount": 0,
+                "min": 5,
+                "max": 7,
+                "mean": 6.0,
+                "stddev": 1.0,
+            },
+        )
+        results = left.merge(right).get_results()
+
+        self.assertEqual(results["valuesCount"], 4)
+        self.assertEqual(results["nullCount"], 1)
+        self.assertEqual((results["min"], results["max"]), (1, 7))
+        self.assertEqual(results["mean"], 4.0)
+        # The stddev of the left values is missing
+        self.assertNotIn("stddev", results)
+
+        left.sum_squares = 10.0
+        results = left.merge(right).get_results()
+        self.assertAlmostEqual(results["stddev"], 5**0.5)
+
+    def test_serialization(self):
+        hll = HyperLogLog(precision=12)
+        for value in range(100):
+            hll.update(value)
+        partial = TablePartial(
+            high_water_mark=date(2022, 10, 1),
+            row_count=100,
+            columns={
+                "day": ColumnPartial(
+                    values_count=100, min=date(2022, 9, 1), max=date(2022, 10, 1)
+                ),
+                "id": ColumnPartial(values_count=100, total=4950.0, hll=hll),
+            },
+        )
+
+        loaded = TablePartial.loads(partial.dumps())
+        self.assertEqual(loaded.high_water_mark, date(2022, 10, 1))
+        self.assertEqual(loaded.columns["day"].min, date(2022, 9, 1))
+        self.assertAlmostEqual(
+            loaded.columns["id"].get_results()["distinctCount"], 100, delta=2
+        )
+        self.assertEqual(loaded.merge(TablePartial()).row_count, 100)
+
+
+class IncrementalProfileTest(TestCase):
+    """
+    Profile the new partitions only and merge them
+    """
+
+    db_path = os.path.join(os.path.dirname(__file__), "test_incremental.db")
+    sqlite_conn = SQLiteConnection(
+        scheme=SQLiteScheme.sqlite_pysqlite,
+        databaseMode=db_path + "?check_same_thread=False",
+    )
+    table_entity = Table(
+        id=uuid4(),
+        name="events",
+        columns=[EntityColumn(name=ColumnName(__root__="id"), dataType=DataType.INT)],
+    )
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        interface = cls.get_interface()
+        Events.__table__.create(bind=interface.session.get_bind())
+        interface.session.add_all(
+            [event for day in range(1, 4) for event in events_of_day(day)]
+        )
+        interface.session.commit()
+
+    @classmethod
+    def get_interface(
+        cls, high_water_mark=None, incremental=False, table_entity=None
+    ) -> SQAProfilerInterface:
+        return SQAProfilerInterface(
+            cls.sqlite_conn,
+            table=Events,
+            table_entity=table_entity or cls.table_entity,
+            partition_config=TablePartitionConfig(partitionField="day"),
+            high_water_mark=high_water_mark,
+            incremental=incremental,
+        )
+
+    def profile(self, incremental_profile=None, high_water_mark=None):
+        if incremental_profile:
+            high_water_mark = incremental_profile.high_water_mark
+        return Profiler(
+            *METRICS,
+            profiler_interface=self.get_interface(
+                high_water_mark,
+                incremental=incremental_profile is not None
+                or high_water_mark is not None,
+            ),
+            incremental_profile=incremental_profile,
+        ).compute_metrics()
+
+    def test_incremental_profile(self):
+        first = IncrementalProfile("day")
+        first_run = self.profile(first)
+        self.assertEqual(first.partial.high_water_mark, 3)
+        self.assertEqual(first.partial.row_count, 33)
+        self.assertEqual(first_run.column_results["amount"]["valuesCount"], 30)
+
+        interface = self.get_interface()
+        interface.session.add_all(
+            [event for day in range(4, 6) for event in events_of_day(day)]
+        )
+        interface.session.commit()
+
+        second = IncrementalProfile("day", TablePartial.loads(first.partial.dumps()))
+        self.assertEqual(second.high_water_mark, 3)
+
+        # Only the new partitions are profiled
+        new_rows = self.profile(high_water_mark=second.high_water_mark)
+        self.assertEqual(new_rows.column_results["amount"]["valuesCount"], 20)
+
+        incremental = self.profile(second)
+        full = self.profile()
+        self.assertEqual(second.partial.high_water_mark, 5)
+
+        self.assertEqual(
+            incremental._table_results["rowCount"], full._table_results["rowCount"]
+        )
+        for metric in ("valuesCount", "nullCount", "min", "max", "sum", "mean"):
+            self.assertEqual(
+                incremental.column_results["amount"][metric],
+                full.column_results["amount"][metric],
+            )
+        self.assertEqual(incremental.column_results["name"]["distinctCount"], 15)
+        self.assertEqual(incremental.column_results["name"]["nullProportion"], 5 / 55)
+
+        # The unique count of the new rows cannot be merged
+        self.assertIsNotNone(first_run.column_results["amount"]["uniqueCount"])
+        self.assertIsNone(incremental.column_results["amount"]["uniqueCount"])
+        self.assertIsNone(incremental.column_results["amount"]["uniqueProportion"])
+
+    @patch(
+        "metadata.orm_profiler.interfaces.sqa_profiler_interface.is_partitioned",
+        return_value=True,
+    )
+    def test_first_run_full_scan(self, _):
+        """The first incremental run of a partitioned table scans it all"""
+        table_entity = self.table_entity.copy(
+            update={"serviceType": DatabaseServiceType.BigQuery}
+        )
+        self.assertIsNotNone(
+            self.get_interface(table_entity=table_entity).partition_details
+        )
+        self.assertIsNone(
+            self.get_interface(
+                incremental=True, table_entity=table_entity
+            ).partition_details
+        )
+        self.assertEqual(
+            self.get_interface(
+                high_water_mark=3, incremental=True, table_entity=table_entity
+            ).partition_details,
+            {"partition_field": "day", "high_water_mark": 3},
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        os.remove(cls.db_path)
@@ -0,0 +1,132 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Test the static metrics query planner
+"""
+import os
+from unittest import TestCase
+from uuid import uuid4
+
+from sqlalchemy import Column, Integer, String, event, inspect
+from sqlalchemy.orm import declarative_base
+
+from metadata.generated.schema.entity.data.table import Column as EntityColumn
+from metadata.generated.schema.entity.data.table import ColumnName, DataType, Table
+from metadata.generated.schema.entity.services.connections.database.sqliteConnection import (
+    SQLiteConnection,
+    SQLiteScheme,
+)
+from metadata.orm_profiler.interfaces.sqa_profiler_interface import SQAProfilerInterface
+from metadata.orm_profiler.metrics.registry import Metrics
+from metadata.orm_profiler.profiler.core import Profiler
+from metadata.orm_profiler.profiler.query_planner import StaticMetricsQueryPlanner
+
+Base = declarative_base()
+
+
+class Wide(Base):
+    __tablename__ = "wide"
+    id = Column(Integer, primary_key=True)
+    name = Column(String(256))
+    age = Column(Integer)
+    city = Column(String(256))
+
+
+STATIC_METRICS = [
+    Metrics.COUNT.value,
+    Metrics.NULL_COUNT.value,
+    Metrics.MIN.value,
+    Metrics.MAX.value,
+    Metrics.MEAN.value,
+    Metrics.DISTINCT_COUNT.value,
+]
+
+
+class QueryPlannerTest(TestCase):
+    """
+    Fuse the static metrics of all the columns
+    """
+
+    db_path = os.path.join(os.path.dirname(__file__), "test_planner.db")
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        sqlite_conn = SQLiteConnection(
+            scheme=SQLiteScheme.sqlite_pysqlite,
+            databaseMode=cls.db_path + "?check_same_thread=False",
+        )
+        cls.sqa_profiler_interface = SQAProfilerInterface(
+            sqlite_conn,
+            table=Wide,
+            table_entity=Table(
+                id=uuid4(),
+                name="wide",
+                columns=[
+                    EntityColumn(name=ColumnName(__root__="id"), dataType=DataType.INT)
+                ],
+            ),
+        )
+        session = cls.sqa_profiler_interface.session
+        Wide.__table__.create(bind=session.get_bind())
+        session.add_all(
+            [
+                Wide(name="John", age=30, city="Paris"),
+                Wide(name="Jane", age=31, city=None),
+                Wide(name="John", age=None, city="Lyon"),
+            ]
+        )
+        session.commit()
+
+    def test_plan_split(self):
+        columns = [(col, STATIC_METRICS) for col in inspect(Wide).c]
+
+        queries = StaticMetricsQueryPlanner("sqlite").plan(columns)
+        self.assertEqual(len(queries), 1)
+        # MIN and MAX are not computed for strings
+        self.assertEqual(len(queries[0].expressions), 20)
+
+        # The metrics of a column are kept together
+        queries = StaticMetricsQueryPlanner("sqlite", max_expressions=11).plan(columns)
+        self.assertEqual([len(query.columns) for query in queries], [2, 2])
+
+        queries = StaticMetricsQueryPlanner("sqlite", max_columns=3).plan(columns)
+        self.assertEqual([len(query.columns) for query in queries], [3, 1])
+
+    def test_single_scan(self):
+        queries = []
+        engine = self.sqa_profiler_interface.session.get_bind()
+
+        def count_query(conn, cursor, statement, *args):
+            if "FROM wide" in statement:
+                queries.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count_query)
+        try:
+            profiler = Profiler(
+                *STATIC_METRICS,
+                profiler_interface=self.sqa_profiler_interface,
+            )
+            profiler.compute_metrics()
+        finally:
+            event.remove(engine, "before_cursor_execute", count_query)
+
+        self.assertEqual(len(queries), 1)
+        results = profiler.column_results
+        self.assertEqual(results["name"]["distinctCount"], 2)
+        self.assertEqual(results["age"]["nullCount"], 1)
+        self.assertEqual(results["age"]["mean"], 30.5)
+        self.assertEqual(results["age"]["min"], 30)
+        self.assertEqual(results["id"]["valuesCount"], 3)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        os.remove(cls.db_path)
@@ -16,7 +16,8 @@ import os
 from unittest import TestCase
 from uuid import uuid4
 
-from sqlalchemy import TEXT, Column, Integer, String, func
+from sqlalchemy import TEXT, Column, Integer, String, func, inspect
+from sqlalchemy.dialects import mssql, postgresql
 from sqlalchemy.orm import declarative_base
 
 from metadata.generated.schema.entity.data.table import Column as EntityColumn
@@ -25,8 +26,12 @@ from metadata.generated.schema.entity.services.connections.database.sqliteConnec
     SQLiteConnection,
     SQLiteScheme,
 )
+from metadata.generated.schema.metadataIngestion.databaseServiceProfilerPipeline import (
+    SamplingMethodType,
+)
 from metadata.orm_profiler.interfaces.sqa_profiler_interface import SQAProfilerInterface
 from metadata.orm_profiler.metrics.registry import Metrics
+from metadata.orm_profiler.orm.functions.table_sample import native_sample
 from metadata.orm_profiler.orm.registry import CustomTypes
 from metadata.orm_profiler.profiler.core import Profiler
 from metadata.orm_profiler.profiler.sampler import Sampler
@@ -307,6 +312,75 @@ class SampleTest(TestCase):
         names = [col.__root__ for col in sample_data.columns]
         assert names == ["id", "name"]
 
+    def test_materialized_sample(self):
+        """
+        All the metrics and the sample data should
+        be computed over the same materialized rows
+        """
+        sqa_profiler_interface = SQAProfilerInterface(
+            self.sqlite_conn,
+            table=User,
+            table_entity=self.table_entity,
+            profile_sample=50,
+            sampling_method=SamplingMethodType.Materialized,
+        )
+        sample_table = sqa_profiler_interface.sampler.sample_table
+        assert sample_table is not None
+        assert sample_table.name in inspect(self.engine).get_table_names()
+
+        sample_count = self.session.query(func.count()).select_from(sample_table)
+        expected = sample_count.scalar()
+        assert expected < 30
+
+        profiler = Profiler(
+            Metrics.COUNT.value,
+            Metrics.NULL_COUNT.value,
+            profiler_interface=sqa_profiler_interface,
+        )
+        res = profiler.compute_metrics()._column_results
+        assert res.get(User.id.name)[Metrics.COUNT.name] == expected
+        assert res.get(User.name.name)[Metrics.COUNT.name] == expected
+
+        sample_data = sqa_profiler_interface.fetch_sample_data()
+        assert len(sample_data.rows) == expected
+
+        sqa_profiler_interface.close()
+        assert sample_table.name not in inspect(self.engine).get_table_names()
+
+    def test_native_sample(self):
+        """
+        TABLESAMPLE is used on the databases supporting it
+        """
+        sample = native_sample(User.__table__, 50, "postgresql")
+        query = str(
+            self.session.query(User.id)
+            .select_from(sample)
+            .statement.compile(dialect=postgresql.dialect())
+        )
+        assert "TABLESAMPLE system(50.0) REPEATABLE (42)" in query
+
+        sample = native_sample(User.__table__, 50, "mssql")
+        query = str(
+            self.session.query(User.id)
+            .select_from(sample)
+            .statement.compile(dialect=mssql.dialect())
+        )
+        assert "TABLESAMPLE SYSTEM (50.0 PERCENT) REPEATABLE (42)" in query
+
+        # SQLite falls back to the random sample
+        sampler = Sampler(
+            session=self.session,
+            table=User,
+            profile_sample=50.0,
+            sampling_method=SamplingMethodType.Native,
+        )
+        res = (
+            self.session.query(func.count())
+            .select_from(sampler.random_sample())
+            .first()
+        )
+        assert res[0] < 30
+
     @classmethod
     def tearDownClass(cls) -> None:
         os.remove(cls.db_path)
@@ -12,6 +12,7 @@
 """
 Validate workflow configs and filters
 """
+import time
 import uuid
 from copy import deepcopy
 from unittest.mock import patch
@@ -24,6 +25,7 @@ from metadata.generated.schema.entity.data.table import (
     Column,
     DataType,
     Table,
+    TableProfile,
     TableProfilerConfig,
 )
 from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
@@ -33,6 +35,7 @@ from metadata.generated.schema.metadataIngestion.databaseServiceProfilerPipeline
     DatabaseServiceProfilerPipeline,
 )
 from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.orm_profiler.api.models import ProfilerProcessorConfig
 from metadata.orm_profiler.api.workflow import ProfilerWorkflow
 from metadata.orm_profiler.interfaces.sqa_profiler_interface import SQAProfilerInterface
@@ -260,3 +263,89 @@ def test_service_name_validation_raised():
     """
     with raises(ValueError, match="Service name `.*` does not exist"):
         ProfilerWorkflow.create(config)
+
+
+def get_profiled_table(name: str, row_count: float = None, timestamp: int = None):
+    return Table(
+        id=uuid.uuid4(),
+        name=name,
+        fullyQualifiedName=f"service.db.schema.{name}",
+        columns=[Column(name="id", dataType=DataType.INT)],
+        profile=TableProfile(timestamp=timestamp, rowCount=row_count)
+        if timestamp
+        else None,
+    )
+
+
+@patch.object(OpenMetadata, "validate_versions")
+@patch.object(ProfilerWorkflow, "_retrieve_service_connection_if_needed")
+@patch.object(
+    ProfilerWorkflow,
+    "_validate_service_name",
+    return_value=True,
+)
+def test_sort_entities(*_):
+    """
+    Tables are ordered by the configured priority
+    """
+    tables = [
+        get_profiled_table("small", row_count=10, timestamp=2),
+        get_profiled_table("new"),
+        get_profiled_table("big", row_count=1000, timestamp=3),
+        get_profiled_table("old", row_count=100, timestamp=1),
+    ]
+    priority_config = deepcopy(config)
+
+    workflow = ProfilerWorkflow.create(priority_config)
+    assert workflow.sort_entities(tables) == tables
+
+    priority_config["source"]["sourceConfig"]["config"]["tablePriority"] = "RowCount"
+    workflow = ProfilerWorkflow.create(priority_config)
+    assert [table.name.__root__ for table in workflow.sort_entities(tables)] == [
+        "big",
+        "old",
+        "small",
+        "new",
+    ]
+
+    priority_config["source"]["sourceConfig"]["config"]["tablePriority"] = "Staleness"
+    workflow = ProfilerWorkflow.create(priority_config)
+    assert [table.name.__root__ for table in workflow.sort_entities(tables)] == [
+        "new",
+        "old",
+        "small",
+        "big",
+    ]
+
+
+@patch.object(OpenMetadata, "validate_versions")
+@patch.object(ProfilerWorkflow, "_retrieve_service_connection_if_needed")
+@patch.object(
+    ProfilerWorkflow,
+    "_validate_service_name",
+    return_value=True,
+)
+def test_profile_entities(*_):
+    """
+    Tables are profiled in parallel and slow tables time out
+    """
+    parallel_config = deepcopy(config)
+    parallel_config["source"]["sourceConfig"]["config"].update(
+        {"tableThreadCount": 3, "tableTimeout": 1}
+    )
+    workflow = ProfilerWorkflow.create(parallel_config)
+    tables = [get_profiled_table(name) for name in ("a", "slow", "b", "c", "d")]
+
+    def profile_entity(entity, *_):
+        time.sleep(3 if entity.name.__root__ == "slow" else 0.5)
+        return entity.name.__root__
+
+    with patch.object(workflow, "profile_entity", side_effect=profile_entity):
+        start = time.monotonic()
+        results = list(workflow.profile_entities(tables, None, None))
+        elapsed = time.monotonic() - start
+
+    assert sorted(profile for _, profile in results) == ["a", "b", "c", "d"]
+    assert workflow.status.failures == ["service.db.schema.slow"]
+    # 4 tables of 0.5 seconds on the 2 remaining workers
+    assert elapsed < 2
@@ -0,0 +1,193 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Datalake unit test
+"""
+import io
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+from uuid import uuid4
+
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.ingestion.source.database.datalake import DatalakeSource
+from metadata.utils.datalake_utils import (
+    get_partitioned_table,
+    infer_schema,
+    list_keys,
+    read_batches,
+)
+
+CONFIG = {
+    "source": {
+        "type": "datalake",
+        "serviceName": "local_datalake",
+        "serviceConnection": {
+            "config": {
+                "type": "Datalake",
+                "configSource": {
+                    "securityConfig": {"awsRegion": "us-east-2"},
+                },
+                "bucketName": "bucket",
+                "groupPartitions": True,
+            }
+        },
+        "sourceConfig": {"config": {"type": "DatabaseMetadata", "threadCount": 4}},
+    },
+    "sink": {"type": "metadata-rest", "config": {}},
+    "workflowConfig": {
+        "openMetadataServerConfig": {
+            "hostPort": "http://localhost:8585/api",
+            "authProvider": "no-auth",
+        }
+    },
+}
+
+OBJECTS = {
+    "users.csv": b"id,name\n1,Alice\n2,Bob\n",
+    "raw/logs.json": b'{"id": 1, "message": "hi"}\n{"id": 2, "message": "bye"}\n',
+    "events/dt=2022-10-01/part-0.csv": b"id,kind\n1,click\n",
+    "events/dt=2022-10-01/part-1.csv": b"id,kind\n2,view\n",
+    "events/dt=2022-10-02/part-0.csv": b"id,kind\n3,click\n",
+    "events/_SUCCESS": b"",
+}
+
+
+class FakePaginator:
+    """
+    Pages of two objects, grouping the keys by delimiter
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    # pylint: disable=invalid-name
+    def paginate(self, Bucket, Prefix="", Delimiter=None):
+        self.client.listed.append(Prefix)
+        keys, prefixes = [], set()
+        for key in sorted(self.client.objects):
+            if not key.startswith(Prefix):
+                continue
+            rest = key[len(Prefix) :]
+            if Delimiter and Delimiter in rest:
+                prefixes.add(Prefix + rest.split(Delimiter)[0] + Delimiter)
+            else:
+                keys.append(key)
+        for idx in range(0, max(len(keys), 1), 2):
+            yield {"Contents": [{"Key": key} for key in keys[idx : idx + 2]]}
+        if prefixes:
+            yield {
+                "CommonPrefixes": [{"Prefix": prefix} for prefix in sorted(prefixes)]
+            }
+
+
+class FakeS3Client:
+    """
+    List and serve the objects with range requests
+    """
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.listed = []
+        self.ranges = []
+
+    def get_paginator(self, operation):
+        assert operation == "list_objects_v2"
+        return FakePaginator(self)
+
+    def head_object(self, Bucket, Key):  # pylint: disable=invalid-name
+        return {"ContentLength": len(self.objects[Key])}
+
+    def get_object(self, Bucket, Key, Range):  # pylint: disable=invalid-name
+        start, end = Range.replace("bytes=", "").split("-")
+        self.ranges.append(Key)
+        return {"Body": io.BytesIO(self.objects[Key][int(start) : int(end) + 1])}
+
+
+class DatalakeSourceTest(TestCase):
+    """
+    List the objects concurrently and infer their schema
+    """
+
+    @patch("metadata.ingestion.source.database.datalake.OpenMetadata")
+    @patch("metadata.ingestion.source.database.datalake.get_connection")
+    def setUp(self, get_connection, _):
+        self.client = FakeS3Client(OBJECTS)
+        get_connection.return_value = SimpleNamespace(client=self.client)
+        self.source = DatalakeSource.create(
+            CONFIG["source"],
+            OpenMetadataConnection(hostPort="http://localhost:8585/api"),
+        )
+        self.source.context.database_schema = SimpleNamespace(
+            name=SimpleNamespace(__root__="bucket"), id=uuid4()
+        )
+
+    def test_list_keys(self):
+        keys = list(
+            list_keys(
+                self.client,
+                self.source.service_connection.configSource,
+                "bucket",
+                max_workers=4,
+            )
+        )
+        self.assertEqual(sorted(keys), sorted(OBJECTS))
+        # The first level prefixes are listed on their own
+        self.assertEqual(sorted(self.client.listed), ["", "events/", "raw/"])
+
+    def test_partitioned_table(self):
+        self.assertEqual(
+            get_partitioned_table("events/dt=2022-10-01/part-0.csv"), "events"
+        )
+        self.assertEqual(
+            get_partitioned_table("a/b/year=2022/month=10/part.csv"), "a/b"
+        )
+        self.assertIsNone(get_partitioned_table("dt=2022-10-01/part-0.csv"))
+        self.assertIsNone(get_partitioned_table("raw/logs.json"))
+
+    def test_json_formats(self):
+        """JSON Lines, arrays and pretty-printed objects"""
+        documents = {
+            "lines": b'\n{"id": 1, "message": "hi"}\n{"id": 2, "message": "bye"}\n',
+            "array": b'[\n  {"id": 1, "message": "a"},\n  {"id": 2, "message": "b"}\n]',
+            "object": b'{\n  "id": 1,\n  "message": "hi"\n}\n',
+        }
+        for name, content in documents.items():
+            rows = 1 if name == "object" else 2
+            schema = infer_schema(io.BytesIO(content), f"{name}.json")
+            self.assertEqual(list(schema.columns), ["id", "message"], name)
+            batches = list(read_batches(io.BytesIO(content), f"{name}.json"))
+            self.assertEqual(sum(len(batch) for batch in batches), rows, name)
+
+    def test_tables(self):
+        tables = [name for name, _ in self.source.get_tables_name_and_type()]
+        self.assertEqual(sorted(tables), ["events", "raw/logs.json", "users.csv"])
+
+        requests = {
+            request.name.__root__: request
+            for table in tables
+            for request in self.source.yield_table((table, "Regular"))
+        }
+        self.assertEqual(
+            [column.name.__root__ for column in requests["events"].columns],
+            ["id", "kind"],
+        )
+        self.assertEqual(
+            [column.name.__root__ for column in requests["raw/logs.json"].columns],
+            ["id", "message"],
+        )
+        # The partitioned table is read from a single object
+        self.assertEqual(
+            len({key for key in self.client.ranges if key.startswith("events/")}), 1
+        )
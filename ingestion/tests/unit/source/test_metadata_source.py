@@ -0,0 +1,137 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Metadata source export unit test
+"""
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.entity.data.topic import Topic
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.ingestion.source.metadata.metadata_elasticsearch import (
+    MetadataElasticsearchSource,
+)
+from metadata.ingestion.source.metadata.openmetadata import OpenmetadataSource
+
+INCLUDE = {
+    "includeTables": True,
+    "includeTopics": True,
+    "includeDashboards": False,
+    "includePipelines": False,
+    "includeMlModels": False,
+    "includeUsers": False,
+    "includeTeams": False,
+    "includeGlossaryTerms": False,
+    "includePolicy": False,
+    "includeMessagingServices": False,
+    "includeDatabaseServices": False,
+    "includePipelineServices": False,
+    "includeTags": False,
+}
+
+PAGES = {
+    "Table": [["t0", "t1"], ["t2", "t3"], ["t4"]],
+    "Topic": [["k0", "k1"], ["k2"]],
+}
+
+
+def get_config(connection: dict) -> dict:
+    return {
+        "type": "metadata",
+        "serviceName": "metadata",
+        "serviceConnection": {"config": {**INCLUDE, **connection}},
+        "sourceConfig": {"config": {"type": "DatabaseMetadata"}},
+    }
+
+
+def list_entities(entity, fields, after, limit):
+    """
+    Page through the names of each entity type
+    """
+    pages = PAGES[entity.__name__]
+    page = int(after or 0)
+    after = str(page + 1) if page + 1 < len(pages) else None
+    return SimpleNamespace(
+        entities=[SimpleNamespace(name=name) for name in pages[page]], after=after
+    )
+
+
+def list_raw_entities(**kwargs):
+    entities_list = list_entities(**kwargs)
+    return {
+        "data": [{"name": entity.name} for entity in entities_list.entities],
+        "paging": {"after": entities_list.after} if entities_list.after else {},
+    }
+
+
+class MetadataSourceTest(TestCase):
+    """
+    Export the entity types concurrently, prefetching their pages
+    """
+
+    @patch("metadata.ingestion.source.metadata.metadata.OpenMetadata")
+    def get_source(self, source_class, connection, metadata):
+        metadata.return_value.list_entities.side_effect = (
+            list_raw_entities if connection.get("rawData") else list_entities
+        )
+        return source_class.create(
+            get_config(connection),
+            OpenMetadataConnection(hostPort="http://localhost:8585/api"),
+        )
+
+    def test_sequential(self):
+        source = self.get_source(
+            MetadataElasticsearchSource, {"type": "MetadataES", "limitRecords": 2}
+        )
+        self.assertEqual(
+            [entity.name for entity in source.next_record()],
+            ["t0", "t1", "t2", "t3", "t4", "k0", "k1", "k2"],
+        )
+
+    def test_concurrent(self):
+        source = self.get_source(
+            MetadataElasticsearchSource,
+            {"type": "MetadataES", "threadCount": 2, "prefetchPages": 1},
+        )
+        self.assertEqual(
+            source.get_entity_types()[1], (Topic, ["owner", "tags", "followers"])
+        )
+        names = [entity.name for entity in source.next_record()]
+        self.assertEqual(sorted(names), sorted(sum(sum(PAGES.values(), []), [])))
+        # Each type keeps the order of its pages
+        self.assertEqual(
+            [name for name in names if name[0] == "t"], ["t0", "t1", "t2", "t3", "t4"]
+        )
+
+    def test_raw_data(self):
+        source = self.get_source(
+            OpenmetadataSource,
+            {"hostPort": "http://localhost:8585/api", "rawData": True},
+        )
+        entities = list(source.fetch_entities(Table, ["columns"]))
+        self.assertEqual(entities[0], {"name": "t0"})
+        self.assertEqual(len(entities), 5)
+        self.assertEqual(len(source.status.success), 5)
+
+    def test_stop(self):
+        source = self.get_source(
+            MetadataElasticsearchSource,
+            {"type": "MetadataES", "threadCount": 2, "prefetchPages": 1},
+        )
+        records = source.next_record()
+        next(records)
+        # Closing the export releases the threads waiting on the full queue
+        records.close()
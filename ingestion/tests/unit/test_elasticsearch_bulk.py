@@ -0,0 +1,118 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the batching of the Elasticsearch bulk indexer
+"""
+import json
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from metadata.ingestion.api.sink import SinkStatus
+from metadata.ingestion.sink.elasticsearch_bulk import ElasticsearchBulkIndexer
+
+
+def bulk_response(body: str, **kwargs) -> dict:
+    """
+    Acknowledge every action, rejecting the documents named "bad"
+    """
+    lines = body.splitlines()
+    items = []
+    for action, source in zip(lines[::2], lines[1::2]):
+        result = {"_id": json.loads(action)["index"]["_id"], "status": 201}
+        if json.loads(source)["name"] == "bad":
+            result = {**result, "status": 400, "error": {"type": "mapper_parsing"}}
+        items.append({"index": result})
+    return {"errors": any("error" in item["index"] for item in items), "items": items}
+
+
+class ElasticsearchBulkIndexerTest(TestCase):
+    """
+    Check batches, status accounting and refresh handling
+    """
+
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self.client.bulk.side_effect = bulk_response
+        self.status = SinkStatus()
+
+    def get_indexer(self, **kwargs) -> ElasticsearchBulkIndexer:
+        return ElasticsearchBulkIndexer(
+            client=self.client, status=self.status, **kwargs
+        )
+
+    def index(self, indexer: ElasticsearchBulkIndexer, names):
+        for idx, name in enumerate(names):
+            indexer.index(
+                index_name="table_search_index",
+                doc_id=str(idx),
+                body=json.dumps({"name": name}),
+                name=name,
+            )
+
+    def test_batch_size(self):
+        indexer = self.get_indexer(batch_size=2)
+        self.index(indexer, ["a", "b", "c", "d", "e"])
+        indexer.join()
+
+        self.assertEqual(self.client.bulk.call_count, 3)
+        self.assertEqual(self.status.records, ["a", "b", "c", "d", "e"])
+        body = self.client.bulk.call_args_list[0].kwargs["body"]
+        self.assertEqual(
+            body.splitlines()[0],
+            json.dumps({"index": {"_index": "table_search_index", "_id": "0"}}),
+        )
+
+    def test_batch_bytes(self):
+        indexer = self.get_indexer(batch_size=100, batch_bytes=150)
+        self.index(indexer, ["a", "b", "c"])
+        indexer.join()
+
+        # Each document takes ~70 bytes
+        self.assertEqual(self.client.bulk.call_count, 2)
+
+    def test_item_and_batch_failures(self):
+        indexer = self.get_indexer(batch_size=2)
+        self.index(indexer, ["a", "bad"])
+        indexer.join()
+
+        self.assertEqual(self.status.records, ["a"])
+        self.assertEqual(len(self.status.failures), 1)
+        self.assertTrue(self.status.failures[0].startswith("bad"))
+
+        self.client.bulk.side_effect = ConnectionError("unreachable")
+        self.index(indexer, ["c", "d"])
+        indexer.join()
+        self.assertEqual(len(self.status.failures), 3)
+
+    def test_refresh(self):
+        self.client.indices.get_settings.return_value = {
+            "table_search_index": {"settings": {"index": {"refresh_interval": "5s"}}}
+        }
+        indexer = self.get_indexer()
+        indexer.disable_refresh(["table_search_index"])
+        self.client.indices.put_settings.assert_called_with(
+            index="table_search_index",
+            body={"index": {"refresh_interval": "-1"}},
+            request_timeout=30,
+        )
+
+        self.index(indexer, ["a"])
+        self.client.bulk.assert_not_called()
+        indexer.close()
+
+        self.assertEqual(self.status.records, ["a"])
+        self.client.indices.put_settings.assert_called_with(
+            index="table_search_index",
+            body={"index": {"refresh_interval": "5s"}},
+            request_timeout=30,
+        )
+        self.client.indices.refresh.assert_called_once()
@@ -0,0 +1,89 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the parent entities used by the Elasticsearch documents
+"""
+import uuid
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from metadata.generated.schema.entity.data.database import Database
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.ingestion.sink.elasticsearch import ElasticsearchSink
+
+DATABASE_ID = str(uuid.uuid4())
+SCHEMA_ID = str(uuid.uuid4())
+
+
+def get_table(name: str, schema_name: str = None) -> Table:
+    return Table(
+        id=uuid.uuid4(),
+        name=name,
+        fullyQualifiedName=f"service.db.schema.{name}",
+        version=0.1,
+        updatedAt=0,
+        href="http://localhost:8585/api/v1/tables",
+        columns=[{"name": "id", "dataType": "INT", "tags": []}],
+        tags=[],
+        service={"id": str(uuid.uuid4()), "type": "databaseService", "name": "service"},
+        serviceType="Mysql",
+        database={"id": DATABASE_ID, "type": "database"},
+        databaseSchema={
+            "id": SCHEMA_ID,
+            "type": "databaseSchema",
+            "name": schema_name,
+        },
+    )
+
+
+class ElasticsearchSinkTest(TestCase):
+    """
+    Parents are read from the references, or fetched once
+    """
+
+    @patch("metadata.ingestion.sink.elasticsearch.OpenMetadata")
+    @patch("metadata.ingestion.sink.elasticsearch.Elasticsearch")
+    def setUp(self, *_):
+        self.sink = ElasticsearchSink.create(
+            {"es_host": "localhost", "parent_cache_size": 10},
+            OpenMetadataConnection(hostPort="http://localhost:8585/api"),
+        )
+        self.sink.metadata.get_by_id.side_effect = lambda entity, entity_id: (
+            SimpleNamespace(name=SimpleNamespace(__root__=f"{entity.__name__}_name"))
+        )
+
+    def test_parent_names(self):
+        docs = [
+            self.sink._create_table_es_doc(get_table(name, schema_name="schema"))
+            for name in ("orders", "customers", "items")
+        ]
+
+        # The schema name comes from the reference, the database is fetched once
+        self.sink.metadata.get_by_id.assert_called_once_with(
+            entity=Database, entity_id=DATABASE_ID
+        )
+        for doc in docs:
+            self.assertEqual(doc.database_suggest[0]["input"], ["Database_name"])
+            self.assertEqual(doc.schema_suggest[0]["input"], ["schema"])
+
+    def test_bounded_cache(self):
+        self.sink.parent_cache.capacity = 1
+        self.sink._create_table_es_doc(get_table("orders"))
+        self.sink._create_table_es_doc(get_table("customers"))
+
+        # Database and schema evict each other
+        self.assertEqual(self.sink.metadata.get_by_id.call_count, 4)
+        self.assertEqual(len(self.sink.parent_cache), 1)
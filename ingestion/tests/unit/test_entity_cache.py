@@ -0,0 +1,270 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the entity cache and its use in the OpenMetadata client
+"""
+import time
+import uuid
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from metadata.generated.schema.api.data.createDatabase import CreateDatabaseRequest
+from metadata.generated.schema.entity.data.dashboard import Dashboard
+from metadata.generated.schema.entity.data.database import Database
+from metadata.generated.schema.entity.data.table import (
+    SqlQuery,
+    Table,
+    TableProfilerConfig,
+)
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.generated.schema.type.usageRequest import UsageRequest
+from metadata.ingestion.api.workflow import Workflow
+from metadata.ingestion.ometa.client import REST
+from metadata.ingestion.ometa.entity_cache import EntityCache
+from metadata.ingestion.ometa.ometa_api import OpenMetadata
+
+SERVICE = EntityReference(id=uuid.uuid4(), type="databaseService", name="service")
+
+
+def get_database(name: str) -> Database:
+    return Database(
+        id=uuid.uuid4(),
+        name=name,
+        fullyQualifiedName=f"service.{name}",
+        service=SERVICE,
+    )
+
+
+class EntityCacheTest(TestCase):
+    """
+    Check expiration, eviction and invalidation
+    """
+
+    def test_hit_and_miss(self):
+        cache = EntityCache()
+        database = get_database("db")
+        key = EntityCache.key(Database, "name", "service.db", ["*"])
+
+        self.assertIsNone(cache.get(key))
+        cache.put(key, database)
+        self.assertEqual(cache.get(key), database)
+        self.assertIsNone(cache.get(EntityCache.key(Database, "name", "service.db")))
+
+        self.assertEqual(cache.status.hits, 1)
+        self.assertEqual(cache.status.misses, 2)
+        self.assertEqual(cache.status.as_obj()["hit_rate"], 33.33)
+
+    def test_ttl(self):
+        cache = EntityCache(ttl=0)
+        key = EntityCache.key(Database, "name", "service.db")
+        cache.put(key, get_database("db"))
+
+        time.sleep(0.01)
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.status.expirations, 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_eviction(self):
+        cache = EntityCache(max_size=2)
+        keys = [EntityCache.key(Database, "name", f"service.db{i}") for i in range(3)]
+        cache.put(keys[0], get_database("db0"))
+        cache.put(keys[1], get_database("db1"))
+        # Use the first entity, so that the second one is evicted
+        cache.get(keys[0])
+        cache.put(keys[2], get_database("db2"))
+
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertEqual(cache.status.evictions, 1)
+
+    def test_invalidate_by_id(self):
+        cache = EntityCache()
+        database = get_database("db")
+        by_name = EntityCache.key(Database, "name", "service.db", ["*"])
+        by_id = EntityCache.key(Database, "id", database.id)
+        cache.put(by_name, database)
+        cache.put(by_id, database)
+
+        cache.invalidate(Database, database.id)
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.status.invalidations, 2)
+
+    def test_copies(self):
+        cache = EntityCache()
+        database = get_database("db")
+        key = EntityCache.key(Database, "name", "service.db")
+        cache.put(key, database)
+
+        database.description = "updated by the caller"
+        cached = cache.get(key)
+        self.assertIsNone(cached.description)
+
+        cached.description = "updated by the reader"
+        self.assertIsNone(cache.get(key).description)
+
+
+class OMetaEntityCacheTest(TestCase):
+    """
+    Check the read-through and write-through behavior of the client
+    """
+
+    metadata = OpenMetadata(
+        OpenMetadataConnection(
+            hostPort="http://localhost:8585/api", enableVersionValidation=False
+        )
+    )
+
+    def setUp(self) -> None:
+        OpenMetadata.entity_cache = EntityCache()
+
+    def tearDown(self) -> None:
+        OpenMetadata.entity_cache = None
+
+    def test_read_through(self):
+        database = get_database("db")
+        with patch.object(REST, "get", return_value=database.dict()) as get:
+            self.metadata.get_by_name(Database, "service.db", fields=["*"])
+            self.metadata.get_by_name(Database, "service.db", fields=["*"])
+            self.assertEqual(get.call_count, 1)
+
+            self.metadata.get_by_name(Database, "service.db")
+            self.assertEqual(get.call_count, 2)
+
+    def test_invalidate_on_write(self):
+        database = get_database("db")
+        with patch.object(
+            REST, "get", return_value=database.dict()
+        ) as get, patch.object(REST, "put", return_value=database.dict()):
+            self.metadata.get_by_name(Database, "service.db")
+            self.metadata.create_or_update(
+                CreateDatabaseRequest(name="db", service=SERVICE)
+            )
+            self.metadata.get_by_name(Database, "service.db")
+            self.assertEqual(get.call_count, 2)
+
+        with patch.object(
+            REST, "get", return_value=database.dict()
+        ) as get, patch.object(REST, "delete"):
+            self.metadata.get_by_id(Database, database.id)
+            self.metadata.delete(Database, database.id)
+            self.metadata.get_by_id(Database, database.id)
+            self.assertEqual(get.call_count, 2)
+
+    def test_invalidate_on_mixin_write(self):
+        table = Table(
+            id=uuid.uuid4(),
+            name="orders",
+            fullyQualifiedName="service.db.schema.orders",
+            columns=[],
+        )
+        profiler_config = TableProfilerConfig(profileSample=50)
+        with patch.object(REST, "get", return_value=table.dict()) as get, patch.object(
+            REST, "put", return_value=table.dict()
+        ):
+            self.metadata.get_by_name(Table, "service.db.schema.orders")
+            self.metadata.create_or_update_table_profiler_config(
+                "service.db.schema.orders", profiler_config
+            )
+            self.metadata.get_by_name(Table, "service.db.schema.orders")
+            self.assertEqual(get.call_count, 2)
+
+            self.metadata.ingest_table_queries_data(
+                table, [SqlQuery(query="select 1", checksum="1")]
+            )
+            self.metadata.get_by_id(Table, table.id)
+            self.assertEqual(get.call_count, 3)
+
+        dashboard = Dashboard(
+            id=uuid.uuid4(),
+            name="sales",
+            service=EntityReference(id=uuid.uuid4(), type="dashboardService"),
+        )
+        with patch.object(
+            REST, "get", return_value=dashboard.dict()
+        ) as get, patch.object(REST, "put"):
+            self.metadata.get_by_id(Dashboard, dashboard.id)
+            self.metadata.publish_dashboard_usage(
+                dashboard, UsageRequest(date="2022-10-01", count=1)
+            )
+            self.metadata.get_by_id(Dashboard, dashboard.id)
+            self.assertEqual(get.call_count, 2)
+
+
+@patch.object(Workflow, "_retrieve_dbt_config_source_if_needed")
+@patch.object(Workflow, "_retrieve_service_connection_if_needed")
+@patch.object(Workflow, "get", return_value=MagicMock())
+class WorkflowCachesTest(TestCase):
+    """
+    The caches are only installed while their workflow runs
+    """
+
+    @staticmethod
+    def create_workflow(enabled: bool, **workflow_config) -> Workflow:
+        return Workflow.create(
+            {
+                "source": {
+                    "type": "mysql",
+                    "serviceName": "local_mysql",
+                    "serviceConnection": {
+                        "config": {
+                            "type": "Mysql",
+                            "username": "openmetadata_user",
+                            "hostPort": "localhost:3306",
+                        }
+                    },
+                    "sourceConfig": {"config": {"type": "DatabaseMetadata"}},
+                },
+                "sink": {"type": "metadata-rest", "config": {}},
+                "workflowConfig": {
+                    "openMetadataServerConfig": {
+                        "hostPort": "http://localhost:8585/api",
+                        "authProvider": "no-auth",
+                    },
+                    "entityCache": {"enabled": enabled},
+                    **workflow_config,
+                },
+            }
+        )
+
+    def tearDown(self) -> None:
+        OpenMetadata.entity_cache = None
+        OpenMetadata.fqn_index = None
+
+    def test_reset_on_stop(self, *_):
+        workflow = self.create_workflow(enabled=True)
+        self.assertIs(OpenMetadata.entity_cache, workflow.entity_cache)
+
+        workflow.stop()
+        self.assertIsNone(OpenMetadata.entity_cache)
+        # Its status is still reported
+        self.assertIsNotNone(workflow.entity_cache)
+
+    def test_disabled(self, *_):
+        self.create_workflow(enabled=True)
+        workflow = self.create_workflow(enabled=False)
+        self.assertIsNone(workflow.entity_cache)
+        self.assertIsNone(OpenMetadata.entity_cache)
+
+    def test_fqn_index_reset_on_stop(self, *_):
+        workflow = self.create_workflow(enabled=False, fqnIndex={"enabled": True})
+        self.assertIs(OpenMetadata.fqn_index, workflow.fqn_index)
+
+        workflow.stop()
+        self.assertIsNone(OpenMetadata.fqn_index)
+
+        self.create_workflow(enabled=False, fqnIndex={"enabled": True})
+        self.create_workflow(enabled=False)
+        self.assertIsNone(OpenMetadata.fqn_index)
@@ -0,0 +1,113 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the local index of tables used to build their FQN
+"""
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from metadata.generated.schema.entity.data.table import Table
+from metadata.ingestion.ometa.fqn_index import FQNIndex, normalize
+from metadata.utils import fqn
+
+TABLE_FQNS = [
+    "service.db.public.orders",
+    "service.db.sales.orders",
+    "service.other_db.public.Customers",
+    'service.db.public."events.v2"',
+]
+
+
+def get_metadata(fqn_index: FQNIndex) -> MagicMock:
+    metadata = MagicMock()
+    metadata.fqn_index = fqn_index
+    metadata.list_all_entity_fqns.return_value = [
+        (str(idx), table_fqn) for idx, table_fqn in enumerate(TABLE_FQNS)
+    ]
+    return metadata
+
+
+class FQNIndexTest(TestCase):
+    """
+    Resolve partial table names from the index
+    """
+
+    def build(self, metadata, database_name=None, schema_name=None, **kwargs):
+        return fqn.build(
+            metadata,
+            entity_type=Table,
+            service_name="service",
+            database_name=database_name,
+            schema_name=schema_name,
+            **kwargs,
+        )
+
+    def test_normalize(self):
+        self.assertEqual(normalize('"Orders"'), "orders")
+        self.assertEqual(normalize("`orders`"), "orders")
+        self.assertEqual(normalize("[Orders]"), "orders")
+        self.assertEqual(normalize('"orders'), '"orders')
+        self.assertIsNone(normalize(None))
+
+    def test_build(self):
+        metadata = get_metadata(FQNIndex())
+
+        self.assertEqual(
+            self.build(metadata, table_name="customers"),
+            "service.other_db.public.Customers",
+        )
+        self.assertEqual(
+            self.build(metadata, schema_name="SALES", table_name='"ORDERS"'),
+            "service.db.sales.orders",
+        )
+        self.assertEqual(
+            self.build(metadata, table_name="orders", fetch_multiple_entities=True),
+            ["service.db.public.orders", "service.db.sales.orders"],
+        )
+        self.assertEqual(
+            self.build(metadata, table_name="events.v2"),
+            'service.db.public."events.v2"',
+        )
+        # The full name does not need the index
+        self.assertEqual(
+            self.build(
+                metadata, database_name="db", schema_name="x", table_name="orders"
+            ),
+            "service.db.x.orders",
+        )
+
+        # The service is listed once, and ES only searched on misses
+        metadata.es_search_from_fqn.return_value = None
+        self.assertIsNone(self.build(metadata, table_name="missing"))
+        metadata.list_all_entity_fqns.assert_called_once()
+        metadata.es_search_from_fqn.assert_called_once()
+        self.assertEqual(metadata.fqn_index.status.hits, 4)
+        self.assertEqual(metadata.fqn_index.status.misses, 1)
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "index.json")
+            first = get_metadata(FQNIndex(file_path=file_path))
+            self.build(first, table_name="customers")
+
+            second = get_metadata(FQNIndex(file_path=file_path))
+            self.assertEqual(
+                self.build(second, table_name="customers"),
+                "service.other_db.public.Customers",
+            )
+            second.list_all_entity_fqns.assert_not_called()
+
+            expired = get_metadata(FQNIndex(file_path=file_path, ttl=0))
+            self.build(expired, table_name="customers")
+            expired.list_all_entity_fqns.assert_called_once()
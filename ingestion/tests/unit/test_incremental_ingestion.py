@@ -0,0 +1,185 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate that unchanged tables are skipped in incremental runs
+"""
+import json
+import os
+import tempfile
+import uuid
+from types import SimpleNamespace
+from unittest import TestCase
+
+from sqlalchemy import create_engine, inspect, text
+
+from metadata.generated.schema.entity.data.table import Table, TableType
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.generated.schema.type.basic import EntityName
+from metadata.ingestion.source.database.sqlite import SqliteSource
+from metadata.utils.state_store import StateStore
+
+METADATA_CONFIG = OpenMetadataConnection(
+    hostPort="http://localhost:8585/api", enableVersionValidation=False
+)
+
+TABLE_FQN = "local_sqlite.main.main.orders"
+
+
+def get_context_entity(name: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid5(uuid.NAMESPACE_DNS, name), name=EntityName(__root__=name)
+    )
+
+
+class StateStoreTest(TestCase):
+    """
+    Only committed and kept values are saved
+    """
+
+    def test_save(self):
+        path = os.path.join(tempfile.mkdtemp(), "state", "tables.json")
+        state = StateStore(path)
+        state.stage("committed", "a")
+        state.stage("not_acknowledged", "b")
+        state.commit("committed")
+        state.save()
+
+        state = StateStore(path)
+        self.assertEqual(state.get("committed"), "a")
+        self.assertIsNone(state.get("not_acknowledged"))
+
+        # Tables not seen in the run are dropped
+        state.keep("missing")
+        state.save()
+        with open(path, encoding="utf-8") as file:
+            self.assertEqual(json.load(file), {})
+
+
+class IncrementalIngestionTest(TestCase):
+    """
+    Run the table stage of a SQLite source several times
+    """
+
+    def setUp(self) -> None:
+        tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(tmp_dir, "test.db")
+        self.state_path = os.path.join(tmp_dir, "state.json")
+        with create_engine(f"sqlite:///{self.db_path}").begin() as conn:
+            conn.execute(text("CREATE TABLE orders (id INTEGER PRIMARY KEY)"))
+
+    def get_source(self) -> SqliteSource:
+        source = SqliteSource.create(
+            {
+                "type": "sqlite",
+                "serviceName": "local_sqlite",
+                "serviceConnection": {
+                    "config": {"type": "SQLite", "databaseMode": self.db_path}
+                },
+                "sourceConfig": {
+                    "config": {
+                        "type": "DatabaseMetadata",
+                        "incrementalStateFilePath": self.state_path,
+                    }
+                },
+            },
+            METADATA_CONFIG,
+        )
+        source.database_source_state = set()
+        source.context.database_service = get_context_entity("local_sqlite")
+        source.context.database = get_context_entity("main")
+        source.context.database_schema = get_context_entity("main")
+        source.context.tags = []
+        source.inspector = inspect(source.engine)
+        return source
+
+    def run_table(self, source: SqliteSource) -> list:
+        requests = list(source.yield_table(("orders", TableType.Regular)))
+        # The sink acknowledged the tables
+        source.table_state.commit(TABLE_FQN)
+        source.close()
+        return requests
+
+    def test_skip_unchanged_tables(self):
+        source = self.get_source()
+        self.assertEqual(len(self.run_table(source)), 1)
+
+        source = self.get_source()
+        self.assertEqual(self.run_table(source), [])
+        self.assertEqual(source.status.unchanged, [TABLE_FQN])
+        # Unchanged tables are not marked as deleted
+        self.assertIn(TABLE_FQN, source.database_source_state)
+
+        with create_engine(f"sqlite:///{self.db_path}").begin() as conn:
+            conn.execute(text("ALTER TABLE orders ADD COLUMN amount INTEGER"))
+
+        source = self.get_source()
+        requests = self.run_table(source)
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(len(requests[0].columns), 2)
+
+    def test_not_acknowledged(self):
+        source = self.get_source()
+        list(source.yield_table(("orders", TableType.Regular)))
+        source.close()
+
+        source = self.get_source()
+        self.assertEqual(len(self.run_table(source)), 1)
+
+    def test_process_ack(self):
+        """
+        Only the tables written by the sink are committed
+        """
+        stage = next(
+            stage
+            for stage in SqliteSource.topology.table.stages
+            if stage.type_ is Table
+        )
+
+        source = self.get_source()
+        (request,) = list(source.yield_table(("orders", TableType.Regular)))
+        # The sink failed to write the table
+        source.process_ack(stage, request, None)
+        source.close()
+
+        source = self.get_source()
+        (request,) = list(source.yield_table(("orders", TableType.Regular)))
+        source.process_ack(
+            stage,
+            request,
+            SimpleNamespace(fullyQualifiedName=EntityName(__root__=TABLE_FQN)),
+        )
+        source.close()
+
+        source = self.get_source()
+        self.assertEqual(list(source.yield_table(("orders", TableType.Regular))), [])
+
+    def test_unchanged_views(self):
+        """
+        Unchanged views are still processed for lineage
+        """
+        with create_engine(f"sqlite:///{self.db_path}").begin() as conn:
+            conn.execute(text("CREATE VIEW orders_view AS SELECT * FROM orders"))
+
+        for _ in range(2):
+            source = self.get_source()
+            source.context.table_views = []
+            list(source.yield_table(("orders_view", TableType.View)))
+            source.table_state.commit(f"{TABLE_FQN}_view")
+            source.close()
+
+        self.assertEqual(source.status.unchanged, [f"{TABLE_FQN}_view"])
+        self.assertEqual(
+            [view["table_name"] for view in source.context.table_views],
+            ["orders_view"],
+        )
@@ -0,0 +1,118 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the detection and deletion of the tables missing from the source
+"""
+import os
+import tempfile
+import uuid
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, inspect, text
+
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.generated.schema.type.basic import EntityName
+from metadata.ingestion.models.table_metadata import DeleteTables
+from metadata.ingestion.ometa.client import REST, APIError
+from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.ingestion.source.database.sqlite import SqliteSource
+
+METADATA_CONFIG = OpenMetadataConnection(
+    hostPort="http://localhost:8585/api", enableVersionValidation=False
+)
+
+TABLE_IDS = {
+    name: str(uuid.uuid5(uuid.NAMESPACE_DNS, name))
+    for name in ("orders", "customers", "dropped")
+}
+
+
+def list_tables(path: str, data: dict) -> dict:
+    """
+    Answer the tables of the schema in two pages
+    """
+    assert data == {"database": "local_sqlite.main.main"}
+    if "after=" not in path:
+        names, paging = ["orders", "dropped"], {"after": "cursor", "total": 3}
+    else:
+        names, paging = ["customers"], {"total": 3}
+    return {
+        "data": [
+            {
+                "id": TABLE_IDS[name],
+                "fullyQualifiedName": f"local_sqlite.main.main.{name}",
+            }
+            for name in names
+        ],
+        "paging": paging,
+    }
+
+
+class MarkDeletedTablesTest(TestCase):
+    """
+    Compare the OpenMetadata tables with the source state
+    """
+
+    metadata = OpenMetadata(METADATA_CONFIG)
+
+    def test_deleted_tables(self):
+        db_path = os.path.join(tempfile.mkdtemp(), "test.db")
+        with create_engine(f"sqlite:///{db_path}").begin() as conn:
+            conn.execute(text("CREATE TABLE orders (id INTEGER)"))
+        source = SqliteSource.create(
+            {
+                "type": "sqlite",
+                "serviceName": "local_sqlite",
+                "serviceConnection": {
+                    "config": {"type": "SQLite", "databaseMode": db_path}
+                },
+                "sourceConfig": {"config": {"type": "DatabaseMetadata"}},
+            },
+            METADATA_CONFIG,
+        )
+        source.inspector = inspect(source.engine)
+        source.context.database = SimpleNamespace(name=EntityName(__root__="main"))
+        source.database_source_state = {
+            "local_sqlite.main.main.orders",
+            "local_sqlite.main.main.customers",
+        }
+
+        with patch.object(REST, "get", side_effect=list_tables) as get:
+            records = list(source.mark_tables_as_deleted())
+
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(len(records), 1)
+        self.assertIsInstance(records[0], DeleteTables)
+        self.assertEqual(
+            [str(table.id.__root__) for table in records[0].tables],
+            [TABLE_IDS["dropped"]],
+        )
+
+    def test_delete_many(self):
+        def delete(method: str, path: str, data=None):
+            self.assertEqual(method, "DELETE")
+            if TABLE_IDS["customers"] in path:
+                raise APIError({"code": 500, "message": "error"})
+
+        with patch.object(REST, "_request", side_effect=delete) as rest_delete:
+            deleted = self.metadata.delete_many(
+                entity=Table,
+                entity_ids=[TABLE_IDS["orders"], TABLE_IDS["customers"]],
+            )
+
+        self.assertEqual(deleted, [True, False])
+        self.assertEqual(rest_delete.call_count, 2)
@@ -0,0 +1,238 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the MetadataRestSink buffering of create requests
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from metadata.generated.schema.api.data.createDatabase import CreateDatabaseRequest
+from metadata.generated.schema.entity.data.database import Database
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.ingestion.api.topology_runner import TopologyRunnerMixin
+from metadata.ingestion.api.workflow import Workflow
+from metadata.ingestion.models.topology import (
+    NodeStage,
+    ServiceTopology,
+    TopologyNode,
+    create_source_context,
+)
+from metadata.ingestion.ometa.client import REST, APIError
+from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.ingestion.sink.metadata_rest import MetadataRestSink
+
+SERVICE = EntityReference(id=uuid.uuid4(), type="databaseService", name="service")
+DATABASES = 5
+
+
+def mock_create_or_update_many(_, data, max_workers):
+    """
+    Return the Database entities created from the requests
+    """
+    return [
+        Database(
+            id=uuid.uuid4(),
+            name=create_request.name,
+            fullyQualifiedName=f"service.{create_request.name.__root__}",
+            service=SERVICE,
+        )
+        for create_request in data
+    ]
+
+
+class MockTopology(ServiceTopology):
+    root = TopologyNode(
+        producer="get_database_names",
+        stages=[
+            NodeStage(
+                type_=Database,
+                context="database",
+                processor="yield_database",
+                defer_ack=True,
+            )
+        ],
+    )
+
+
+class MockSource(TopologyRunnerMixin):
+    """
+    Source receiving the written databases in `process_ack`
+    """
+
+    topology = MockTopology()
+
+    def __init__(self):
+        self.context = create_source_context(self.topology)
+        self.acknowledged = []
+
+    @staticmethod
+    def get_database_names():
+        for idx in range(DATABASES):
+            yield f"db{idx}"
+
+    @staticmethod
+    def yield_database(name: str):
+        yield CreateDatabaseRequest(name=name, service=SERVICE)
+
+    def process_ack(self, stage, entity_request, entity):
+        self.acknowledged.append((entity_request, entity))
+
+    def get_status(self):
+        return SimpleNamespace(as_obj=lambda: {})
+
+
+@patch.object(OpenMetadata, "create_or_update_many", mock_create_or_update_many)
+class MetadataRestSinkTest(TestCase):
+    """
+    Check the bulk mode of the sink
+    """
+
+    metadata_config = OpenMetadataConnection(
+        hostPort="http://localhost:8585/api", enableVersionValidation=False
+    )
+
+    def test_buffer_until_bulk_size(self):
+        sink = MetadataRestSink.create({"bulk_size": 3}, self.metadata_config)
+
+        sink.write_record(CreateDatabaseRequest(name="db1", service=SERVICE))
+        sink.write_record(CreateDatabaseRequest(name="db2", service=SERVICE))
+        self.assertEqual(len(sink.get_status().records), 0)
+
+        sink.write_record(CreateDatabaseRequest(name="db3", service=SERVICE))
+        self.assertEqual(len(sink.get_status().records), 3)
+        self.assertEqual(sink.create_buffer, {})
+
+    def test_flush_on_close(self):
+        sink = MetadataRestSink.create({"bulk_size": 10}, self.metadata_config)
+
+        sink.write_record(CreateDatabaseRequest(name="db1", service=SERVICE))
+        self.assertEqual(len(sink.get_status().records), 0)
+
+        sink.close()
+        self.assertEqual(sink.get_status().records, ["Database: service.db1"])
+
+    def test_acknowledge_buffered_record(self):
+        sink = MetadataRestSink.create({"bulk_size": 10}, self.metadata_config)
+
+        sink.write_record(CreateDatabaseRequest(name="db1", service=SERVICE))
+        record = CreateDatabaseRequest(name="db2", service=SERVICE)
+        sink.write_record(record)
+
+        entity = sink.acknowledge(record)
+        self.assertEqual(entity.name.__root__, "db2")
+        self.assertEqual(len(sink.get_status().records), 2)
+
+        other = CreateDatabaseRequest(name="db3", service=SERVICE)
+        self.assertIsNone(sink.acknowledge(other))
+
+    def test_acknowledge_written_record(self):
+        sink = MetadataRestSink.create({}, self.metadata_config)
+        record = CreateDatabaseRequest(name="db1", service=SERVICE)
+
+        with patch.object(
+            OpenMetadata,
+            "create_or_update",
+            lambda _, data: mock_create_or_update_many(_, [data], 1)[0],
+        ):
+            sink.write_record(record)
+
+        self.assertEqual(sink.acknowledge(record).name.__root__, "db1")
+        self.assertIsNone(
+            sink.acknowledge(CreateDatabaseRequest(name="db1", service=SERVICE))
+        )
+
+    def test_topology_deferred_acks(self):
+        """
+        Deferred acks let the sink send the requests in batches
+        """
+        sink = MetadataRestSink.create({"bulk_size": 2}, self.metadata_config)
+        source = MockSource()
+        batches = []
+
+        def create_or_update_many(_, data, max_workers):
+            batches.append(len(data))
+            return mock_create_or_update_many(_, data, max_workers)
+
+        with patch.object(OpenMetadata, "create_or_update_many", create_or_update_many):
+            Workflow.execute(
+                SimpleNamespace(
+                    source=source,
+                    sink=sink,
+                    report={},
+                    entity_cache=None,
+                    fqn_index=None,
+                )
+            )
+
+        self.assertEqual(batches, [2, 2, 1])
+        self.assertEqual(len(source.acknowledged), DATABASES)
+        for entity_request, entity in source.acknowledged:
+            self.assertEqual(entity.name, entity_request.name)
+        self.assertEqual(sink.pending_acks, {})
+
+    def test_pending_acks_on_failure(self):
+        sink = MetadataRestSink.create({"bulk_size": 10}, self.metadata_config)
+        acknowledged = []
+
+        record = CreateDatabaseRequest(name="db1", service=SERVICE)
+        sink.write_record(record)
+        self.assertIsNone(sink.acknowledge(record, callback=acknowledged.append))
+        # Pending acks are kept while more records are buffered
+        sink.write_record(CreateDatabaseRequest(name="db2", service=SERVICE))
+        self.assertEqual(acknowledged, [])
+
+        with patch.object(
+            OpenMetadata,
+            "create_or_update_many",
+            lambda _, data, max_workers: [None] * len(data),
+        ):
+            sink.close()
+        self.assertEqual(acknowledged, [None])
+
+
+class CreateOrUpdateManyTest(TestCase):
+    """
+    Check the requests sent by create_or_update_many
+    """
+
+    metadata = OpenMetadata(
+        OpenMetadataConnection(
+            hostPort="http://localhost:8585/api", enableVersionValidation=False
+        )
+    )
+
+    def test_put_many(self):
+        def put(method: str, path: str, data=None):
+            self.assertEqual((method, path), ("PUT", "/databases"))
+            create_request = CreateDatabaseRequest.parse_raw(data)
+            if create_request.name.__root__ == "db2":
+                raise APIError({"code": 500, "message": "error"})
+            return mock_create_or_update_many(None, [create_request], 1)[0].dict()
+
+        with patch.object(REST, "_request", side_effect=put) as rest_put:
+            created = self.metadata.create_or_update_many(
+                [
+                    CreateDatabaseRequest(name=name, service=SERVICE)
+                    for name in ("db1", "db2", "db3")
+                ]
+            )
+
+        self.assertEqual(rest_put.call_count, 3)
+        self.assertEqual(created[0].name.__root__, "db1")
+        self.assertIsNone(created[1])
+        self.assertEqual(created[2].name.__root__, "db3")
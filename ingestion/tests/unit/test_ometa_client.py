@@ -0,0 +1,149 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the REST client against a local stub server
+"""
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+
+from metadata.ingestion.ometa.client import REST, APIError, ClientConfig
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Echo the requests. /retry answers 429 with a Retry-After
+    until it has been called twice.
+    """
+
+    retried = 0
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+    def _answer(self, code: int, body: dict, headers: dict = None):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        if self.path.endswith("/retry"):
+            if StubHandler.retried < 2:
+                StubHandler.retried += 1
+                self._answer(429, {"message": "slow down"}, {"Retry-After": "0"})
+                return
+            self._answer(200, {"retried": StubHandler.retried})
+            return
+        if self.path.endswith("/missing"):
+            self._answer(404, {"code": 404, "message": "not found"})
+            return
+        # Answer the fastest requests first
+        if self.path.endswith("/0"):
+            time.sleep(0.1)
+        self._answer(200, {"path": self.path})
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        self._answer(
+            200,
+            {
+                "body": json.loads(body),
+                "encoding": self.headers.get("Content-Encoding"),
+            },
+        )
+
+
+class RESTClientTest(TestCase):
+    """
+    Check concurrency, retries and compression
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("localhost", 0), StubHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def get_client(self, **kwargs) -> REST:
+        return REST(
+            ClientConfig(
+                base_url=f"http://localhost:{self.server.server_port}/api",
+                auth_header="Authorization",
+                auth_token=lambda: ("no_token", 0),
+                **kwargs,
+            )
+        )
+
+    def test_get_many_keeps_order(self):
+        client = self.get_client()
+        paths = [f"/tables/{idx}" for idx in range(5)]
+
+        responses = client.get_many(paths)
+
+        self.assertEqual(
+            [response["path"] for response in responses],
+            [f"/api/v1/tables/{idx}" for idx in range(5)],
+        )
+
+    def test_return_exceptions(self):
+        client = self.get_client()
+
+        responses = client.get_many(
+            ["/tables/1", "/tables/missing"], return_exceptions=True
+        )
+
+        self.assertEqual(responses[0]["path"], "/api/v1/tables/1")
+        self.assertIsInstance(responses[1], APIError)
+        self.assertRaises(APIError, client.get_many, ["/tables/1", "/tables/missing"])
+
+    def test_retry_after(self):
+        StubHandler.retried = 0
+        # We would wait for 30s without honoring Retry-After
+        client = self.get_client(retry_wait=30)
+
+        start = time.time()
+        self.assertEqual(client.get("/retry"), {"retried": 2})
+        self.assertLess(time.time() - start, 5)
+
+    def test_backoff(self):
+        client = self.get_client(retry_wait=2, retry_max_wait=10)
+
+        for attempt, (low, high) in enumerate([(1, 2), (2, 4), (4, 8), (5, 10)]):
+            wait = client._get_retry_wait(attempt=attempt, retry_after=None)
+            self.assertTrue(low <= wait <= high)
+
+        self.assertEqual(client._get_retry_wait(attempt=0, retry_after=3), 3)
+        self.assertEqual(client._get_retry_wait(attempt=0, retry_after=60), 10)
+
+    def test_put_many_compressed(self):
+        client = self.get_client(compress_min_size=20)
+        payloads = [json.dumps({"name": "a"}), json.dumps({"name": "a" * 50})]
+
+        responses = client.put_many("/tables", payloads)
+
+        self.assertEqual(responses[0], {"body": {"name": "a"}, "encoding": None})
+        self.assertEqual(responses[1], {"body": {"name": "a" * 50}, "encoding": "gzip"})
@@ -0,0 +1,121 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the entities built from ES hits
+"""
+import uuid
+from unittest import TestCase
+from unittest.mock import patch
+
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.ingestion.ometa.client import REST
+from metadata.ingestion.ometa.ometa_api import OpenMetadata
+
+SCHEMA = {
+    "id": str(uuid.uuid4()),
+    "type": "databaseSchema",
+    "name": "schema",
+    "fullyQualifiedName": "service.db.schema",
+}
+
+
+def get_hit(name: str, **kwargs) -> dict:
+    return {
+        "_id": name,
+        "_source": {
+            "entityType": "table",
+            "id": str(uuid.uuid4()),
+            "name": name,
+            "fullyQualifiedName": f"service.db.schema.{name}",
+            "columns": [
+                {
+                    "name": "id",
+                    "dataType": "INT",
+                    "fullyQualifiedName": f"service.db.schema.{name}.id",
+                }
+            ],
+            "followers": ["alice"],
+            "suggest": [{"input": [name], "weight": 5}],
+            **kwargs,
+        },
+    }
+
+
+class OMetaESTest(TestCase):
+    """
+    Search entities without fetching each hit from the API
+    """
+
+    metadata = OpenMetadata(
+        OpenMetadataConnection(
+            hostPort="http://localhost:8585/api", enableVersionValidation=False
+        )
+    )
+
+    def search(self, hits, **kwargs):
+        with patch.object(REST, "get", return_value={"hits": {"hits": hits}}) as get:
+            return (
+                self.metadata.es_search_from_fqn(
+                    entity_type=Table,
+                    fqn_search_string="service.*.*.orders",
+                    **kwargs,
+                ),
+                get,
+            )
+
+    def test_entities_from_hits(self):
+        tables, get = self.search(
+            [get_hit("orders", databaseSchema=SCHEMA), get_hit("customers")]
+        )
+
+        get.assert_called_once()
+        self.assertEqual(
+            [table.fullyQualifiedName.__root__ for table in tables],
+            ["service.db.schema.orders", "service.db.schema.customers"],
+        )
+        self.assertEqual(tables[0].databaseSchema.name, "schema")
+        self.assertEqual(tables[0].columns[0].name.__root__, "id")
+        # Followers are indexed by name and cannot be read back
+        self.assertIsNone(tables[0].followers)
+
+    def test_projection(self):
+        _, get = self.search([get_hit("orders")], fields=["columns"])
+        query = get.call_args.args[0]
+        for field in ("id", "name", "columns", "fullyQualifiedName"):
+            self.assertIn(f"&include_source_fields={field}", query)
+
+    def test_missing_fields(self):
+        source = get_hit("customers")["_source"]
+        table = Table(
+            id=source["id"],
+            name=source["name"],
+            columns=source["columns"],
+            databaseSchema=SCHEMA,
+        )
+        with patch.object(
+            OpenMetadata, "get_by_name", return_value=table
+        ) as get_by_name:
+            tables, _ = self.search(
+                [get_hit("orders", databaseSchema=SCHEMA), get_hit("customers")],
+                fields=["databaseSchema"],
+            )
+
+        # Only the hit missing the schema is fetched
+        get_by_name.assert_called_once_with(
+            entity=Table,
+            fqn="service.db.schema.customers",
+            fields=["databaseSchema"],
+        )
+        self.assertEqual(len(tables), 2)
@@ -0,0 +1,129 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the OpenMetadata class registries used to build the endpoints
+"""
+import timeit
+from unittest import TestCase
+
+import pytest
+
+from metadata.generated.schema.api.data.createTable import CreateTableRequest
+from metadata.generated.schema.api.tags.createTagCategory import (
+    CreateTagCategoryRequest,
+)
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.generated.schema.entity.tags.tagCategory import TagCategory
+from metadata.generated.schema.entity.teams.user import User
+from metadata.ingestion.ometa.ometa_api import (
+    ENTITIES_WITHOUT_CREATE,
+    ENTITY_SUFFIXES,
+    MissingEntityTypeException,
+    OpenMetadata,
+)
+
+CALLS = 2000
+
+
+class OMetaRegistryTest(TestCase):
+    """
+    Check the suffix and Create <-> Entity lookups
+    """
+
+    server_config = OpenMetadataConnection(
+        hostPort="http://localhost:8585/api", enableVersionValidation=False
+    )
+    metadata = OpenMetadata(server_config)
+
+    def clear_registries(self):
+        OpenMetadata._suffix_registry.clear()
+        OpenMetadata._create_registry.clear()
+        OpenMetadata._entity_registry.clear()
+
+    def test_create_classes_share_suffix(self):
+        """
+        Every Create class resolves to the endpoint of its Entity
+        and back to the Entity itself
+        """
+        for entity, suffix in ENTITY_SUFFIXES.items():
+            self.assertEqual(self.metadata.get_suffix(entity), suffix)
+            if entity in ENTITIES_WITHOUT_CREATE:
+                continue
+
+            create = self.metadata.get_create_entity_type(entity)
+            self.assertEqual(self.metadata.get_suffix(create), suffix)
+            self.assertEqual(self.metadata.get_entity_from_create(create), entity)
+
+    def test_subclass_suffix(self):
+        """
+        Subclasses of registered types get the same endpoint
+        """
+
+        class CustomTable(Table):
+            """Table subclass"""
+
+        self.addCleanup(OpenMetadata._suffix_registry.pop, CustomTable, None)
+        self.assertEqual(self.metadata.get_suffix(CustomTable), "/tables")
+        self.assertIn(CustomTable, OpenMetadata._suffix_registry)
+
+    def test_missing_suffix(self):
+        self.assertRaises(
+            MissingEntityTypeException, self.metadata.get_suffix, OpenMetadata
+        )
+
+    def test_resolve_from_empty_registries(self):
+        """
+        Lookups on empty registries resolve the same types
+        as importing the Create classes on every call
+        """
+        self.clear_registries()
+        self.assertEqual(
+            self.metadata.get_entity_from_create(CreateTagCategoryRequest),
+            TagCategory,
+        )
+        self.assertEqual(self.metadata.get_suffix(User), "/users")
+        self.assertEqual(self.metadata.get_suffix(CreateTableRequest), "/tables")
+        self.assertEqual(
+            self.metadata.get_create_entity_type(Table), CreateTableRequest
+        )
+
+        for entity in set(ENTITY_SUFFIXES) - ENTITIES_WITHOUT_CREATE:
+            create = self.metadata._import_create_entity_type(entity)
+            self.assertIs(self.metadata.get_create_entity_type(entity), create)
+            self.assertIs(self.metadata.get_entity_from_create(create), entity)
+
+    @pytest.mark.slow
+    def test_lookup_overhead(self):
+        """
+        Benchmark resolving the types on every call, as we did before
+        having the registries, against the cached lookups. The timings
+        are only reported, as they depend on the machine running the tests.
+        """
+
+        def lookups():
+            self.metadata.get_suffix(User)
+            self.metadata.get_suffix(CreateTableRequest)
+            self.metadata.get_entity_from_create(CreateTagCategoryRequest)
+
+        def uncached_lookups():
+            self.clear_registries()
+            lookups()
+
+        uncached = timeit.timeit(uncached_lookups, number=CALLS // 10) * 10
+        cached = timeit.timeit(lookups, number=CALLS)
+        print(
+            f"{CALLS} lookups: {uncached:.4f}s resolving each call,"
+            f" {cached:.4f}s with registries"
+        )
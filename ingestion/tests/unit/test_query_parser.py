@@ -15,9 +15,11 @@ Validate query parser logic
 
 # Prevent sqllineage from modifying the logger config
 # Disable the DictConfigurator.configure method while importing LineageRunner
+from concurrent.futures import ThreadPoolExecutor
 from logging.config import DictConfigurator
 from unittest import TestCase
 
+from metadata.generated.schema.type.tableQuery import TableQueries, TableQuery
 from metadata.generated.schema.type.tableUsageCount import TableColumn, TableColumnJoin
 from metadata.ingestion.lineage.parser import (
     get_clean_parser_table_list,
@@ -25,6 +27,16 @@ from metadata.ingestion.lineage.parser import (
     get_parser_table_aliases,
     get_table_joins,
 )
+from metadata.ingestion.lineage.parser_cache import (
+    ParserCache,
+    fingerprint_query,
+    sql_parser_cache,
+)
+from metadata.ingestion.processor.query_parser import (
+    QueryParserProcessor,
+    parse_sql_statement,
+    parse_sql_statements,
+)
 
 configure = DictConfigurator.configure
 DictConfigurator.configure = lambda _: None
@@ -149,3 +161,123 @@ class QueryParserTests(TestCase):
                 ),
             ],
         )
+
+    def test_process_pool_keeps_order(self):
+        """
+        Queries parsed in chunks by the pool come back in order
+        """
+        queries = [
+            TableQuery(
+                query=f"select * from table_{idx}",
+                analysisDate="2022-08-01 00:00:00",
+                serviceName="service",
+                databaseName="db",
+            )
+            for idx in range(5)
+        ]
+        # Unparsable queries are skipped
+        queries.insert(2, TableQuery(query="select 1", serviceName="service"))
+
+        processor = QueryParserProcessor.create(
+            {"processes": 2, "chunk_size": 2, "query_timeout": 10}, None
+        )
+        try:
+            parsed = processor.process(TableQueries(queries=queries))
+        finally:
+            processor.close()
+
+        self.assertEqual(
+            [parsed_data.tables for parsed_data in parsed.parsedData],
+            [[f"table_{idx}"] for idx in range(5)],
+        )
+
+    def test_timeout_outside_main_thread(self):
+        """
+        SIGALRM is only available in the main thread, so
+        other threads parse the queries without timeout
+        """
+        query = TableQuery(
+            query="select * from orders",
+            analysisDate="2022-08-01 00:00:00",
+            serviceName="service",
+            databaseName="db",
+        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            parsed = executor.submit(parse_sql_statements, [query], 10).result()
+
+        self.assertEqual(parsed[0].tables, ["orders"])
+
+    def test_fingerprint(self):
+        """
+        Literals, comments and spaces do not change the query shape
+        """
+        self.assertEqual(
+            fingerprint_query("SELECT * FROM users WHERE id = 1 AND name = 'a'"),
+            fingerprint_query(
+                "/* dbt */ SELECT *\n  FROM users -- it's me\n"
+                "WHERE id = 42 AND name = 'it''s -- b'"
+            ),
+        )
+        self.assertNotEqual(
+            fingerprint_query("SELECT * FROM users WHERE id = 1"),
+            fingerprint_query("SELECT * FROM users_1 WHERE id = 1"),
+        )
+
+    def test_fingerprint_quoted_identifiers(self):
+        """
+        Digits in quoted identifiers are part of the query shape
+        """
+        for first, second in (
+            ('select * from "sales 2021"', 'select * from "sales 2022"'),
+            ('select * from db."2021"', 'select * from db."2022"'),
+            ("select * from `sales_2021`", "select * from `sales_2022`"),
+            ("select * from [sales 2021]", "select * from [sales 2022]"),
+            ('select "a""1" from t', 'select "a""2" from t'),
+        ):
+            self.assertNotEqual(fingerprint_query(first), fingerprint_query(second))
+
+        self.assertEqual(
+            fingerprint_query('select * from "sales 2021" where id = 1'),
+            fingerprint_query('select * from "sales 2021" where id = 2'),
+        )
+
+    def test_parser_cache(self):
+        """
+        Queries with the same shape are parsed once
+        """
+        cache = ParserCache()
+        parse_fn = lambda query: query.upper()
+
+        self.assertEqual(
+            cache.get_or_compute("select 1", "usage", parse_fn), "SELECT 1"
+        )
+        self.assertEqual(
+            cache.get_or_compute("select 2", "usage", parse_fn), "SELECT 1"
+        )
+        self.assertEqual(
+            cache.get_or_compute("select 2", "lineage", parse_fn), "SELECT 2"
+        )
+        self.assertEqual(cache.status.as_obj()["hit_rate"], 33.33)
+
+    def test_parse_same_shape(self):
+        """
+        Parsed data comes from the cache but keeps the query of the record
+        """
+        hits = sql_parser_cache.status.hits
+        records = [
+            TableQuery(
+                query=f"select * from orders o join customers c "
+                f"on o.customer_id = c.id where o.amount > {amount}",
+                analysisDate="2022-08-01 00:00:00",
+                serviceName="service",
+                databaseName="db",
+            )
+            for amount in (10, 20)
+        ]
+
+        first, second = [parse_sql_statement(record) for record in records]
+
+        self.assertEqual(sql_parser_cache.status.hits, hits + 1)
+        self.assertEqual(first.tables, second.tables)
+        self.assertEqual(first.joins, second.joins)
+        self.assertEqual(second.sql, records[1].query)
@@ -0,0 +1,218 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the schema catalog prefetch
+"""
+from unittest import TestCase
+
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.dialects import oracle, postgresql
+from sqlalchemy.sql import sqltypes
+from trino.sqlalchemy.dialect import TrinoDialect
+
+from metadata.ingestion.source.database.schema_catalog import (
+    OracleCatalogReflector,
+    SchemaCatalogInspector,
+    SchemaCatalogReflector,
+    get_schema_catalog_reflector,
+)
+
+
+class SQLiteCatalogReflector(SchemaCatalogReflector):
+    """
+    Read the catalog from tables shaped as information_schema
+    """
+
+    columns_query = """
+    SELECT table_name, column_name, data_type, char_length,
+           numeric_precision, numeric_scale, is_nullable, NULL, comment
+    FROM catalog_columns WHERE table_schema = :schema
+    ORDER BY table_name, position
+    """
+    constraints_query = """
+    SELECT table_name, constraint_name, constraint_type, column_name,
+           referred_schema, referred_table, referred_column
+    FROM catalog_constraints WHERE table_schema = :schema
+    """
+    table_comments_query = None
+    view_definitions_query = """
+    SELECT view_name, definition FROM catalog_views WHERE table_schema = :schema
+    """
+
+
+def create_catalog(engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE catalog_columns (table_schema, table_name, column_name,"
+                " position, data_type, char_length, numeric_precision, numeric_scale,"
+                " is_nullable, comment)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO catalog_columns VALUES"
+                " ('main', 'orders', 'id', 1, 'INTEGER', NULL, NULL, NULL, 'NO', NULL),"
+                " ('main', 'orders', 'code', 2, 'VARCHAR', 20, NULL, NULL, 'YES', 'Code'),"
+                " ('main', 'orders', 'amount', 3, 'NUMERIC', NULL, 10, 2, 'YES', NULL),"
+                " ('main', 'customers', 'id', 1, 'INTEGER', NULL, NULL, NULL, 'NO', NULL),"
+                " ('main', 'weird', 'geo', 1, 'GEOGRAPHY', NULL, NULL, NULL, 'YES', NULL)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE catalog_constraints (table_schema, table_name,"
+                " constraint_name, constraint_type, column_name, referred_schema,"
+                " referred_table, referred_column)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO catalog_constraints VALUES"
+                " ('main', 'orders', 'orders_pk', 'PRIMARY KEY', 'id',"
+                " NULL, NULL, NULL),"
+                " ('main', 'orders', 'orders_code', 'UNIQUE', 'code', NULL, NULL, NULL),"
+                " ('main', 'orders', 'orders_fk', 'FOREIGN KEY', 'customer_id',"
+                " 'main', 'customers', 'id')"
+            )
+        )
+        conn.execute(
+            text("CREATE TABLE catalog_views (table_schema, view_name, definition)")
+        )
+        conn.execute(
+            text(
+                "INSERT INTO catalog_views VALUES"
+                " ('main', 'orders_view', 'SELECT * FROM orders')"
+            )
+        )
+        conn.execute(text("CREATE TABLE weird (geo TEXT)"))
+
+
+class SchemaCatalogTest(TestCase):
+    """
+    Serve the table lookups from the prefetched catalog
+    """
+
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite://")
+        create_catalog(self.engine)
+        self.queries = []
+        event.listen(
+            self.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: self.queries.append(statement),
+        )
+        self.inspector = SchemaCatalogInspector(
+            inspect(self.engine), SQLiteCatalogReflector(self.engine.dialect), "main"
+        )
+
+    def test_columns(self):
+        orders = self.inspector.get_columns("orders", "main")
+        customers = self.inspector.get_columns("customers", "main")
+
+        self.assertEqual(len(self.queries), 1)
+        self.assertEqual([col["name"] for col in orders], ["id", "code", "amount"])
+        self.assertEqual([col["name"] for col in customers], ["id"])
+        self.assertFalse(orders[0]["nullable"])
+        self.assertIsInstance(orders[1]["type"], sqltypes.VARCHAR)
+        self.assertEqual(orders[1]["type"].length, 20)
+        self.assertEqual(orders[1]["comment"], "Code")
+        self.assertEqual(
+            (orders[2]["type"].precision, orders[2]["type"].scale), (10, 2)
+        )
+
+    def test_fallback(self):
+        # GEOGRAPHY is unknown to SQLite, so the dialect reflects it
+        weird = self.inspector.get_columns("weird", "main")
+        self.assertEqual([col["name"] for col in weird], ["geo"])
+        self.assertIn("PRAGMA", self.queries[-1])
+
+        # Table comments are not prefetched
+        self.assertRaises(
+            NotImplementedError, self.inspector.get_table_comment, "orders", "main"
+        )
+        # Other methods go to the inspector
+        self.assertIn("weird", self.inspector.get_table_names("main"))
+
+    def test_constraints(self):
+        self.assertEqual(
+            self.inspector.get_pk_constraint("orders", "main"),
+            {"name": "orders_pk", "constrained_columns": ["id"]},
+        )
+        self.assertEqual(
+            self.inspector.get_unique_constraints("orders", "main"),
+            [{"name": "orders_code", "column_names": ["code"]}],
+        )
+        self.assertEqual(
+            self.inspector.get_foreign_keys("orders", "main"),
+            [
+                {
+                    "name": "orders_fk",
+                    "constrained_columns": ["customer_id"],
+                    "referred_schema": "main",
+                    "referred_table": "customers",
+                    "referred_columns": ["id"],
+                }
+            ],
+        )
+        # Tables without constraints are known not to have any
+        self.assertEqual(
+            self.inspector.get_pk_constraint("customers", "main"),
+            {"name": None, "constrained_columns": []},
+        )
+        self.assertEqual(self.inspector.get_foreign_keys("customers", "main"), [])
+        self.assertEqual(len(self.queries), 1)
+
+    def test_view_definitions(self):
+        self.assertEqual(
+            self.inspector.get_view_definition("orders_view", "main"),
+            "SELECT * FROM orders",
+        )
+
+    def test_dialect_types(self):
+        reflector = get_schema_catalog_reflector(postgresql.dialect())
+        self.assertIsInstance(
+            reflector.get_column_type("character varying", 10, None, None),
+            postgresql.VARCHAR,
+        )
+        self.assertIsNone(reflector.get_column_type("USER-DEFINED", None, None, None))
+
+        reflector = get_schema_catalog_reflector(oracle.dialect())
+        self.assertIsInstance(reflector, OracleCatalogReflector)
+        self.assertIsInstance(
+            reflector.get_column_type("NUMBER", None, None, 0), sqltypes.INTEGER
+        )
+        self.assertIsInstance(
+            reflector.get_column_type("TIMESTAMP(6)", None, None, None),
+            sqltypes.TIMESTAMP,
+        )
+        self.assertEqual(reflector.normalize_name("ORDERS"), "orders")
+
+        self.assertIsNone(
+            get_schema_catalog_reflector(create_engine("sqlite://").dialect)
+        )
+
+    def test_trino_complex_types(self):
+        """
+        Keep the raw row and array types, from which
+        the column children are built
+        """
+        reflector = get_schema_catalog_reflector(TrinoDialect())
+        self.assertEqual(
+            reflector.get_raw_data_type("row(id bigint, tags array(varchar))"),
+            "struct<id:bigint,tags:array<varchar>>",
+        )
+        self.assertEqual(
+            reflector.get_raw_data_type("array(row(id bigint))"),
+            "array<struct<id:bigint>>",
+        )
+        self.assertIsNone(reflector.get_raw_data_type("varchar(10)"))
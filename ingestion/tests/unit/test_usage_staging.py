@@ -0,0 +1,131 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Validate the usage partitions written by the stage
+and streamed back by the bulk sink
+"""
+import os
+import tempfile
+from unittest import TestCase
+
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.generated.schema.type.queryParserData import ParsedData, QueryParserData
+from metadata.generated.schema.type.tableUsageCount import TableColumn, TableColumnJoin
+from metadata.ingestion.bulksink.metadata_usage import MetadataUsageBulkSink
+from metadata.ingestion.stage.table_usage import TableUsageStage
+
+METADATA_CONFIG = OpenMetadataConnection(
+    hostPort="http://localhost:8585/api", enableVersionValidation=False
+)
+
+JOIN = TableColumnJoin(
+    tableColumn=TableColumn(table="orders", column="customer_id"),
+    joinedWith=[TableColumn(table="customers", column="id")],
+)
+
+
+def get_parsed_data(tables, date="2022-08-01", joins=None) -> ParsedData:
+    return ParsedData(
+        tables=tables,
+        databaseName="db",
+        databaseSchema="schema",
+        sql=f"select * from {', '.join(tables)}",
+        serviceName="service",
+        date=date,
+        joins=joins or {},
+    )
+
+
+class UsageStagingTest(TestCase):
+    """
+    Stage usage in several files and merge it back
+    """
+
+    def setUp(self) -> None:
+        self.staging_dir = os.path.join(tempfile.mkdtemp(), "usage")
+
+    def get_stage(self, max_staged_queries: int) -> TableUsageStage:
+        return TableUsageStage.create(
+            {
+                "filename": self.staging_dir,
+                "max_staged_queries": max_staged_queries,
+            },
+            METADATA_CONFIG,
+        )
+
+    def test_aggregate_run(self):
+        stage = self.get_stage(max_staged_queries=100)
+        stage.stage_record(QueryParserData(parsedData=[get_parsed_data(["orders"])]))
+        stage.stage_record(
+            QueryParserData(parsedData=[get_parsed_data(["orders", "customers"])])
+        )
+        stage.close()
+
+        self.assertEqual(stage.table_usage[("orders", "2022-08-01")].count, 2)
+        self.assertEqual(stage.table_usage[("customers", "2022-08-01")].count, 1)
+        # Everything fits in memory, so we get a single file
+        self.assertEqual(
+            os.listdir(os.path.join(self.staging_dir, "service_2022-08-01")),
+            ["00000.json"],
+        )
+
+    def test_spill_and_merge(self):
+        stage = self.get_stage(max_staged_queries=2)
+        stage.stage_record(
+            QueryParserData(
+                parsedData=[
+                    get_parsed_data(["orders"], joins={"orders": [JOIN]}),
+                    get_parsed_data(["customers"]),
+                ]
+            )
+        )
+        stage.stage_record(
+            QueryParserData(
+                parsedData=[
+                    get_parsed_data(["orders"], joins={"orders": [JOIN]}),
+                    get_parsed_data(["orders"], date="2022-08-02"),
+                ]
+            )
+        )
+        stage.stage_record(QueryParserData(parsedData=[get_parsed_data(["items"])]))
+        stage.close()
+
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.staging_dir, "service_2022-08-01"))),
+            ["00000.json", "00001.json", "00002.json"],
+        )
+
+        # Merge the three files of the first partition in two batches
+        bulk_sink = MetadataUsageBulkSink.create(
+            {"filename": self.staging_dir, "max_open_files": 2}, METADATA_CONFIG
+        )
+        partitions = [
+            [
+                (usage.table, usage.date, usage.count, len(usage.joins))
+                for usage in table_usages
+            ]
+            for table_usages in bulk_sink.iterate_partitions()
+        ]
+
+        self.assertEqual(
+            partitions,
+            [
+                [
+                    ("customers", "2022-08-01", 1, 0),
+                    ("items", "2022-08-01", 1, 0),
+                    ("orders", "2022-08-01", 2, 2),
+                ],
+                [("orders", "2022-08-02", 1, 0)],
+            ],
+        )
@@ -0,0 +1,72 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Test the fetch of the dashboard details
+"""
+import random
+import threading
+import time
+from types import SimpleNamespace
+from unittest import TestCase
+
+from metadata.ingestion.source.dashboard.dashboard_service import DashboardServiceSource
+
+
+class FakeSource:
+    """
+    Dashboard details fetched with random latency
+    """
+
+    fetch_dashboard_details = DashboardServiceSource.fetch_dashboard_details
+
+    def __init__(self, thread_count: int):
+        self.source_config = SimpleNamespace(threadCount=thread_count)
+        self.threads = set()
+
+    def get_dashboard_details(self, dashboard: str) -> str:
+        self.threads.add(threading.get_ident())
+        time.sleep(random.random() / 100)
+        if dashboard == "bad":
+            raise ValueError(dashboard)
+        return f"{dashboard}_details"
+
+
+class DashboardServiceTest(TestCase):
+    """
+    Details are fetched concurrently and yielded in order
+    """
+
+    dashboards = [f"dashboard_{idx}" for idx in range(20)] + ["bad"]
+
+    def fetch(self, source: FakeSource):
+        details = []
+        for dashboard, get_details in source.fetch_dashboard_details(self.dashboards):
+            try:
+                details.append((dashboard, get_details()))
+            except ValueError:
+                details.append((dashboard, None))
+        return details
+
+    def test_sequential(self):
+        source = FakeSource(thread_count=1)
+        details = self.fetch(source)
+        self.assertEqual(details[0], ("dashboard_0", "dashboard_0_details"))
+        self.assertEqual(details[-1], ("bad", None))
+        self.assertEqual(source.threads, {threading.get_ident()})
+
+    def test_concurrent(self):
+        source = FakeSource(thread_count=4)
+        details = self.fetch(source)
+        self.assertEqual([dashboard for dashboard, _ in details], self.dashboards)
+        self.assertEqual(details[5], ("dashboard_5", "dashboard_5_details"))
+        self.assertEqual(details[-1], ("bad", None))
+        self.assertNotIn(threading.get_ident(), source.threads)
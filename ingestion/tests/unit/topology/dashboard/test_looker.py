@@ -0,0 +1,168 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the Looker API calls with a mocked SDK
+"""
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import MagicMock, call, patch
+
+import requests
+from looker_sdk.error import SDKError
+
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.ingestion.source.dashboard.looker import (
+    LookerRateLimitError,
+    LookerSource,
+    is_rate_limited,
+)
+
+CONFIG = {
+    "type": "looker",
+    "serviceName": "local_looker",
+    "serviceConnection": {
+        "config": {
+            "type": "Looker",
+            "clientId": "username",
+            "clientSecret": "password",
+            "hostPort": "http://hostPort",
+        }
+    },
+    "sourceConfig": {"config": {"type": "DashboardMetadata"}},
+}
+
+
+class StatusAdapter(requests.adapters.BaseAdapter):
+    """
+    Answer every request with the given status code
+    """
+
+    def __init__(self, status_code: int):
+        super().__init__()
+        self.status_code = status_code
+
+    def send(self, request, **_):  # pylint: disable=arguments-differ
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def element(model: str, view: str):
+    return SimpleNamespace(
+        query=SimpleNamespace(model=model, view=view), look=None, result_maker=None
+    )
+
+
+class LookerSourceTest(TestCase):
+    """
+    Explores are fetched once and rate limited calls are retried
+    """
+
+    @patch("metadata.ingestion.source.dashboard.dashboard_service.OpenMetadata")
+    @patch("metadata.ingestion.source.dashboard.dashboard_service.get_connection")
+    @patch.object(LookerSource, "test_connection")
+    def setUp(self, _, get_connection, __):
+        self.client = MagicMock()
+        self.client.transport.session = requests.Session()
+        get_connection.return_value = SimpleNamespace(client=self.client)
+        self.source = LookerSource.create(
+            CONFIG,
+            OpenMetadataConnection(hostPort="http://localhost:8585/api"),
+        )
+
+    def test_explores_fetched_once(self):
+        self.client.all_lookml_models.return_value = [
+            SimpleNamespace(
+                name="model",
+                explores=[
+                    SimpleNamespace(name="orders"),
+                    SimpleNamespace(name="users"),
+                ],
+            )
+        ]
+        self.client.lookml_model_explore.side_effect = (
+            lambda model, view, fields: SimpleNamespace(
+                sql_table_name=f"db.schema.{view} AS {view[0]}"
+            )
+        )
+        dashboards = [
+            SimpleNamespace(
+                dashboard_elements=[
+                    element("model", "orders"),
+                    element("model", "users"),
+                    element("model", "missing"),
+                ]
+            ),
+            SimpleNamespace(dashboard_elements=[element("model", "orders")]),
+        ]
+
+        sources = [
+            self.source.get_dashboard_sources(dashboard) for dashboard in dashboards
+        ]
+        self.assertEqual(sources[0], {"db.schema.orders", "db.schema.users"})
+        self.assertEqual(sources[1], {"db.schema.orders"})
+
+        self.client.all_lookml_models.assert_called_once()
+        # Explores missing from the models are not requested
+        self.assertEqual(
+            self.client.lookml_model_explore.call_args_list,
+            [
+                call("model", "orders", fields="sql_table_name"),
+                call("model", "users", fields="sql_table_name"),
+            ],
+        )
+
+    @patch("metadata.ingestion.source.dashboard.looker.time.sleep")
+    def test_rate_limit_retry(self, sleep):
+        method = MagicMock(
+            side_effect=[
+                LookerRateLimitError("Too Many Requests"),
+                LookerRateLimitError("Too Many Requests"),
+                "details",
+            ]
+        )
+        self.assertEqual(self.source._call(method, dashboard_id="1"), "details")
+        self.assertEqual(method.call_count, 3)
+        self.assertEqual(sleep.call_args_list, [call(5), call(10)])
+
+        # Other errors are not retried
+        sleep.reset_mock()
+        method = MagicMock(side_effect=SDKError("Not found: 429"))
+        with self.assertRaises(SDKError):
+            self.source._call(method)
+        method.assert_called_once()
+        sleep.assert_not_called()
+
+        # Nor once the retries are exhausted
+        method = MagicMock(side_effect=LookerRateLimitError("Too Many Requests"))
+        with self.assertRaises(LookerRateLimitError):
+            self.source._call(method)
+        self.assertEqual(method.call_count, 4)
+
+    def test_rate_limit_status(self):
+        session = self.client.transport.session
+        session.mount("http://looker/", StatusAdapter(429))
+        with self.assertRaises(LookerRateLimitError) as err:
+            session.get("http://looker/api/4.0/dashboards/1")
+        self.assertTrue(is_rate_limited(err.exception))
+
+        session.mount("http://looker/", StatusAdapter(404))
+        self.assertEqual(
+            session.get("http://looker/api/4.0/dashboards/1").status_code, 404
+        )
+        self.assertFalse(is_rate_limited(SDKError("Too Many Requests (429)")))
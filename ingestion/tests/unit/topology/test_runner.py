@@ -12,8 +12,13 @@
 """
 Check that we are properly running nodes and stages
 """
+import time
 from unittest import TestCase
+from unittest.mock import MagicMock
 
+from pydantic import BaseModel
+
+from metadata.generated.schema.type.basic import EntityName
 from metadata.ingestion.api.topology_runner import TopologyRunnerMixin
 from metadata.ingestion.models.topology import (
     NodeStage,
@@ -21,6 +26,7 @@ from metadata.ingestion.models.topology import (
     TopologyNode,
     create_source_context,
 )
+from metadata.ingestion.source.database.database_service import SQLSourceStatus
 
 
 class MockTopology(ServiceTopology):
@@ -72,6 +78,104 @@ class MockSource(TopologyRunnerMixin):
         yield my_str + str(self.context.numbers)
 
 
+class MockThreadedTopology(ServiceTopology):
+    root = TopologyNode(
+        producer="get_numbers",
+        stages=[
+            NodeStage(
+                type_=int,
+                context="numbers",
+                processor="yield_numbers",
+                ack_sink=False,
+            )
+        ],
+        children=["strings"],
+    )
+    strings = TopologyNode(
+        producer="get_strings",
+        stages=[
+            NodeStage(
+                type_=str,
+                context="strings",
+                processor="yield_strings",
+                ack_sink=False,
+                consumer=["numbers"],
+            )
+        ],
+        threads=True,
+    )
+
+
+class MockThreadedSource(MockSource):
+    topology = MockThreadedTopology()
+    context = create_source_context(topology)
+    max_workers = 4
+
+    @staticmethod
+    def get_strings():
+        for my_str in ("abc", "def", "ghi", "jkl", "mno"):
+            yield my_str
+
+    def yield_strings(self, my_str: str):
+        # Make the first element the slowest one to check the ordering
+        time.sleep(0.05 if my_str == "abc" else 0)
+        yield my_str + str(self.context.numbers)
+
+
+class MockSharedStateSource(MockThreadedSource):
+    """
+    Workers update the source status and a list shared through the context
+    """
+
+    context = create_source_context(MockThreadedTopology())
+
+    def __init__(self):
+        self.status = SQLSourceStatus(success=[])
+        self.scanned_count = 0
+        self.context.views = []
+
+    def yield_strings(self, my_str: str):
+        with self.topology_lock:
+            scanned_count = self.scanned_count
+            time.sleep(0.001)
+            self.scanned_count = scanned_count + 1
+            self.status.success.append(my_str)
+            self.context.views.append(my_str)
+        yield my_str
+
+
+class MockEntity(BaseModel):
+    name: EntityName
+    id: int = None
+
+
+class MockAckTopology(ServiceTopology):
+    root = TopologyNode(
+        producer="get_names",
+        stages=[
+            NodeStage(
+                type_=MockEntity,
+                context="entity",
+                processor="yield_entity",
+            )
+        ],
+    )
+
+
+class MockAckSource(TopologyRunnerMixin):
+    topology = MockAckTopology()
+    context = create_source_context(topology)
+    metadata = MagicMock()
+
+    @staticmethod
+    def get_names():
+        yield "abc"
+
+    @staticmethod
+    def yield_entity(name: str):
+        yield MockEntity(name=name)
+
+
 class TopologyRunnerTest(TestCase):
     """
     Validate filter patterns
@@ -81,3 +185,49 @@ class TopologyRunnerTest(TestCase):
         source = MockSource()
         processed = list(source.next_record())
         assert processed == [2, "abc2", "def2", 3, "abc3", "def3"]
+
+    def test_threaded_node_keeps_order(self):
+        source = MockThreadedSource()
+        processed = list(source.next_record())
+        assert processed == [
+            2,
+            "abc2",
+            "def2",
+            "ghi2",
+            "jkl2",
+            "mno2",
+            3,
+            "abc3",
+            "def3",
+            "ghi3",
+            "jkl3",
+            "mno3",
+        ]
+
+    def test_threaded_shared_state(self):
+        """
+        Workers update the shared state under the topology lock
+        """
+        source = MockSharedStateSource()
+        processed = list(source.next_record())
+
+        self.assertEqual(len(processed), 12)
+        self.assertEqual(source.scanned_count, 10)
+        self.assertEqual(len(source.status.success), 10)
+        self.assertEqual(len(source.context.views), 10)
+
+    def test_acknowledged_request(self):
+        """
+        The entity acknowledged by the sink is used without reading it back
+        """
+        source = MockAckSource()
+        records = source.next_record()
+
+        request = next(records)
+        self.assertEqual(request, MockEntity(name="abc"))
+        self.assertRaises(
+            StopIteration, records.send, lambda: MockEntity(name="abc", id=1)
+        )
+
+        self.assertEqual(source.context.entity, MockEntity(name="abc", id=1))
+        source.metadata.get_by_name.assert_not_called()